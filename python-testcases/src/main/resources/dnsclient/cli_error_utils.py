@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Helpers to match expected LITP CLI error messages
+            against the stderr of a CLI command
+'''
+
+
+class CliErrorIndex(object):
+    """
+    Index of the error messages in the stderr of a LITP CLI command.
+
+    LITP reports an error either as a bare message line or as an item
+    path line followed by the message line. The index is built once per
+    stderr so that every expected result is looked up in constant time.
+    """
+
+    def __init__(self, err_list):
+        """
+        Args:
+            err_list (list): The stderr lines of the CLI command
+        """
+        self.err_list = err_list
+        self.messages = set(err_list)
+        self.path_messages = set(zip(err_list, err_list[1:]))
+
+    def contains(self, result):
+        """
+        Description:
+            Checks whether an expected error is in the stderr
+        Args:
+            result (dict): The expected error, with a "msg" and an
+                           optional "path" key
+        Results:
+            True if the error is found, otherwise False
+        """
+        if result.get('path') is not None:
+            return (result['path'], result['msg']) in self.path_messages
+        return result['msg'] in self.messages
+
+    def get_mismatches(self, results):
+        """
+        Description:
+            Checks a list of expected results against the stderr
+        Args:
+            results (list): The expected errors. A result with
+                            "ensure_not_found" set to True must not be
+                            in the stderr, any other result must be.
+        Results:
+            A tuple of the results not found and the results found
+            which were expected to be absent
+        """
+        missing = []
+        unexpected = []
+        for result in results:
+            found = self.contains(result)
+            if result.get('ensure_not_found') is True:
+                if found:
+                    unexpected.append(result)
+            elif not found:
+                missing.append(result)
+        return missing, unexpected
+
+
+def format_mismatches(missing, unexpected):
+    """
+    Description:
+        Formats the results returned by CliErrorIndex.get_mismatches
+    Args:
+        missing (list): The expected errors not found
+        unexpected (list): The errors found which were expected
+                           to be absent
+    Results:
+        The report, empty if there are no mismatches
+    """
+    report = ''
+    if missing:
+        report += '\nExpected error messages NOT found:\n{0}'.format(
+            '\n'.join(format_result(result) for result in missing))
+    if unexpected:
+        report += '\nExtra error messages found:\n{0}'.format(
+            '\n'.join(format_result(result) for result in unexpected))
+    return report
+
+
+def format_result(result):
+    """
+    Description:
+        Formats an expected error the way LITP prints it
+    Args:
+        result (dict): The expected error
+    Results:
+        The path (if any) and message, one per line
+    """
+    if result.get('path') is not None:
+        return '{0}\n{1}'.format(result['path'], result['msg'])
+    return result['msg']
@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Local checks of dns-client and nameserver items, with the
+            error messages of "litp create" and "litp create_plan", so
+            that models can be screened before any MS round trip
+'''
+
+import re
+import socket
+import xml.etree.ElementTree as ET
+
+from dns_model_builder import parse_props
+
+LITP_NS = "{http://www.ericsson.com/litp}"
+
+MAX_NAMESERVERS = 3
+MAX_SEARCH_DOMAINS = 6
+MAX_SEARCH_LENGTH = 256
+NAMESERVER_POSITIONS = ("1", "2", "3")
+
+ITEM_PROPERTIES = {
+    'dns-client': {'search': False},
+    'nameserver': {'ipaddress': True, 'position': True},
+}
+
+IPV4_ADDRESS = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+
+
+def is_valid_ipv4(value):
+    """
+    Description:
+        Checks for an IPv4 address in dot notation
+    """
+    if not IPV4_ADDRESS.match(value):
+        return False
+    return all(int(part) <= 255 for part in value.split("."))
+
+
+def is_valid_ipv6(value):
+    """
+    Description:
+        Checks for an IPv6 address with an optional CIDR prefix
+    """
+    address, _, prefix = value.partition("/")
+    if "/" in value and (not prefix.isdigit() or int(prefix) > 128):
+        return False
+    try:
+        socket.inet_pton(socket.AF_INET6, address)
+    except (socket.error, ValueError):
+        return False
+    return True
+
+
+def validate_property(item_type, name, value):
+    """
+    Description:
+        Validates a single dns-client or nameserver property
+    Args:
+        item_type (str): The item type
+        name (str): The property name
+        value (str): The property value
+    Results:
+        The LITP error message, or None if the value is valid
+    """
+    prefix = 'ValidationError in property: "{0}"    '.format(name)
+    if name not in ITEM_PROPERTIES[item_type]:
+        return ('PropertyNotAllowedError in property: "{0}"    "{0}" is '
+                'not an allowed property of {1}'.format(name, item_type))
+    if name == 'position' and value not in NAMESERVER_POSITIONS:
+        return prefix + "Invalid value '{0}'.".format(value)
+    if name == 'ipaddress' and not (is_valid_ipv4(value) or
+                                    is_valid_ipv6(value)):
+        return prefix + "Invalid IP address value '{0}'".format(value)
+    if name == 'search':
+        if len(value) > MAX_SEARCH_LENGTH:
+            return prefix + ('Length of property cannot be more than '
+                             '{0} characters'.format(MAX_SEARCH_LENGTH))
+        if len(value.split(",")) > MAX_SEARCH_DOMAINS:
+            return prefix + ('A maximum of {0} domains per search may be '
+                             'specified'.format(MAX_SEARCH_DOMAINS))
+    return None
+
+
+def validate_properties(item_type, props, check_required=True):
+    """
+    Description:
+        Validates the properties of a dns-client or nameserver
+    Args:
+        item_type (str): The item type
+        props (dict): The properties
+        check_required (bool): Whether missing required properties
+                               are reported
+    Results:
+        list of LITP error messages
+    """
+    errors = []
+    if check_required:
+        for name, required in sorted(ITEM_PROPERTIES[item_type].items()):
+            if required and name not in props:
+                errors.append(
+                    'MissingRequiredPropertyError in property: "{0}"    '
+                    'ItemType "{1}" is required to have a property with '
+                    'name "{0}"'.format(name, item_type))
+    for name, value in sorted(props.items()):
+        error = validate_property(item_type, name, value)
+        if error:
+            errors.append(error)
+    return errors
+
+
+def validate_nameservers(collection_path, nameservers):
+    """
+    Description:
+        Validates the nameservers collection of a dns-client the way
+        create_plan does
+    Args:
+        collection_path (str): The path of the nameservers collection
+        nameservers (list): (path, properties) of each nameserver not
+                            marked for removal
+    Results:
+        list of (path, message) errors
+    """
+    errors = []
+    cardinality = ('CardinalityError    Create plan failed: This '
+                   'collection requires a {0} of {1} items not marked '
+                   'for removal')
+    if not nameservers:
+        errors.append((collection_path, cardinality.format('minimum', 1)))
+    elif len(nameservers) > MAX_NAMESERVERS:
+        errors.append((collection_path, cardinality.format(
+            'maximum', MAX_NAMESERVERS)))
+    positions = {}
+    for path, props in nameservers:
+        positions.setdefault(props.get('position'), []).append(path)
+    for position, duplicates in sorted(positions.items()):
+        if len(duplicates) > 1:
+            for path in duplicates:
+                errors.append((path, 'ValidationError    Create plan '
+                               'failed: Duplicate nameserver position '
+                               '"{0}"'.format(position)))
+    return errors
+
+
+def validate_dns_clients(dns_client_paths):
+    """
+    Description:
+        Checks that a node has at most one dns-client
+    Args:
+        dns_client_paths (list): The dns-clients of a node not marked
+                                 for removal
+    Results:
+        list of (path, message) errors
+    """
+    if len(dns_client_paths) < 2:
+        return []
+    return [(path, 'ValidationError    Create plan failed: Only one '
+             '"dns-client" may be configured per node')
+            for path in dns_client_paths]
+
+
+class DnsClientLinter(object):
+    """
+    Collects dns-client and nameserver items, from the property strings
+    passed to "litp create" or from dns-client XML, and reports the
+    errors LITP would report for them.
+
+    The items are only checked against each other and against the
+    dns-clients already in the model which are added with
+    add_model_dns_client.
+    """
+
+    def __init__(self):
+        self._errors = []
+        self._clients = {}
+        self._order = []
+        self._model_clients = []
+
+    def add_dns_client(self, path, props=None):
+        """
+        Description:
+            Adds a dns-client
+        Args:
+            path (str): The dns-client path
+            props (str|dict): The properties, in CLI format or parsed
+        """
+        if not isinstance(props, dict):
+            props = parse_props(props)
+        self._add_errors(path, validate_properties('dns-client', props))
+        if path not in self._clients:
+            self._order.append(path)
+            self._clients[path] = []
+
+    def add_model_dns_client(self, path):
+        """
+        Description:
+            Adds a dns-client already in the model and not marked for
+            removal. It only counts towards the one dns-client per node
+            rule, its properties and nameservers are not checked.
+        Args:
+            path (str): The dns-client path
+        """
+        if path not in self._model_clients:
+            self._model_clients.append(path)
+
+    def add_nameserver(self, path, props):
+        """
+        Description:
+            Adds a nameserver, below a dns-client added before
+        Args:
+            path (str): The nameserver path,
+                        ".../<dns-client>/nameservers/<id>"
+            props (str|dict): The properties, in CLI format or parsed
+        """
+        if not isinstance(props, dict):
+            props = parse_props(props)
+        self._add_errors(path, validate_properties('nameserver', props))
+        dns_path = path.rsplit("/", 2)[0]
+        if dns_path not in self._clients:
+            self._add_errors(dns_path, ['InvalidLocationError    Not found'])
+            return
+        self._clients[dns_path].append((path, props))
+
+    def add_xml(self, parent_path, xml_string):
+        """
+        Description:
+            Adds the dns-clients of an XML document, as exported by
+            "litp export": a dns-client, or a config collection of
+            dns-clients
+        Args:
+            parent_path (str): The path the XML is loaded into, the
+                               config collection of a dns-client or the
+                               node of a config collection
+            xml_string (str): The XML document
+        """
+        root = ET.fromstring(xml_string.encode("utf-8"))
+        if root.tag == LITP_NS + 'dns-client':
+            self._add_dns_client_element(parent_path, root)
+        elif root.tag == LITP_NS + 'node-configs-collection':
+            config_path = "{0}/{1}".format(parent_path, root.get("id"))
+            for dns_client in root.findall(LITP_NS + 'dns-client'):
+                self._add_dns_client_element(config_path, dns_client)
+        else:
+            raise ValueError("Not a dns-client document: {0}".format(
+                root.tag))
+
+    def _add_dns_client_element(self, parent_path, element):
+        """
+        Description:
+            Adds the dns-client of an XML element and its nameservers
+        """
+        dns_path = "{0}/{1}".format(parent_path, element.get("id"))
+        self.add_dns_client(dns_path, self._get_properties(element))
+        for collection in element.findall(
+                LITP_NS + 'dns-client-nameservers-collection'):
+            for nameserver in collection.findall(LITP_NS + 'nameserver'):
+                self.add_nameserver(
+                    "{0}/nameservers/{1}".format(
+                        dns_path, nameserver.get("id")),
+                    self._get_properties(nameserver))
+
+    def add_xml_file(self, parent_path, filepath):
+        """
+        Description:
+            Adds the dns-client of an XML file
+        Args:
+            parent_path (str): The config collection the XML is loaded
+                               into
+            filepath (str): The XML file
+        """
+        with open(filepath) as xml_file:
+            self.add_xml(parent_path, xml_file.read())
+
+    @staticmethod
+    def _get_properties(element):
+        """
+        Description:
+            Returns the properties of an XML item element
+        """
+        return dict((child.tag, (child.text or "").strip())
+                    for child in element if LITP_NS not in child.tag)
+
+    def _add_errors(self, path, messages):
+        """
+        Description:
+            Records property errors against an item
+        """
+        self._errors.extend((path, message) for message in messages)
+
+    def lint(self):
+        """
+        Description:
+            Checks all the items added
+        Results:
+            list of (path, message) errors: the property errors of
+            "litp create" followed by the errors of "litp create_plan"
+        """
+        errors = list(self._errors)
+        nodes = {}
+        for dns_path in self._order:
+            nodes.setdefault(dns_path.rsplit("/", 1)[0], []).append(dns_path)
+        for config_path in sorted(nodes):
+            dns_paths = nodes[config_path]
+            errors.extend(validate_dns_clients(dns_paths + [
+                path for path in self._model_clients
+                if path.rsplit("/", 1)[0] == config_path and
+                path not in dns_paths]))
+            for dns_path in dns_paths:
+                errors.extend(validate_nameservers(
+                    dns_path + "/nameservers", self._clients[dns_path]))
+        return errors
+
+    def get_stderr(self):
+        """
+        Description:
+            Returns the errors in the format of the stderr of "litp
+            create" and "litp create_plan": an item path line followed
+            by a message line, as CliErrorIndex expects
+        """
+        stderr = []
+        for path, message in self.lint():
+            stderr.extend([path, message])
+        return stderr
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Builds dns-client/nameserver model trees in memory and
+            renders them as LITP XML so that the whole tree can be
+            applied with "litp load" instead of one "litp create" per item
+'''
+
+import shlex
+from xml.sax.saxutils import escape
+
+from expected_resolv_conf import render_resolv_conf
+
+XML_HEADER = "<?xml version='1.0' encoding='utf-8'?>"
+DNS_CLIENT_OPEN = (
+    '<litp:dns-client '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xmlns:litp="http://www.ericsson.com/litp" '
+    'xsi:schemaLocation="http://www.ericsson.com/litp '
+    'litp-xml-schema/litp.xsd" id="{0}">')
+NAMESERVER_PROPERTIES = ("ipaddress", "position")
+
+
+def parse_props(props):
+    """
+    Description:
+        Parses a CLI property string such as
+        'ipaddress="10.10.10.101" position="1"' into a dictionary
+    Args:
+        props (str): The property string passed to "litp create"
+    Results:
+        dict of property name to value
+    """
+    if not props:
+        return {}
+    parsed = {}
+    for pair in shlex.split(props):
+        name, _, value = pair.partition("=")
+        parsed[name] = value
+    return parsed
+
+
+class DnsModelBuilder(object):
+    """
+    Collects the dns-client and nameserver items a test intends to
+    create and renders one XML document per config collection. A node
+    may only have one dns-client, so each collection holds at most one.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._order = []
+
+    def add_dns_client(self, config_path, dns_name, **kwargs):
+        """
+        Description:
+            Adds a dns-client to the tree
+        Args:
+            config_path (str): The config collection path
+            dns_name (str): The dns-client name
+            kwargs: The dns-client properties (e.g. search)
+        Results:
+            The path the dns-client will have in the model
+        """
+        if config_path in self._clients:
+            raise ValueError("A dns-client is already defined under "
+                             "{0}".format(config_path))
+        self._order.append(config_path)
+        self._clients[config_path] = {
+            'id': dns_name, 'props': kwargs, 'nameservers': []}
+        return config_path + "/{0}".format(dns_name)
+
+    def add_nameserver(self, dns_path, nameserver_name, props):
+        """
+        Description:
+            Adds a nameserver to a dns-client already in the tree
+        Args:
+            dns_path (str): The dns-client path
+            nameserver_name (str): The nameserver name
+            props (str): The nameserver properties, in CLI format
+        Results:
+            The path the nameserver will have in the model
+        """
+        client = self._get_dns_client(dns_path)
+        client['nameservers'].append((nameserver_name, parse_props(props)))
+        return dns_path + "/nameservers/{0}".format(nameserver_name)
+
+    def _get_dns_client(self, dns_path):
+        """
+        Description:
+            Finds a dns-client previously added to the tree
+        Args:
+            dns_path (str): The dns-client path
+        Results:
+            The dns-client entry
+        """
+        config_path, _, dns_name = dns_path.rpartition("/")
+        client = self._clients.get(config_path)
+        if client is not None and client['id'] == dns_name:
+            return client
+        raise KeyError("dns-client {0} not defined".format(dns_path))
+
+    def defines(self, path):
+        """
+        Description:
+            Checks whether a dns-client or nameserver is in the tree
+        Args:
+            path (str): The item path
+        """
+        dns_path, _, nameserver_name = path.rpartition("/nameservers/")
+        try:
+            client = self._get_dns_client(dns_path or path)
+        except KeyError:
+            return False
+        return not dns_path or nameserver_name in dict(client['nameservers'])
+
+    def update_dns_client(self, dns_path, **kwargs):
+        """
+        Description:
+            Sets properties of a dns-client in the tree
+        Args:
+            dns_path (str): The dns-client path
+            kwargs: The dns-client properties
+        """
+        self._get_dns_client(dns_path)['props'].update(kwargs)
+
+    def remove_dns_client_property(self, dns_path, name):
+        """
+        Description:
+            Removes a property of a dns-client in the tree
+        Args:
+            dns_path (str): The dns-client path
+            name (str): The property name
+        """
+        self._get_dns_client(dns_path)['props'].pop(name, None)
+
+    def update_nameserver(self, nameserver_path, props):
+        """
+        Description:
+            Sets properties of a nameserver in the tree
+        Args:
+            nameserver_path (str): The nameserver path
+            props (str): The nameserver properties, in CLI format
+        """
+        dns_path, _, name = nameserver_path.rpartition("/nameservers/")
+        dict(self._get_dns_client(dns_path)['nameservers'])[name].update(
+            parse_props(props))
+
+    def remove(self, path):
+        """
+        Description:
+            Removes a dns-client or nameserver from the tree
+        Args:
+            path (str): The item path
+        """
+        dns_path, _, name = path.rpartition("/nameservers/")
+        if dns_path:
+            client = self._get_dns_client(dns_path)
+            client['nameservers'] = [nameserver for nameserver in
+                                     client['nameservers']
+                                     if nameserver[0] != name]
+        else:
+            config_path = path.rpartition("/")[0]
+            self._get_dns_client(path)
+            del self._clients[config_path]
+            self._order.remove(config_path)
+
+    def render_resolv_conf(self, config_path):
+        """
+        Description:
+            Renders the resolv.conf expected once the dns-client of a
+            config collection is applied
+        Args:
+            config_path (str): The config collection path
+        Results:
+            The lines of the file
+        """
+        client = self._clients[config_path]
+        return render_resolv_conf(
+            client['props'].get('search'),
+            [(props['position'], props['ipaddress'])
+             for _, props in client['nameservers']])
+
+    def get_config_paths(self):
+        """
+        Description:
+            Returns the config collections in the order they were used
+        """
+        return list(self._order)
+
+    def get_dns_client_path(self, config_path):
+        """
+        Description:
+            Returns the path of the dns-client of a config collection
+        Args:
+            config_path (str): The config collection path
+        """
+        return "{0}/{1}".format(config_path, self._clients[config_path]['id'])
+
+    def render(self, config_path):
+        """
+        Description:
+            Renders the XML document for one config collection
+        Args:
+            config_path (str): The config collection path
+        Results:
+            The XML document as a string
+        """
+        lines = [XML_HEADER]
+        lines.extend(self._render_dns_client(self._clients[config_path]))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_dns_client(client):
+        """
+        Description:
+            Renders a single dns-client element
+        Args:
+            client (dict): The dns-client entry
+        Results:
+            list of XML lines
+        """
+        lines = [DNS_CLIENT_OPEN.format(escape(client['id']))]
+        for name, value in sorted(client['props'].items()):
+            lines.append("  <{0}>{1}</{0}>".format(name, escape(value)))
+        lines.append('  <litp:dns-client-nameservers-collection '
+                     'id="nameservers">')
+        for name, props in client['nameservers']:
+            lines.append('    <litp:nameserver id="{0}">'.format(
+                escape(name)))
+            for prop in NAMESERVER_PROPERTIES:
+                if prop in props:
+                    lines.append("      <{0}>{1}</{0}>".format(
+                        prop, escape(props[prop])))
+            lines.append('    </litp:nameserver>')
+        lines.append('  </litp:dns-client-nameservers-collection>')
+        lines.append('</litp:dns-client>')
+        return lines
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Shell command builders used by the dnsclient testsets
+'''
+
+import os
+try:
+    from pipes import quote
+except ImportError:
+    from shlex import quote
+
+LITP_CMD = "/usr/bin/litp"
+PYTHON_CMD = "/usr/bin/python"
+MCO_CMD = "/usr/bin/mco"
+INOTIFYWAIT_CMD = "/usr/bin/inotifywait"
+PLAN_TERMINAL_STATUSES = ("Successful", "Failed", "Stopped", "Invalid")
+# Exit code of the watch commands when the timeout expires
+WATCH_TIMEOUT_RC = 2
+
+
+class DnsClientCmdUtils(object):
+    """
+    Builds the shell commands the dnsclient testsets run on the MS and
+    the managed nodes.
+    """
+
+    @staticmethod
+    def get_wait_for_plan_state_cmd(plan_status, timeout_secs=600):
+        """
+        Description:
+            Returns a command which polls "litp show_plan" in a single
+            session and returns as soon as the expected state is reached.
+            It polls every 100ms at first and backs off to once a second
+            while the plan keeps running.
+        Args:
+            plan_status (str): The "Plan Status" to wait for,
+                               e.g. "Successful"
+            timeout_secs (int): How long to wait before giving up
+        Results:
+            The command. It exits with 0 when the plan reaches the
+            expected state, 1 when the plan ends in any other state
+            (the state is printed) and 2 on timeout.
+        """
+        return (
+            'delay=0.1; end=$((SECONDS+{timeout})); '
+            'while [ $SECONDS -lt $end ]; do '
+            'status=$({litp} show_plan 2>/dev/null | '
+            'sed -n "s/^Plan Status: //p"); '
+            'if [ "$status" = "{expected}" ]; then exit 0; fi; '
+            'case "$status" in {terminal}) echo "$status"; exit 1;; esac; '
+            'sleep $delay; '
+            'case $delay in 0.1) delay=0.2;; 0.2) delay=0.5;; '
+            '*) delay=1;; esac; '
+            'done; exit 2'.format(
+                timeout=int(timeout_secs), litp=LITP_CMD,
+                expected=plan_status,
+                terminal="|".join(PLAN_TERMINAL_STATUSES)))
+
+    @staticmethod
+    def get_trigger_puppet_run_cmd(hostname):
+        """
+        Description:
+            Returns a command, run on the MS, which triggers a puppet
+            agent run on a node straight away instead of waiting for the
+            next scheduled run
+        Args:
+            hostname (str): The hostname of the node
+        """
+        return "{mco} puppet runonce -I {hostname}".format(
+            mco=MCO_CMD, hostname=hostname)
+
+    @staticmethod
+    def get_wait_for_line_removed_cmd(filepath, pattern, timeout_secs=600):
+        """
+        Description:
+            Returns a command, run on the node, which watches a file and
+            returns as soon as no line matches the pattern any more.
+            Between checks it blocks on inotify events for the file's
+            directory (puppet replaces the file rather than editing it)
+            and falls back to polling when inotifywait is not installed.
+        Args:
+            filepath (str): The file to watch
+            pattern (str): The grep pattern which must disappear
+            timeout_secs (int): How long to wait before giving up
+        Results:
+            The command. It exits with 0 once the pattern is gone and
+            2 on timeout.
+        """
+        return (
+            'end=$((SECONDS+{timeout})); '
+            'while [ $SECONDS -lt $end ]; do '
+            '/bin/grep -q "{pattern}" {filepath} || exit 0; '
+            'if [ -x {inotifywait} ]; then '
+            '{inotifywait} -qq -t 1 -e close_write,moved_to,create '
+            '{directory} >/dev/null 2>&1; '
+            'else sleep 0.2; fi; '
+            'done; exit 2'.format(
+                timeout=int(timeout_secs), pattern=pattern,
+                filepath=filepath, inotifywait=INOTIFYWAIT_CMD,
+                directory=os.path.dirname(filepath) or "."))
+
+    @staticmethod
+    def get_remove_files_cmd(filepaths):
+        """
+        Description:
+            Returns a command which removes files, ignoring missing ones
+        Args:
+            filepaths (list): The files
+        """
+        return "/bin/rm -f {0}".format(
+            " ".join(quote(filepath) for filepath in filepaths))
+
+    @staticmethod
+    def get_make_dir_cmd(directory):
+        """
+        Description:
+            Returns a command which creates a directory
+        Args:
+            directory (str): The directory
+        """
+        return "/bin/mkdir -p {0}".format(quote(directory))
+
+    @staticmethod
+    def get_remove_dir_cmd(directory):
+        """
+        Description:
+            Returns a command which removes a directory and its files,
+            ignoring a missing directory
+        Args:
+            directory (str): The directory
+        """
+        return "/bin/rm -rf {0}".format(quote(directory))
+
+    @staticmethod
+    def get_model_validator_cmd(script_path, request_path):
+        """
+        Description:
+            Returns a command which runs model_validator.py on a request
+            file, see model_validator.main
+        Args:
+            script_path (str): model_validator.py
+            request_path (str): The request file
+        """
+        return "{0} {1} {2}".format(PYTHON_CMD, quote(script_path),
+                                    quote(request_path))
+
+    @staticmethod
+    def get_load_cmd(path, filepath, mode="--merge"):
+        """
+        Description:
+            Returns a "litp load" command
+        Args:
+            path (str): The path to load into
+            filepath (str): The XML file
+            mode (str): "--merge" or "--replace"
+        """
+        return "{0} load -p {1} -f {2} {3}".format(
+            LITP_CMD, quote(path), quote(filepath), mode)
+
+    @staticmethod
+    def get_export_cmd(path, filepath):
+        """
+        Description:
+            Returns a "litp export" command
+        Args:
+            path (str): The item to export
+            filepath (str): The XML file
+        """
+        return "{0} export -p {1} -f {2}".format(
+            LITP_CMD, quote(path), quote(filepath))
+
+    @staticmethod
+    def get_xml_size_cmd(filepath):
+        """
+        Description:
+            Returns a command which prints the size of an XML file in
+            bytes, then the number of LITP elements in the file
+        Args:
+            filepath (str): The XML file
+        """
+        return ("/usr/bin/stat -c %s {0} && "
+                "/bin/grep -o '<litp:' {0} | /usr/bin/wc -l".format(
+                    quote(filepath)))
+
+    @staticmethod
+    def get_remove_items_cmd(paths):
+        """
+        Description:
+            Returns a command which removes model items with "litp
+            remove", one after the other
+        Args:
+            paths (list): The paths of the items
+        """
+        return " && ".join("{0} remove -p {1}".format(LITP_CMD, quote(path))
+                           for path in paths)
+
+    @staticmethod
+    def get_timed_cmd(cmd):
+        """
+        Description:
+            Returns a command which runs a command and times it on the
+            host it runs on, so that the time excludes the SSH round trip
+        Args:
+            cmd (str): The command to time
+        Results:
+            The command. It prints the output of the timed command
+            followed by an "elapsed_ns:<nanoseconds>" line and an
+            "rc:<exit code>" line, see load_throughput.parse_timed_output
+        """
+        return ("start=$(/bin/date +%s%N); {0}; rc=$?; "
+                "end=$(/bin/date +%s%N); "
+                "echo \"elapsed_ns:$((end - start))\"; "
+                "echo \"rc:$rc\"".format(cmd))
+
+    @staticmethod
+    def get_checksum_cmd(filepath):
+        """
+        Description:
+            Returns a command which prints the sha256 checksum of a file
+        Args:
+            filepath (str): The file
+        """
+        return "/usr/bin/sha256sum {0}".format(quote(filepath))
+
+    @staticmethod
+    def get_resolv_conf_probe_cmd(filepath):
+        """
+        Description:
+            Returns a command which reports the sha256 checksum and the
+            records of a resolv.conf file in one exchange, see
+            resolv_conf_probe.ResolvConf
+        Args:
+            filepath (str): The resolv.conf file
+        Results:
+            The command. It prints a "sha256<TAB>checksum" line followed
+            by one "type<TAB>value" line per line of the file, where the
+            type is "search", "nameserver" or "line" for any other line.
+        """
+        return (
+            "/usr/bin/sha256sum {0} | /bin/awk '{{print \"sha256\\t\" $1}}' "
+            "&& /bin/awk '{{type = \"line\"; value = $0; "
+            "if ($1 == \"search\" || $1 == \"nameserver\") {{ type = $1; "
+            "value = $2; for (i = 3; i <= NF; i++) value = value \" \" $i }} "
+            "print type \"\\t\" value}}' {0}".format(quote(filepath)))
+
+    @staticmethod
+    def get_show_subtrees_cmd(paths):
+        """
+        Description:
+            Returns a command which shows several model subtrees with
+            "litp show -r", one after the other
+        Args:
+            paths (list): The paths of the subtrees
+        """
+        return " && ".join("{0} show -r -p {1}".format(LITP_CMD, quote(path))
+                           for path in paths)
+
+    @staticmethod
+    def get_checksums_cmd(directory, filenames):
+        """
+        Description:
+            Returns a command which prints the sha256 checksum of the
+            files of a directory that exist, as "<checksum>  <filename>"
+        Args:
+            directory (str): The directory
+            filenames (list): The files
+        """
+        return "cd {0} && /usr/bin/sha256sum {1} 2>/dev/null; true".format(
+            quote(directory), " ".join(quote(name) for name in filenames))
+
+    @staticmethod
+    def get_unpack_archive_cmd(archive_path, directory, filenames):
+        """
+        Description:
+            Returns a command which unpacks a gzip compressed tar archive
+            into a directory, removes the archive and prints the sha256
+            checksum of the unpacked files
+        Args:
+            archive_path (str): The archive
+            directory (str): The directory to unpack into
+            filenames (list): The files in the archive
+        """
+        return ("/bin/tar -xzf {0} -C {1} && /bin/rm -f {0} && cd {1} && "
+                "/usr/bin/sha256sum {2}".format(
+                    quote(archive_path), quote(directory),
+                    " ".join(quote(name) for name in filenames)))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Renders the resolv.conf the dnsclient plugin is expected to
+            write for a dns-client, and compares it with the actual file
+'''
+
+import difflib
+
+
+def render_resolv_conf(search, nameservers):
+    """
+    Description:
+        Renders resolv.conf the way the dnsclient puppet module does:
+        the search domains on one line, then the nameservers ordered by
+        position with any IPv6 CIDR prefix stripped
+    Args:
+        search (str): The comma separated search domains, or None
+        nameservers (list): (position, ipaddress) pairs
+    Results:
+        The lines of the file
+    """
+    lines = []
+    if search:
+        lines.append("search {0}".format(" ".join(search.split(","))))
+    for _, ipaddress in sorted(nameservers, key=lambda ns: int(ns[0])):
+        lines.append("nameserver {0}".format(ipaddress.split("/")[0]))
+    return lines
+
+
+def diff_resolv_conf(expected, actual):
+    """
+    Description:
+        Compares the expected and actual lines of a resolv.conf file
+    Args:
+        expected (list): The expected lines
+        actual (list): The actual lines
+    Results:
+        A diff of every mismatching line, empty if the files match
+    """
+    if list(expected) == list(actual):
+        return ''
+    return '\n'.join(difflib.unified_diff(
+        list(expected), list(actual), 'expected', 'actual', lineterm=''))
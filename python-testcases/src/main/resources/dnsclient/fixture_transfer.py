@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Local side of the bulk copy of XML fixtures to the MS: the
+            fixtures are compared by checksum with the copies already on
+            the MS and the changed ones packed into a single archive
+'''
+
+import hashlib
+import os
+import tarfile
+
+XML_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "xml_files")
+
+
+def list_fixtures(directory=XML_FILES_DIR):
+    """
+    Description:
+        Returns the XML files of a fixture directory
+    Args:
+        directory (str): The directory
+    Results:
+        list of filenames, sorted
+    """
+    return sorted(filename for filename in os.listdir(directory)
+                  if filename.endswith(".xml"))
+
+
+def get_checksum(filepath):
+    """
+    Description:
+        Returns the sha256 checksum of a local file
+    Args:
+        filepath (str): The file
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as fixture:
+        for block in iter(lambda: fixture.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_checksums(std_out):
+    """
+    Description:
+        Parses the output of sha256sum
+    Args:
+        std_out (list): The stdout lines, "<checksum>  <filename>"
+    Results:
+        dict of filename to checksum
+    """
+    checksums = {}
+    for line in std_out:
+        parts = line.split(None, 1)
+        if len(parts) == 2:
+            checksums[parts[1].lstrip("*")] = parts[0]
+    return checksums
+
+
+def get_changed_fixtures(directory, filenames, remote_checksums):
+    """
+    Description:
+        Finds the fixtures whose copy on the MS is missing or different
+    Args:
+        directory (str): The local fixture directory
+        filenames (list): The fixtures
+        remote_checksums (dict): The checksums of the copies on the MS,
+                                 by filename
+    Results:
+        dict of filename to local checksum, for the changed fixtures
+    """
+    changed = {}
+    for filename in filenames:
+        checksum = get_checksum(os.path.join(directory, filename))
+        if remote_checksums.get(filename) != checksum:
+            changed[filename] = checksum
+    return changed
+
+
+def pack_fixtures(directory, filenames, archive_path):
+    """
+    Description:
+        Packs fixtures into a gzip compressed tar archive, flat, so that
+        they unpack straight into the target directory
+    Args:
+        directory (str): The local fixture directory
+        filenames (list): The fixtures to pack
+        archive_path (str): The archive to write
+    """
+    archive = tarfile.open(archive_path, "w:gz")
+    try:
+        for filename in sorted(filenames):
+            archive.add(os.path.join(directory, filename), arcname=filename)
+    finally:
+        archive.close()
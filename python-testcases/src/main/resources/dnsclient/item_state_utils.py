@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Helpers to read the item states from the output of
+            "litp show -r"
+'''
+
+
+def parse_item_states(show_lines):
+    """
+    Description:
+        Finds the state of every item in the output of "litp show -r"
+    Args:
+        show_lines (list): The stdout lines of one or more
+                           "litp show -r" commands
+    Results:
+        dict of item path to state, e.g. "Applied" or "ForRemoval
+        (deployment of properties indeterminable)"
+    """
+    states = {}
+    path = None
+    for line in show_lines:
+        line = line.strip()
+        if line.startswith("/"):
+            path = line
+        elif line.startswith("state:") and path is not None:
+            # Some states are followed by an explanation in brackets,
+            # which is kept
+            states[path] = line[len("state:"):].strip()
+    return states
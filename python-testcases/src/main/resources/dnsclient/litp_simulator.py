@@ -0,0 +1,589 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   In-process stand-in for the parts of the LITP model API and
+            the dnsclient plugin used by the dnsclient testsets, so that
+            dns-client scenarios can be run without an MS and nodes
+'''
+
+import xml.etree.ElementTree as ET
+
+from dns_model_builder import DNS_CLIENT_OPEN, XML_HEADER, parse_props
+from dns_client_linter import LITP_NS, validate_properties, \
+    validate_nameservers, validate_dns_clients
+from expected_resolv_conf import render_resolv_conf
+
+TASK_DESCRIPTIONS = {
+    'Initial': 'Create DNS client configuration on node "{0}"',
+    'Updated': 'Update DNS client configuration on node "{0}"',
+    'ForRemoval': 'Remove DNS client configuration on node "{0}"',
+}
+
+PLAN_STATUSES = ("Initial", "Running", "Stopping", "Stopped",
+                 "Successful", "Failed", "Invalid")
+
+
+class SimulatedItem(object):
+    """
+    A model item of the simulated LITP model.
+    """
+
+    def __init__(self, path, item_type, properties=None, state="Initial"):
+        self.path = path
+        self.item_type = item_type
+        self.properties = dict(properties or {})
+        # The properties of the last plan which applied the item, None
+        # until a plan has applied it
+        self.applied_properties = None
+        self.state = state
+
+    @property
+    def item_id(self):
+        """
+        Description:
+            The last element of the item path
+        """
+        return self.path.rsplit("/", 1)[-1]
+
+
+class LitpSimulator(object):
+    """
+    In-process stand-in for the LITP model, plan and the resolv.conf
+    files written by the dnsclient plugin.
+
+    The CLI methods return (stdout, stderr, rc) like the execute_cli_*
+    helpers of GenericTest, with the errors reported as an item path
+    line followed by the error message line.
+    """
+
+    def __init__(self, node_hostnames=("node1", "node2"),
+                 ms_hostname="ms1"):
+        """
+        Args:
+            node_hostnames (list): The hostnames of the managed nodes
+            ms_hostname (str): The hostname of the MS
+        """
+        self.items = {}
+        self.hostnames = {}
+        self.resolv_conf = {}
+        self.plan = None
+        self.pause_points = set()
+        self._add_node("/ms", "ms", ms_hostname)
+        self._add_item("/deployments", "collection-of-deployment",
+                       "Applied")
+        self._add_item("/deployments/d1", "deployment", "Applied")
+        self._add_item("/deployments/d1/clusters", "collection-of-cluster",
+                       "Applied")
+        self._add_item("/deployments/d1/clusters/c1", "cluster", "Applied")
+        self._add_item("/deployments/d1/clusters/c1/nodes",
+                       "collection-of-node", "Applied")
+        for index, hostname in enumerate(node_hostnames):
+            self._add_node("/deployments/d1/clusters/c1/nodes/n{0}".format(
+                index + 1), "node", hostname)
+
+    def _add_item(self, path, item_type, state="Initial", properties=None):
+        """
+        Description:
+            Adds an item to the model
+        """
+        item = SimulatedItem(path, item_type, properties, state)
+        self.items[path] = item
+        return item
+
+    def _add_node(self, path, item_type, hostname):
+        """
+        Description:
+            Adds a node with an empty config collection
+        """
+        self._add_item(path, item_type, "Applied", {'hostname': hostname})
+        self._add_item(path + "/configs", "collection-of-node-config",
+                       "Applied")
+        self.hostnames[path] = hostname
+        self.resolv_conf[hostname] = []
+
+    def add_node(self, node_path, hostname):
+        """
+        Description:
+            Adds a managed node at a given path, with any missing
+            deployment, cluster and collection items above it, so that
+            the model can mirror the paths of a real deployment
+        Args:
+            node_path (str): The node path,
+                             e.g. "/deployments/d1/clusters/c1/nodes/n1"
+            hostname (str): The hostname of the node
+        """
+        parts = node_path.strip("/").split("/")
+        for depth in range(1, len(parts)):
+            path = "/" + "/".join(parts[:depth])
+            if path in self.items:
+                continue
+            if depth % 2:
+                item_type = "collection-of-" + parts[depth - 1].rstrip("s")
+            else:
+                item_type = parts[depth - 2].rstrip("s")
+            self._add_item(path, item_type, "Applied")
+        self._add_node(node_path, "node", hostname)
+
+    def _children(self, path):
+        """
+        Description:
+            Returns the direct children of an item, sorted by path
+        """
+        return [self.items[child] for child in sorted(self.items)
+                if child.rsplit("/", 1)[0] == path]
+
+    def _descendants(self, path):
+        """
+        Description:
+            Returns an item and all its descendants, sorted by path
+        """
+        return [self.items[child] for child in sorted(self.items)
+                if child == path or child.startswith(path + "/")]
+
+    def _node_path(self, path):
+        """
+        Description:
+            Returns the path of the node (or MS) an item belongs to
+        """
+        for node_path in self.hostnames:
+            if path == node_path or path.startswith(node_path + "/"):
+                return node_path
+        return None
+
+    @staticmethod
+    def _error(path, messages):
+        """
+        Description:
+            Returns a failed CLI result for errors against one path
+        """
+        stderr = []
+        for message in messages:
+            stderr.extend([path, message])
+        return [], stderr, 1
+
+    @staticmethod
+    def _invalid_location(path):
+        """
+        Description:
+            Returns the error for a path which does not exist
+        """
+        return LitpSimulator._error(
+            path, ['InvalidLocationError    Not found'])
+
+    def find(self, path, item_type):
+        """
+        Description:
+            Returns the paths of the items of a type below a path
+        """
+        return [item.path for item in self._descendants(path)
+                if item.item_type == item_type]
+
+    def get_item_state(self, path):
+        """
+        Description:
+            Returns the state of an item, or None if it does not exist
+        """
+        item = self.items.get(path)
+        return item.state if item else None
+
+    def get_file_contents(self, hostname):
+        """
+        Description:
+            Returns the lines of resolv.conf on a node
+        """
+        return list(self.resolv_conf[hostname])
+
+    def create(self, path, item_type, props=None):
+        """
+        Description:
+            Stand-in for "litp create"
+        Args:
+            path (str): The item path
+            item_type (str): "dns-client" or "nameserver"
+            props (str): The properties, in CLI format
+        """
+        parent_path = path.rsplit("/", 1)[0]
+        parent = self.items.get(parent_path)
+        expected_parent = {'dns-client': 'collection-of-node-config',
+                           'nameserver': 'collection-of-nameserver'}
+        if item_type not in expected_parent:
+            return self._error(path, ['InvalidTypeError    Item type "{0}" '
+                                      'is not supported'.format(item_type)])
+        if parent is None or parent.item_type != expected_parent[item_type]:
+            return self._invalid_location(parent_path)
+        if path in self.items:
+            return self._error(path, ['ItemExistsError    Item {0} already '
+                                      'exists'.format(path)])
+        properties = parse_props(props)
+        errors = validate_properties(item_type, properties)
+        if errors:
+            return self._error(path, errors)
+        self._add_item(path, item_type, properties=properties)
+        if item_type == 'dns-client':
+            self._add_item(path + "/nameservers", "collection-of-nameserver")
+        return [], [], 0
+
+    def update(self, path, props, action_del=False):
+        """
+        Description:
+            Stand-in for "litp update"
+        Args:
+            path (str): The item path
+            props (str): The properties to set, in CLI format, or the
+                         property names to delete when action_del is set
+            action_del (bool): Delete the properties instead
+        """
+        item = self.items.get(path)
+        if item is None:
+            return self._invalid_location(path)
+        if action_del:
+            for name in props.split(","):
+                item.properties.pop(name.strip(), None)
+        else:
+            properties = parse_props(props)
+            errors = validate_properties(
+                item.item_type, properties, check_required=False)
+            if errors:
+                return self._error(path, errors)
+            item.properties.update(properties)
+        self._mark_updated(item)
+        return [], [], 0
+
+    @staticmethod
+    def _mark_updated(item):
+        """
+        Description:
+            Moves an item to Updated when its properties no longer match
+            the applied ones
+        """
+        if item.state in ("Applied", "Updated"):
+            changed = item.properties != item.applied_properties
+            item.state = "Updated" if changed else "Applied"
+
+    def remove(self, path):
+        """
+        Description:
+            Stand-in for "litp remove"
+        Args:
+            path (str): The item path
+        """
+        if path not in self.items:
+            return self._invalid_location(path)
+        for item in reversed(self._descendants(path)):
+            if item.state == "Initial":
+                del self.items[item.path]
+            else:
+                item.state = "ForRemoval"
+        return [], [], 0
+
+    def _dns_clients(self, node_path):
+        """
+        Description:
+            Returns the dns-clients of a node
+        """
+        return [item for item in self._descendants(node_path + "/configs")
+                if item.item_type == 'dns-client']
+
+    def _nameservers(self, dns_path):
+        """
+        Description:
+            Returns the nameservers of a dns-client
+        """
+        return [item for item in self._children(dns_path + "/nameservers")
+                if item.item_type == 'nameserver']
+
+    def validate(self):
+        """
+        Description:
+            Runs the model validation done by the dnsclient plugin and
+            the collection cardinality checks done by LITP
+        Results:
+            list of (path, message) errors
+        """
+        errors = []
+        for node_path in sorted(self.hostnames):
+            clients = [client for client in self._dns_clients(node_path)
+                       if client.state != "ForRemoval"]
+            errors.extend(validate_dns_clients(
+                [client.path for client in clients]))
+            for client in clients:
+                errors.extend(self._validate_nameservers(client.path))
+        return errors
+
+    def _validate_nameservers(self, dns_path):
+        """
+        Description:
+            Validates the nameservers collection of a dns-client
+        """
+        return validate_nameservers(
+            dns_path + "/nameservers",
+            [(nameserver.path, nameserver.properties)
+             for nameserver in self._nameservers(dns_path)
+             if nameserver.state != "ForRemoval"])
+
+    def _get_tasks(self):
+        """
+        Description:
+            Generates one task per node whose dns-client configuration
+            has pending changes
+        """
+        tasks = []
+        for node_path in sorted(self.hostnames):
+            for client in self._dns_clients(node_path):
+                subtree = self._descendants(client.path)
+                if all(item.state == "Applied" for item in subtree):
+                    continue
+                state = client.state
+                if state == "Applied":
+                    state = "Updated"
+                tasks.append({
+                    'description': TASK_DESCRIPTIONS[state].format(
+                        self.hostnames[node_path]),
+                    'node_path': node_path,
+                    'items': [item.path for item in subtree],
+                    'state': "Initial",
+                })
+        return tasks
+
+    def create_plan(self):
+        """
+        Description:
+            Stand-in for "litp create_plan"
+        """
+        errors = self.validate()
+        if errors:
+            stderr = []
+            for path, message in errors:
+                stderr.extend([path, message])
+            return [], stderr, 1
+        tasks = self._get_tasks()
+        if not tasks:
+            return [], ['DoNothingPlanError    Create plan failed: no tasks '
+                        'were generated'], 1
+        self.plan = {'state': "Initial", 'tasks': tasks}
+        return [], [], 0
+
+    def run_plan(self):
+        """
+        Description:
+            Stand-in for "litp run_plan". Tasks run in order until the
+            plan completes or a stop is requested.
+        """
+        if self.plan is None or self.plan['state'] not in (
+                "Initial", "Stopped"):
+            return [], ['InvalidRequestError    Plan cannot be run'], 1
+        self.plan['state'] = "Running"
+        self._run_tasks()
+        return [], [], 0
+
+    def _run_tasks(self):
+        """
+        Description:
+            Runs the remaining tasks of the plan
+        """
+        for task in self.plan['tasks']:
+            if task['state'] == "Success":
+                continue
+            if self.plan['state'] == "Stopping":
+                self.plan['state'] = "Stopped"
+                return
+            self._run_task(task)
+            if task['description'] in self.pause_points:
+                # Stop as "litp stop_plan" does while the task runs
+                self.pause_points.discard(task['description'])
+                self.plan['state'] = "Stopping"
+        self.plan['state'] = "Successful"
+
+    def _run_task(self, task):
+        """
+        Description:
+            Applies a task: writes resolv.conf on its node and moves the
+            items of the task to Applied or out of the model
+        """
+        for path in sorted(task['items'], reverse=True):
+            item = self.items.get(path)
+            if item is None:
+                continue
+            if item.state == "ForRemoval":
+                del self.items[path]
+            else:
+                item.state = "Applied"
+                item.applied_properties = dict(item.properties)
+        self._write_resolv_conf(task['node_path'])
+        task['state'] = "Success"
+
+    def _write_resolv_conf(self, node_path):
+        """
+        Description:
+            Writes resolv.conf on a node from its applied dns-client
+        """
+        lines = []
+        for client in self._dns_clients(node_path):
+            if client.applied_properties is None:
+                continue
+            nameservers = [
+                (nameserver.applied_properties['position'],
+                 nameserver.applied_properties['ipaddress'])
+                for nameserver in self._nameservers(client.path)
+                if nameserver.applied_properties is not None]
+            lines = render_resolv_conf(
+                client.applied_properties.get('search'), nameservers)
+        self.resolv_conf[self.hostnames[node_path]] = lines
+
+    def run_puppet(self):
+        """
+        Description:
+            Stand-in for a puppet run on every node: resolv.conf is
+            written again from the applied dns-client configuration, so
+            manual changes to the file are lost
+        """
+        for node_path in self.hostnames:
+            self._write_resolv_conf(node_path)
+
+    def stop_plan(self):
+        """
+        Description:
+            Stand-in for "litp stop_plan"
+        """
+        if self.plan is None or self.plan['state'] != "Running":
+            return [], ['InvalidRequestError    Plan not currently '
+                        'running'], 1
+        self.plan['state'] = "Stopping"
+        return [], [], 0
+
+    def pause_after(self, description):
+        """
+        Description:
+            Sets a pause point: the next run of the plan stops once the
+            task with the given description has completed, with the same
+            result as "litp stop_plan" while that task runs. Tasks after
+            it are left in state Initial; if it is the last task the plan
+            completes.
+        Args:
+            description (str): The task description, e.g.
+                               'Create DNS client configuration on node
+                               "node1"'
+        """
+        self.pause_points.add(description)
+
+    def show_plan(self):
+        """
+        Description:
+            Stand-in for "litp show_plan"
+        """
+        if self.plan is None:
+            return [], ['InvalidLocationError    Plan does not exist'], 1
+        stdout = []
+        for task in self.plan['tasks']:
+            stdout.append("{0:<12}{1}".format(
+                task['state'], task['description']))
+        stdout.append("")
+        stdout.append("Plan Status: {0}".format(self.plan['state']))
+        return stdout, [], 0
+
+    def export(self, path):
+        """
+        Description:
+            Stand-in for "litp export" of a dns-client or nameserver
+        Args:
+            path (str): The item path
+        Results:
+            The XML document as a string
+        """
+        item = self.items[path]
+        if item.item_type == 'nameserver':
+            lines = [XML_HEADER] + self._render_nameserver(item, "", True)
+        else:
+            lines = [XML_HEADER, DNS_CLIENT_OPEN.format(item.item_id)]
+            for name, value in sorted(item.properties.items()):
+                lines.append("  <{0}>{1}</{0}>".format(name, value))
+            lines.append('  <litp:dns-client-nameservers-collection '
+                         'id="nameservers">')
+            for nameserver in self._nameservers(path):
+                lines.extend(self._render_nameserver(nameserver, "    "))
+            lines.append('  </litp:dns-client-nameservers-collection>')
+            lines.append('</litp:dns-client>')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_nameserver(item, indent, root=False):
+        """
+        Description:
+            Renders a nameserver element
+        """
+        open_tag = DNS_CLIENT_OPEN.replace("dns-client", "nameserver") \
+            if root else '<litp:nameserver id="{0}">'
+        lines = [indent + open_tag.format(item.item_id)]
+        for name in ('ipaddress', 'position'):
+            if name in item.properties:
+                lines.append("{0}  <{1}>{2}</{1}>".format(
+                    indent, name, item.properties[name]))
+        lines.append(indent + '</litp:nameserver>')
+        return lines
+
+    def load(self, path, xml_string, mode="--merge"):
+        """
+        Description:
+            Stand-in for "litp load" of a dns-client or nameserver
+        Args:
+            path (str): The parent path to load into
+            xml_string (str): The XML document
+            mode (str): "--merge" or "--replace"
+        """
+        if path not in self.items:
+            return self._invalid_location(path)
+        root = ET.fromstring(xml_string.encode("utf-8"))
+        errors = []
+        self._load_element(path, root, mode == "--replace", errors)
+        if errors:
+            stderr = []
+            for error_path, message in errors:
+                stderr.extend([error_path, message])
+            return [], stderr, 1
+        return [], [], 0
+
+    def _load_element(self, parent_path, element, replace, errors):
+        """
+        Description:
+            Creates or updates the item of an XML element and its children
+        """
+        item_type = element.tag.replace(LITP_NS, "")
+        path = "{0}/{1}".format(parent_path, element.get("id"))
+        if item_type == 'dns-client-nameservers-collection':
+            loaded = set()
+            for child in element:
+                loaded.add(child.get("id"))
+                self._load_element(path, child, replace, errors)
+            if replace:
+                for nameserver in self._children(path):
+                    if nameserver.item_id not in loaded:
+                        self.remove(nameserver.path)
+            return
+        properties = dict((child.tag, (child.text or "").strip())
+                          for child in element if LITP_NS not in child.tag)
+        item = self.items.get(path)
+        if item is None:
+            _, stderr, rc = self.create(
+                path, item_type, " ".join(
+                    '{0}="{1}"'.format(name, value)
+                    for name, value in sorted(properties.items())))
+            if rc != 0:
+                errors.extend(zip(stderr[::2], stderr[1::2]))
+                return
+        else:
+            if item.state == "ForRemoval":
+                item.state = "Updated"
+            if replace:
+                item.properties = {}
+            item.properties.update(properties)
+            self._mark_updated(item)
+        for child in element:
+            if LITP_NS in child.tag:
+                self._load_element(path, child, replace, errors)
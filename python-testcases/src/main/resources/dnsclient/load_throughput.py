@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Records the elapsed time, XML size and items per second of
+            "litp export" and "litp load" calls and appends them to a
+            CSV, so that loads of increasing size give a throughput
+            curve
+'''
+
+import csv
+import os
+import time
+import xml.etree.ElementTree as ET
+
+from step_tracer import TRACE_DIR_ENV
+from dns_client_linter import LITP_NS
+
+CSV_FILENAME = "litp_load_throughput.csv"
+CSV_FIELDS = ("test", "start", "operation", "mode", "path",
+              "config_items", "xml_bytes", "items", "elapsed_secs",
+              "items_per_sec")
+
+
+def count_items(filepath):
+    """
+    Description:
+        Counts the items below the root element of a local XML file, the
+        items a "litp load --merge" of the file creates
+    Args:
+        filepath (str): The XML file
+    """
+    items = -1
+    for _, element in ET.iterparse(filepath):
+        if element.tag.startswith(LITP_NS):
+            items += 1
+        element.clear()
+    return items
+
+
+def parse_timed_output(std_out):
+    """
+    Description:
+        Parses the output of a command built by
+        DnsClientCmdUtils.get_timed_cmd
+    Args:
+        std_out (list): The stdout lines
+    Results:
+        (output lines of the timed command, elapsed seconds, exit code)
+    Raises:
+        ValueError if the timing lines are missing
+    """
+    if len(std_out) < 2 or not std_out[-2].startswith("elapsed_ns:") or \
+            not std_out[-1].startswith("rc:"):
+        raise ValueError("No timing in output: {0}".format(std_out))
+    elapsed_ns = int(std_out[-2][len("elapsed_ns:"):])
+    return std_out[:-2], elapsed_ns / 1e9, int(std_out[-1][len("rc:"):])
+
+
+class ThroughputRecorder(object):
+    """
+    The export and load calls of a test, with their throughput.
+    """
+
+    def __init__(self, test_id):
+        """
+        Args:
+            test_id (str): The id of the test, TestCase.id()
+        """
+        self.test_id = test_id
+        # The number of items in the config collections of the model,
+        # the model size the throughput is measured at
+        self.config_items = None
+        self.records = []
+
+    def record(self, operation, path, elapsed, xml_bytes, items, mode=""):
+        """
+        Description:
+            Records a finished export or load call
+        Args:
+            operation (str): "export" or "load"
+            path (str): The item exported, or the path loaded into
+            elapsed (float): The wall time of the call, in seconds
+            xml_bytes (int): The size of the XML file
+            items (int): The number of items in the XML file
+            mode (str): The load mode, "--merge" or "--replace"
+        Results:
+            dict with the CSV_FIELDS of the call
+        """
+        record = {
+            'test': self.test_id,
+            'start': "{0:.3f}".format(time.time() - elapsed),
+            'operation': operation,
+            'mode': mode,
+            'path': path,
+            'config_items': self.config_items,
+            'xml_bytes': xml_bytes,
+            'items': items,
+            'elapsed_secs': "{0:.3f}".format(elapsed),
+            'items_per_sec': "{0:.1f}".format(
+                items / elapsed if elapsed > 0 else 0.0),
+        }
+        self.records.append(record)
+        return record
+
+    def write(self, directory=None):
+        """
+        Description:
+            Appends the records to the CSV, writing the header to a new
+            file
+        Args:
+            directory (str): The directory of the CSV, by default
+                             $LITP_TRACE_DIR or the working directory
+        Results:
+            The path of the CSV, or None if nothing was recorded
+        """
+        if not self.records:
+            return None
+        directory = directory or os.environ.get(TRACE_DIR_ENV, os.getcwd())
+        filepath = os.path.join(directory, CSV_FILENAME)
+        new_file = not os.path.exists(filepath)
+        with open(filepath, "a") as csv_file:
+            writer = csv.DictWriter(csv_file, CSV_FIELDS)
+            if new_file:
+                writer.writeheader()
+            writer.writerows(self.records)
+        return filepath
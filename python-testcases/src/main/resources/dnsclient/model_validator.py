@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Validation-only fast path for negative create_plan checks.
+            Runs the dnsclient plugin's validate_model against an
+            in-memory copy of the dns-client items of the model instead
+            of a "litp create_plan".
+
+            The script is copied to the MS and run there, where the LITP
+            core and the dnsclient plugin are installed, so it only
+            imports the standard library and LITP:
+                python model_validator.py request.json
+            The request holds the node paths, the exported dns-clients
+            and the items of every rule set, see main. The errors of
+            every rule set are printed as JSON.
+'''
+
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+LITP_NS = "{http://www.ericsson.com/litp}"
+LITP_LIB_DIR = "/opt/ericsson/nms/litp/lib"
+
+
+def load_litp():
+    """
+    Description:
+        Imports the LITP core and dnsclient plugin classes the validator
+        needs
+    Results:
+        dict of class name to class
+    Raises:
+        ImportError if the LITP core or the dnsclient plugin is not
+        installed
+    """
+    if os.path.isdir(LITP_LIB_DIR) and LITP_LIB_DIR not in sys.path:
+        sys.path.append(LITP_LIB_DIR)
+    from litp.core.model_manager import ModelManager
+    from litp.core.plugin_manager import PluginManager
+    from litp.core.plugin_context_api import PluginApiContext
+    from litp.extensions.core_extension import CoreExtension
+    from dnsclient_extension.dnsclient_extension import DnsclientExtension
+    from dnsclient_plugin.dnsclient_plugin import DnsclientPlugin
+    return {
+        'ModelManager': ModelManager,
+        'PluginManager': PluginManager,
+        'PluginApiContext': PluginApiContext,
+        'CoreExtension': CoreExtension,
+        'DnsclientExtension': DnsclientExtension,
+        'DnsclientPlugin': DnsclientPlugin,
+    }
+
+
+class ModelValidator(object):
+    """
+    In-memory copy of the dns-client items of a deployment which
+    negative rules are validated against, with the dnsclient plugin's
+    validate_model run against a LITP model manager holding the copy.
+
+    Collection cardinality is checked by the LITP core during
+    create_plan, not by validate_model, so cardinality errors are not
+    reported.
+    """
+
+    def __init__(self, node_paths, litp):
+        """
+        Args:
+            node_paths (list): The paths of the managed nodes
+            litp (dict): The LITP classes, see load_litp
+        """
+        self.node_paths = list(node_paths)
+        self._litp = litp
+        # (path, item type, properties) of the loaded items, in creation
+        # order
+        self.items = []
+
+    def load(self, parent_path, xml_string):
+        """
+        Description:
+            Adds an exported dns-client to the copy
+        Args:
+            parent_path (str): The config collection of the dns-client
+            xml_string (str): The output of "litp export"
+        """
+        if not isinstance(xml_string, bytes):
+            xml_string = xml_string.encode("utf-8")
+        self._add_element(parent_path, ET.fromstring(xml_string))
+
+    def _add_element(self, parent_path, element):
+        """
+        Description:
+            Adds the item of an XML element and its child items
+        """
+        path = "{0}/{1}".format(parent_path, element.get("id"))
+        item_type = element.tag.replace(LITP_NS, "")
+        if not item_type.endswith("-collection"):
+            self.items.append((path, item_type, dict(
+                (child.tag, (child.text or "").strip())
+                for child in element if LITP_NS not in child.tag)))
+        for child in element:
+            if LITP_NS in child.tag:
+                self._add_element(path, child)
+
+    def validate(self, items):
+        """
+        Description:
+            Validates the copy with extra items created in it. Every call
+            validates a fresh model, so the copy is left unchanged.
+        Args:
+            items (list): The items to create, dictionaries with the
+                          'path', 'type' and parsed 'props' of the item
+        Results:
+            The errors in the format of the stderr of "litp create" and
+            "litp create_plan": an item path line followed by a message
+            line
+        """
+        model_manager = self._create_model_manager()
+        stderr = []
+        for path, item_type, properties in self.items:
+            self._create_item(model_manager, path, item_type, properties)
+        for item in items:
+            for error in self._create_item(
+                    model_manager, item['path'], item['type'],
+                    item['props']):
+                stderr.extend([error.item_path or item['path'],
+                               self._format_create_error(error)])
+
+        plugin = self._litp['DnsclientPlugin']()
+        for error in plugin.validate_model(
+                self._litp['PluginApiContext'](model_manager)):
+            stderr.extend([error.item_path, "{0}    Create plan failed: "
+                           "{1}".format(error.error_type,
+                                        error.error_message)])
+        return stderr
+
+    def _create_model_manager(self):
+        """
+        Description:
+            Returns a LITP model manager with the core and dnsclient item
+            types and the deployments, clusters and nodes of the copy
+        """
+        model_manager = self._litp['ModelManager']()
+        plugin_manager = self._litp['PluginManager'](model_manager)
+        for extension in (self._litp['CoreExtension'](),
+                          self._litp['DnsclientExtension']()):
+            plugin_manager.add_property_types(
+                extension.define_property_types())
+            plugin_manager.add_item_types(extension.define_item_types())
+        plugin_manager.add_default_model()
+
+        for node_path in self.node_paths:
+            cluster_path = node_path.rsplit("/", 2)[0]
+            deployment_path = cluster_path.rsplit("/", 2)[0]
+            self._create_item(model_manager, deployment_path, "deployment")
+            self._create_item(model_manager, cluster_path, "cluster")
+            self._create_item(model_manager, node_path, "node",
+                              {'hostname': node_path.rsplit("/", 1)[-1]})
+        return model_manager
+
+    @staticmethod
+    def _create_item(model_manager, path, item_type, properties=None):
+        """
+        Description:
+            Creates an item unless it exists
+        Results:
+            list of the errors of the LITP model manager
+        """
+        if model_manager.get_item(path) is not None:
+            return []
+        result = model_manager.create_item(item_type, path,
+                                           **(properties or {}))
+        return result if isinstance(result, list) else []
+
+    @staticmethod
+    def _format_create_error(error):
+        """
+        Description:
+            Formats an error of the LITP model manager the way "litp
+            create" prints it
+        """
+        if error.property_name:
+            return '{0} in property: "{1}"    {2}'.format(
+                error.error_type, error.property_name, error.error_message)
+        return "{0}    {1}".format(error.error_type, error.error_message)
+
+
+def main(argv=None, litp=None):
+    """
+    Description:
+        Validates the rule sets of a request file and prints their errors
+        as a JSON list, one list of stderr lines per rule set
+    Args:
+        argv (list): The arguments, the request file
+        litp (dict): The LITP classes, by default load_litp()
+    Results:
+        0, or 1 if the LITP core or the dnsclient plugin is missing
+
+    The request is a JSON object with:
+        node_paths: the paths of the managed nodes
+        exports: [config collection, exported XML file] of every
+                 dns-client in the model
+        rule_sets: the items of every rule set, see
+                   ModelValidator.validate
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if litp is None:
+        try:
+            litp = load_litp()
+        except ImportError as error:
+            sys.stderr.write("Cannot import LITP: {0}\n".format(error))
+            return 1
+    with open(argv[0]) as request_file:
+        request = json.load(request_file)
+    validator = ModelValidator(request['node_paths'], litp)
+    for config_path, xml_filepath in request['exports']:
+        with open(xml_filepath, "rb") as xml_file:
+            validator.load(config_path, xml_file.read())
+    sys.stdout.write(json.dumps([validator.validate(items)
+                                 for items in request['rule_sets']]))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
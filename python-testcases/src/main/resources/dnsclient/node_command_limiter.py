@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Limits the number of commands run at the same time on each
+            of the MS and managed nodes, and batches several commands
+            into one exchange
+'''
+
+import threading
+import uuid
+
+
+class NodeCommandLimiter(object):
+    """
+    Per-node concurrency limiter for the commands of a test.
+
+    Every node gets a semaphore which bounds the number of commands run
+    on it at the same time. The limiter opens no connection of its own
+    and keeps none open: the caller passes the function that runs a
+    command, GenericTest.run_command, which makes its own SSH exchange.
+    One limiter can be shared by all the tests of a class. run_batch
+    sends several commands as a single exchange and splits the output
+    back per command.
+    """
+
+    def __init__(self, max_per_node=1):
+        """
+        Args:
+            max_per_node (int): The number of commands which may run on
+                                a node at the same time
+        """
+        self._max_per_node = max_per_node
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _get_semaphore(self, node):
+        """
+        Description:
+            Returns the semaphore of a node, creating it on first use
+        Args:
+            node (str): The node filename
+        """
+        with self._lock:
+            if node not in self._semaphores:
+                self._semaphores[node] = threading.Semaphore(
+                    self._max_per_node)
+            return self._semaphores[node]
+
+    def run(self, run_command, node, cmd, su_root=False):
+        """
+        Description:
+            Runs a single command on a node
+        Args:
+            run_command (callable): The function used to run a command
+                                    on a node, GenericTest.run_command
+            node (str): The node filename
+            cmd (str): The command to run
+            su_root (bool): Run the command as root
+        Results:
+            stdout, stderr and return code of the command
+        """
+        return self.run_batch(run_command, node, [cmd], su_root=su_root)[0]
+
+    def run_batch(self, run_command, node, cmds, su_root=False):
+        """
+        Description:
+            Runs several commands on a node in a single exchange
+        Args:
+            run_command (callable): The function used to run a command
+                                    on a node, GenericTest.run_command
+            node (str): The node filename
+            cmds (list): The commands to run, in order
+            su_root (bool): Run the commands as root
+        Results:
+            list with the stdout, stderr and return code of each command
+        """
+        with self._get_semaphore(node):
+            if len(cmds) == 1:
+                return [run_command(node, cmds[0], su_root=su_root)]
+            marker = "__NCL_{0}__".format(uuid.uuid4().hex)
+            std_out, std_err, rc = run_command(
+                node, self._get_batch_cmd(cmds, marker), su_root=su_root)
+        if rc != 0:
+            return [(std_out, std_err, rc)] * len(cmds)
+        return self._split_batch_output(std_out, marker, len(cmds))
+
+    @staticmethod
+    def _get_batch_cmd(cmds, marker):
+        """
+        Description:
+            Builds the command which runs a batch of commands. The output
+            of each command is followed by a line break, in case its last
+            line has none, then a line with its return code and its
+            stderr lines, all prefixed with the marker.
+        Args:
+            cmds (list): The commands to run
+            marker (str): A marker which cannot appear in the output
+        """
+        parts = ['err=$(mktemp)']
+        for index, cmd in enumerate(cmds):
+            parts.append(
+                '( {cmd} ) 2>$err; rc=$?; echo; '
+                'echo "{marker}:{index}:rc:$rc"; '
+                'awk \'{{print "{marker}:{index}:err:" $0}}\' $err'.format(
+                    cmd=cmd, marker=marker, index=index))
+        parts.append('rm -f $err')
+        return '; '.join(parts)
+
+    @staticmethod
+    def _split_batch_output(lines, marker, count):
+        """
+        Description:
+            Splits the output of a batch back into one result per command
+        Args:
+            lines (list): The stdout lines of the batch
+            marker (str): The marker used by the batch
+            count (int): The number of commands in the batch
+        Results:
+            list with the stdout, stderr and return code of each command
+        """
+        results = [([], [], None) for _ in range(count)]
+        index = 0
+        prefix = marker + ":"
+        for line in lines:
+            if not line.startswith(prefix):
+                results[index][0].append(line)
+                continue
+            cmd_index, kind, value = line[len(prefix):].split(":", 2)
+            cmd_index = int(cmd_index)
+            if kind == "rc":
+                std_out, std_err, _ = results[cmd_index]
+                # The line break added before the marker
+                if std_out and std_out[-1] == "":
+                    std_out.pop()
+                results[cmd_index] = (std_out, std_err, int(value))
+                index = min(cmd_index + 1, count - 1)
+            else:
+                results[cmd_index][1].append(value)
+        return results
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Helpers to read the dnsclient plugin tasks from the output
+            of "litp show_plan"
+'''
+
+import re
+
+DNS_TASK = re.compile(
+    r'(Create|Update|Remove) DNS client configuration on node "([^"]+)"')
+
+
+def get_dns_tasks(show_plan_lines):
+    """
+    Description:
+        Finds the dnsclient plugin tasks in the output of show_plan
+    Args:
+        show_plan_lines (list): The stdout lines of "litp show_plan"
+    Results:
+        list of (action, hostname) pairs, in plan order
+    """
+    tasks = []
+    for line in show_plan_lines:
+        match = DNS_TASK.search(line)
+        if match:
+            tasks.append((match.group(1), match.group(2)))
+    return tasks
+
+
+def get_dns_task_hostnames(show_plan_lines):
+    """
+    Description:
+        Returns the hostnames whose DNS client configuration is written
+        by the plan
+    Args:
+        show_plan_lines (list): The stdout lines of "litp show_plan"
+    Results:
+        set of hostnames
+    """
+    return set(hostname for _, hostname in get_dns_tasks(show_plan_lines))
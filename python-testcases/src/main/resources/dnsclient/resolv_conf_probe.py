@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Parsed result of the resolv.conf probe, which reports the
+            checksum and records of a resolv.conf file in one exchange
+'''
+
+import re
+
+
+class ResolvConf(object):
+    """
+    The checksum and records of a resolv.conf file, as reported by the
+    command from DnsClientCmdUtils.get_resolv_conf_probe_cmd.
+
+    Values are looked up in the lines of the file the way grep does, so
+    repeated checks against the same file need no further exchange with
+    the node.
+    """
+
+    def __init__(self, sha256, records):
+        """
+        Args:
+            sha256 (str): The checksum of the file
+            records (list): (type, value) pairs, one per line of the file
+        """
+        self.sha256 = sha256
+        self.records = records
+
+    @classmethod
+    def from_probe_output(cls, std_out):
+        """
+        Description:
+            Parses the output of the probe command
+        Args:
+            std_out (list): The stdout lines of the probe command
+        """
+        sha256 = None
+        records = []
+        for line in std_out:
+            record_type, _, value = line.partition("\t")
+            if record_type == "sha256":
+                sha256 = value
+            else:
+                records.append((record_type, value))
+        if sha256 is None:
+            raise ValueError("No checksum in probe output: {0}".format(
+                std_out))
+        return cls(sha256, records)
+
+    @property
+    def search(self):
+        """
+        Description:
+            Returns the domains of the search record
+        """
+        for record_type, value in self.records:
+            if record_type == "search":
+                return value.split()
+        return []
+
+    @property
+    def nameservers(self):
+        """
+        Description:
+            Returns the nameserver addresses, in file order
+        """
+        return [value for record_type, value in self.records
+                if record_type == "nameserver"]
+
+    def lines(self):
+        """
+        Description:
+            Returns the lines of the file, with the search and nameserver
+            records normalised to single spaces
+        """
+        return [value if record_type == "line" else
+                "{0} {1}".format(record_type, value)
+                for record_type, value in self.records]
+
+    def contains(self, pattern):
+        """
+        Description:
+            Checks whether any line of the file matches a pattern, like
+            "grep pattern resolv.conf"
+        Args:
+            pattern (str): The pattern
+        """
+        regex = re.compile(pattern)
+        return any(regex.search(line) for line in self.lines())
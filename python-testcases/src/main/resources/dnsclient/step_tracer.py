@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Records the latency of the CLI and SSH calls made by a test,
+            tagged with the numbered step comment of the test they were
+            made from, and writes them out as a JSON trace
+'''
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+STEP_COMMENT = re.compile(r'^\s*#\s*(\d+)\s*\.\s*(.*)$')
+TEST_PREFIXES = ("test_", "obsolete_")
+TRACE_DIR_ENV = "LITP_TRACE_DIR"
+
+
+class StepTracer(object):
+    """
+    Wraps methods of a test so that every call records its wall time
+    and any error raised, tagged with the numbered step comment
+    ("# 13.Check the resolv.conf ...") of the test method the call was
+    made from.
+    """
+
+    # Step comments by source file, parsed once for all the tests
+    _steps_cache = {}
+
+    def __init__(self, test_id, source_file):
+        """
+        Args:
+            test_id (str): The id of the test, TestCase.id()
+            source_file (str): The file the test methods are defined in
+        """
+        self.test_id = test_id
+        self.source_file = os.path.abspath(source_file).replace(
+            ".pyc", ".py")
+        self.records = []
+        if self.source_file not in StepTracer._steps_cache:
+            StepTracer._steps_cache[self.source_file] = \
+                self._parse_steps(self.source_file)
+        self._steps = StepTracer._steps_cache[self.source_file]
+        self._local = threading.local()
+        self._last_step = (None, None)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse_steps(source_file):
+        """
+        Description:
+            Finds the numbered step comments in a source file
+        Results:
+            list of (line number, step, comment), in line order
+        """
+        steps = []
+        with open(source_file) as source:
+            for lineno, line in enumerate(source, 1):
+                match = STEP_COMMENT.match(line)
+                if match:
+                    steps.append((lineno, match.group(1),
+                                  match.group(2).strip()))
+        return steps
+
+    def _get_step(self):
+        """
+        Description:
+            Returns the step the current call was made from, using the
+            last step seen when called from a worker thread
+        """
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            if os.path.abspath(code.co_filename) == self.source_file and \
+                    code.co_name.startswith(TEST_PREFIXES):
+                step = (None, None)
+                for lineno, number, comment in self._steps:
+                    if lineno > frame.f_lineno:
+                        break
+                    if lineno > code.co_firstlineno:
+                        step = (number, comment)
+                self._last_step = step
+                return step
+            frame = frame.f_back
+        return self._last_step
+
+    def instrument(self, obj, method_names):
+        """
+        Description:
+            Replaces methods of an object with traced versions
+        Args:
+            obj (object): The object, usually the test itself
+            method_names (list): The names of the methods to trace
+        """
+        for name in method_names:
+            setattr(obj, name, self._wrap(name, getattr(obj, name)))
+
+    def _wrap(self, name, method):
+        """
+        Description:
+            Returns a traced version of a method
+        """
+        def traced(*args, **kwargs):
+            """
+            Calls the method and records the call.
+            """
+            step, comment = self._get_step()
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            start = time.time()
+            error = None
+            try:
+                return method(*args, **kwargs)
+            except Exception as err:
+                error = "{0}: {1}".format(type(err).__name__, err)
+                raise
+            finally:
+                self._local.depth = depth
+                self._record({
+                    'method': name,
+                    'args': repr(args)[:200],
+                    'step': step,
+                    'step_comment': comment,
+                    'start': start,
+                    'wall_time': time.time() - start,
+                    'depth': depth,
+                    'error': error,
+                })
+        return traced
+
+    def _record(self, record):
+        """
+        Description:
+            Stores a call
+        """
+        with self._lock:
+            self.records.append(record)
+
+    def write(self, directory=None):
+        """
+        Description:
+            Writes the trace as JSON
+        Args:
+            directory (str): The directory to write to, by default
+                             $LITP_TRACE_DIR or the working directory,
+                             where nosetests writes its XML report
+        Results:
+            The path of the trace file
+        """
+        directory = directory or os.environ.get(TRACE_DIR_ENV, os.getcwd())
+        filepath = os.path.join(
+            directory, "trace_{0}.json".format(self.test_id))
+        with open(filepath, "w") as trace:
+            json.dump({'test': self.test_id, 'calls': self.records},
+                      trace, indent=1)
+        return filepath
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Benchmark of "litp load" and "litp export" of dns-client
+            XML of increasing size. The XML is generated by
+            xml_fixture_generator.py and every call is timed on the MS,
+            so the SSH round trip is left out of the figures. The
+            throughput of every call is appended to
+            litp_load_throughput.csv, see load_throughput.py.
+
+            The number of dns-clients of each load is set with
+            $DNSCLIENT_BENCHMARK_SIZES, by default "1,10,100".
+'''
+
+from litp_generic_test import GenericTest, attr
+from dnsclient_cmd_utils import DnsClientCmdUtils
+from xml_fixture_generator import DnsClientFixtures, write_configs_xml, \
+    get_dns_id
+from load_throughput import ThroughputRecorder, count_items, \
+    parse_timed_output
+from item_state_utils import parse_item_states
+import os
+import tempfile
+import uuid
+
+SIZES_ENV = "DNSCLIENT_BENCHMARK_SIZES"
+DEFAULT_SIZES = "1,10,100"
+
+
+class DnsclientLoadBenchmark(GenericTest):
+
+    '''
+    As a LITP engineer I want to measure how "litp load" and "litp
+    export" of dns-client XML scale, so that a plugin schema regression
+    shows as a drop in throughput
+    '''
+
+    def setUp(self):
+        """
+        Description:
+            Runs before every single test
+        Actions:
+            1. Call the super class setup method
+            2. Set up variables used in the tests
+        Results:
+            The super class prints out diagnostics and variables
+            common to all tests are available.
+        """
+        # 1. Call super class setup
+        super(DnsclientLoadBenchmark, self).setUp()
+        self.test_ms = self.get_management_node_filename()
+        self.dnsutils = DnsClientCmdUtils()
+        self.throughput = ThroughputRecorder(self.id())
+
+    def tearDown(self):
+        """
+        Description:
+            Runs after every single test
+        Actions:
+            1. Perform Test Cleanup
+            2. Write the throughput of the loads made by the test
+        Results:
+            Items used in the test are cleaned up and the
+            super class prints out end test diagnostics
+        """
+        try:
+            super(DnsclientLoadBenchmark, self).tearDown()
+        finally:
+            self.throughput.write()
+
+    @staticmethod
+    def _get_sizes():
+        """
+        Description:
+            Returns the number of dns-clients of each load, from
+            $DNSCLIENT_BENCHMARK_SIZES
+        """
+        return [int(size) for size in
+                os.environ.get(SIZES_ENV, DEFAULT_SIZES).split(",")
+                if size.strip()]
+
+    def _count_config_items(self):
+        """
+        Description:
+            Returns the number of items in the config collections of the
+            MS and the nodes, the model size the loads are measured at
+        """
+        collection_type = "collection-of-node-config"
+        std_out, std_err, rc = self.run_command(
+            self.test_ms, self.dnsutils.get_show_subtrees_cmd(
+                self.find(self.test_ms, "/ms", collection_type) +
+                self.find(self.test_ms, "/deployments", collection_type)))
+        self.assertEquals([], std_err)
+        self.assertEquals(0, rc)
+        return len(parse_item_states(std_out))
+
+    def _generate_xml(self, size):
+        """
+        Description:
+            Generates a config collection of dns-clients in a local file
+        Args:
+            size (int): The number of dns-clients
+        Results:
+            (filepath, bytes, items)
+        """
+        filepath = os.path.join(
+            tempfile.gettempdir(),
+            "dnsgen_{0}_{1}.xml".format(size, uuid.uuid4().hex))
+        with open(filepath, "wb") as out:
+            write_configs_xml(out, DnsClientFixtures(), size)
+        return filepath, os.path.getsize(filepath), count_items(filepath)
+
+    def _timed_litp_cmd(self, cmd):
+        """
+        Description:
+            Runs a litp command on the MS, timed on the MS
+        Args:
+            cmd (str): The command
+        Results:
+            The elapsed time, in seconds
+        """
+        std_out, std_err, rc = self.run_command(
+            self.test_ms, self.dnsutils.get_timed_cmd(cmd))
+        self.assertEquals(0, rc)
+        _, elapsed, litp_rc = parse_timed_output(std_out)
+        self.assertEquals([], std_err)
+        self.assertEquals(0, litp_rc)
+        return elapsed
+
+    def _get_remote_xml_size(self, filepath):
+        """
+        Description:
+            Returns the size of an XML file on the MS
+        Args:
+            filepath (str): The XML file on the MS
+        Results:
+            (bytes, items), items as counted by count_items
+        """
+        std_out, std_err, rc = self.run_command(
+            self.test_ms, self.dnsutils.get_xml_size_cmd(filepath))
+        self.assertEquals([], std_err)
+        self.assertEquals(0, rc)
+        return int(std_out[0]), int(std_out[1]) - 1
+
+    def _remove_loaded(self, node_url, paths, remote_filepaths):
+        """
+        Description:
+            Removes the loaded dns-clients, all in state Initial, and
+            the XML files on the MS
+        Args:
+            node_url (str): The node the dns-clients were loaded into
+            paths (list): The dns-client paths
+            remote_filepaths (list): The XML files on the MS
+        """
+        std_out, std_err, rc = self.run_command(
+            self.test_ms, self.dnsutils.get_remove_files_cmd(
+                remote_filepaths), su_root=True)
+        self.assertEquals(0, rc)
+        std_out, std_err, rc = self.run_command(
+            self.test_ms, self.dnsutils.get_show_subtrees_cmd(
+                [node_url + "/configs"]))
+        self.assertEquals(0, rc)
+        states = parse_item_states(std_out)
+        existing = [path for path in paths if path in states]
+        if existing:
+            std_out, std_err, rc = self.run_command(
+                self.test_ms, self.dnsutils.get_remove_items_cmd(existing))
+            self.assertEquals([], std_err)
+            self.assertEquals(0, rc)
+
+    def _log_record(self, size, record):
+        """
+        Description:
+            Logs the throughput of a call
+        Args:
+            size (int): The number of dns-clients generated
+            record (dict): The call, see ThroughputRecorder.record
+        """
+        call = " ".join(part for part in (record['operation'],
+                                          record['mode']) if part)
+        self.log("info", "{0} of {1} dns-clients: {xml_bytes} bytes, "
+                 "{items} items in {elapsed_secs}s, {items_per_sec} "
+                 "items/s".format(call, size, **record))
+
+    @attr('non-revert', 'benchmark', 'dnsclient_load_benchmark')
+    def test_01_litp_load_throughput(self):
+        """
+        @tms_id: dnsclient_load_benchmark_tc01
+        @tms_requirements_id: LITPCDS-72
+        @tms_title: test_01_litp_load_throughput
+        @tms_description: Measure the throughput of "litp load" and "litp
+                          export" of dns-client XML of increasing size.
+        @tms_test_steps:
+            @step:      Generate a config collection of dns-clients.
+            @result:    XML file generated.
+            @step:      Copy the XML file onto the MS.
+            @result:    File copied to MS.
+            @step:      Load the XML file into a node using --merge,
+                        timed on the MS.
+            @result:    dns-clients loaded into the model.
+            @step:      Export the config collection of the node, timed
+                        on the MS.
+            @result:    Config collection exported to an XML file.
+            @step:      Load the exported XML file into the node using
+                        --replace, timed on the MS.
+            @result:    Config collection replaced in the model.
+            @step:      Remove the loaded dns-clients and the XML files.
+            @result:    dns-clients removed from the model.
+        @tms_test_precondition: N/A
+        @tms_execution_type: Automated
+        """
+        node_url = self.find(self.test_ms, "/deployments", "node")[0]
+        configs_url = node_url + "/configs"
+        self.throughput.config_items = self._count_config_items()
+
+        for size in self._get_sizes():
+            # 1. Generate a config collection of dns-clients
+            local_filepath, xml_bytes, items = self._generate_xml(size)
+            remote_filepath = "/tmp/{0}".format(
+                os.path.basename(local_filepath))
+            export_filepath = remote_filepath.replace(".xml", "_export.xml")
+            paths = ["{0}/{1}".format(configs_url, get_dns_id(index))
+                     for index in range(1, size + 1)]
+            try:
+                # 2. Copy the XML file onto the MS
+                self.assertTrue(self.copy_file_to(
+                    self.test_ms, local_filepath, remote_filepath,
+                    root_copy=True))
+
+                # 3. Load the XML file into the node using --merge
+                elapsed = self._timed_litp_cmd(self.dnsutils.get_load_cmd(
+                    node_url, remote_filepath, "--merge"))
+                self._log_record(size, self.throughput.record(
+                    "load", node_url, elapsed, xml_bytes, items, "--merge"))
+
+                # 4. Export the config collection of the node
+                elapsed = self._timed_litp_cmd(self.dnsutils.get_export_cmd(
+                    configs_url, export_filepath))
+                export_bytes, export_items = self._get_remote_xml_size(
+                    export_filepath)
+                self._log_record(size, self.throughput.record(
+                    "export", configs_url, elapsed, export_bytes,
+                    export_items))
+
+                # 5. Load the exported XML file into the node using
+                # --replace
+                elapsed = self._timed_litp_cmd(self.dnsutils.get_load_cmd(
+                    node_url, export_filepath, "--replace"))
+                self._log_record(size, self.throughput.record(
+                    "load", node_url, elapsed, export_bytes, export_items,
+                    "--replace"))
+            finally:
+                # 6. Remove the loaded dns-clients and the XML files
+                os.remove(local_filepath)
+                self._remove_loaded(node_url, paths,
+                                    [remote_filepath, export_filepath])
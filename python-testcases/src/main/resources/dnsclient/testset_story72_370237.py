@@ -24,8 +24,28 @@ from litp_cli_utils import CLIUtils
 from xml_utils import XMLUtils
 from redhat_cmd_utils import RHCmdUtils
 from litp_generic_test import GenericTest, attr
+from dns_model_builder import DnsModelBuilder, parse_props
+from expected_resolv_conf import diff_resolv_conf
+from dnsclient_cmd_utils import DnsClientCmdUtils, WATCH_TIMEOUT_RC
+from cli_error_utils import CliErrorIndex, format_mismatches
+from node_command_limiter import NodeCommandLimiter
+from step_tracer import StepTracer
+from fixture_transfer import XML_FILES_DIR, list_fixtures, parse_checksums, \
+    get_changed_fixtures, pack_fixtures
+from dns_client_linter import DnsClientLinter
+from plan_task_utils import get_dns_task_hostnames
+from item_state_utils import parse_item_states
+from resolv_conf_probe import ResolvConf
 import test_constants
+import json
 import os
+import tempfile
+import uuid
+from multiprocessing.pool import ThreadPool
+
+# The validation-only fast path of test_08, run on the MS
+MODEL_VALIDATOR_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "model_validator.py")
 
 
 class Story72(GenericTest):
@@ -37,6 +57,36 @@ class Story72(GenericTest):
     that they support dual stack with a CIDR prefix
     '''
 
+    # Upper bound on the number of nodes whose resolv.conf is read at once
+    MAX_PARALLEL_NODES = 8
+
+    # Methods, besides the execute_cli_* ones, whose calls are traced
+    TRACED_METHODS = ("run_command", "get_file_contents",
+                      "wait_for_plan_state", "wait_for_puppet_action",
+                      "_wait_for_plan_state", "_wait_for_puppet_to_remove")
+
+    # CLI commands after which the cached item states are out of date,
+    # see _get_item_state
+    MODEL_MUTATING_METHODS = ("execute_cli_create_cmd",
+                              "execute_cli_update_cmd",
+                              "execute_cli_remove_cmd",
+                              "execute_cli_load_cmd",
+                              "execute_cli_runplan_cmd",
+                              "execute_cli_stopplan_cmd",
+                              "execute_cli_removeplan_cmd")
+
+    # Deployment topology shared by all tests, see _get_topology
+    _topology = None
+
+    # Limit of one command at a time per node, shared by all tests
+    node_limiter = NodeCommandLimiter()
+
+    # "Plan Status" reported by show_plan for each expected plan state
+    PLAN_STATUSES = {
+        test_constants.PLAN_COMPLETE: "Successful",
+        test_constants.PLAN_STOPPED: "Stopped",
+    }
+
     def setUp(self):
         """
         Description:
@@ -50,61 +100,127 @@ class Story72(GenericTest):
         """
         # 1. Call super class setup
         super(Story72, self).setUp()
-        self.test_ms = self.get_management_node_filename()
-        self.test_nodes = self.get_managed_node_filenames()
+        self.tracer = StepTracer(self.id(), __file__)
+        self.tracer.instrument(
+            self, [name for name in dir(self)
+                   if name.startswith("execute_cli_")] +
+            list(self.TRACED_METHODS))
+        for name in self.MODEL_MUTATING_METHODS:
+            setattr(self, name,
+                    self._invalidating_item_states(getattr(self, name)))
+        topology = self._get_topology()
+        self.test_ms = topology['ms']
+        self.test_nodes = list(topology['nodes'])
         self.test_node1 = None
         self.test_node2 = None
         self.cli = CLIUtils()
         self.xml = XMLUtils()
         self.redhatutils = RHCmdUtils()
+        self.dnsutils = DnsClientCmdUtils()
+        self.dns_model = None
+        self.resolv_conf_cache = {}
+        self.resolv_conf_probes = {}
+        self.item_states = None
+        self.loaded_dns_clients = []
 
     def tearDown(self):
         """
         Description:
             Runs after every single test
         Actions:
-            1. Perform Test Cleanup
+            1. Remove the dns-clients loaded by the test, before the
+               backed up files are restored
+            2. Perform Test Cleanup, even if the removal failed
+            3. Write the trace of the calls made by the test
         Results:
             Items used in the test are cleaned up and the
             super class prints out end test diagnostics
         """
-        super(Story72, self).tearDown()
+        try:
+            try:
+                self._remove_loaded_dns_clients()
+            finally:
+                super(Story72, self).tearDown()
+        finally:
+            self.tracer.write()
+
+    def _get_topology(self):
+        """
+        Description:
+            Returns the deployment topology. The topology is looked up
+            once and shared by all the tests in the suite, tests which
+            change the deployment must call _invalidate_topology.
+        Actions:
+            1. Get the MS and managed node filenames
+            2. Find the node paths and their filenames
+            3. Find the config collections on the MS and on the nodes
+        Results:
+            dict with the keys:
+                ms: the MS filename
+                nodes: the managed node filenames
+                node_urls: the node paths in the model
+                node_filenames: the filename of each node in node_urls
+                ms_config_paths: the config collections on the MS
+                node_config_paths: the config collections on the nodes
+                hostnames: the hostname of the MS and of each node
+        """
+        if Story72._topology is None:
+            test_ms = self.get_management_node_filename()
+            nodes = tuple(self.get_managed_node_filenames())
+            collection_type = "collection-of-node-config"
+            node_urls = tuple(
+                self.find(test_ms, "/deployments", "node", True))
+            Story72._topology = {
+                'ms': test_ms,
+                'nodes': nodes,
+                'node_urls': node_urls,
+                'node_filenames': tuple(
+                    self.get_node_filename_from_url(test_ms, node_url)
+                    for node_url in node_urls),
+                'ms_config_paths': tuple(
+                    self.find(test_ms, "/ms", collection_type)),
+                'node_config_paths': tuple(
+                    self.find(test_ms, "/deployments", collection_type)),
+                'hostnames': dict(
+                    (node, self.get_node_att(node, 'hostname'))
+                    for node in (test_ms,) + nodes),
+            }
+        return Story72._topology
+
+    @classmethod
+    def _invalidate_topology(cls):
+        """
+        Description:
+            Discards the cached deployment topology so that it is
+            looked up again by the next test
+        """
+        Story72._topology = None
 
     def _get_managed_nodes(self):
         """
         Description:
             Function that gets the managed nodes
         Actions:
-            1. Find the nodes path
+            1. Get the node filenames from the topology
             2. Ensure there are at least 2 nodes defined
-            3. Set node1 path in model
-            4. Set node2 path in model
-            5. Get node1
-            6. Get node2
+            3. Get node1
+            4. Get node2
         Result:
              node1 and node2
         """
-        # 1. Find the nodes path
-        nodes_path = self.find(self.test_ms, "/deployments", "node", True)
+        # 1. Get the node filenames from the topology
+        node_filenames = self._get_topology()['node_filenames']
 
         # 2. Enusre there are at least 2 nodes defined
         self.assertTrue(
-            len(nodes_path) > 1,
+            len(node_filenames) > 1,
             "The LITP Tree has less than 2 nodes defined")
 
-        # 3. Set node1 path in model
-        node1_path = nodes_path[0]
-
-        # 4. Set node2 path in model
-        node2_path = nodes_path[1]
+        # 3. Get node1
+        self.test_node1 = node_filenames[0]
 
-        # 5. Get node1
-        self.test_node1 = self.get_node_filename_from_url(
-            self.test_ms, node1_path)
-
-        # 6. Get node2
-        self.test_node2 = self.get_node_filename_from_url(
-            self.test_ms, node2_path)
+        # 4. Get node2
+        self.test_node2 = node_filenames[1]
 
     def _create_dns_client(self, config_path, dns_name, **kwargs):
         """
@@ -124,6 +240,8 @@ class Story72(GenericTest):
         props = " ".join(pairs)
         self.execute_cli_create_cmd(
             self.test_ms, dns_url, "dns-client", props)
+        if self.dns_model is not None:
+            self.dns_model.add_dns_client(config_path, dns_name, **kwargs)
         return dns_url
 
     def _update_dns_client(self, config_path, props):
@@ -141,6 +259,9 @@ class Story72(GenericTest):
         """
         self.execute_cli_update_cmd(
             self.test_ms, config_path, props)
+        if self._is_tracked(config_path):
+            self.dns_model.update_dns_client(
+                config_path, **parse_props(props))
 
     def _update_dns_client_remove_search_prop(self, config_path):
         """
@@ -155,6 +276,8 @@ class Story72(GenericTest):
         """
         self.execute_cli_update_cmd(
             self.test_ms, config_path, "search", action_del=True)
+        if self._is_tracked(config_path):
+            self.dns_model.remove_dns_client_property(config_path, "search")
 
     def _create_nameserver(self, dns_path, nameserver_name, props):
         """
@@ -175,6 +298,8 @@ class Story72(GenericTest):
         nameserver_path = dns_path + "/nameservers/{0}".format(nameserver_name)
         self.execute_cli_create_cmd(
             self.test_ms, nameserver_path, "nameserver", props)
+        if self._is_tracked(dns_path):
+            self.dns_model.add_nameserver(dns_path, nameserver_name, props)
         return nameserver_path
 
     def _update_nameserver_props(self, nameserver_path, props):
@@ -191,6 +316,8 @@ class Story72(GenericTest):
         """
         self.execute_cli_update_cmd(
             self.test_ms, nameserver_path, props)
+        if self._is_tracked(nameserver_path):
+            self.dns_model.update_nameserver(nameserver_path, props)
 
     def _remove_nameserver(self, nameserver_path):
         """
@@ -205,6 +332,282 @@ class Story72(GenericTest):
         """
         self.execute_cli_remove_cmd(
             self.test_ms, nameserver_path)
+        if self._is_tracked(nameserver_path):
+            self.dns_model.remove(nameserver_path)
+
+    def _load_dns_model(self, builder):
+        """
+        Description:
+            Applies a dns-client tree built in memory to the model
+            with a single "litp load" per config collection
+        Args:
+            builder (DnsModelBuilder): The dns-client tree to load
+        Actions:
+            1. Check the tree locally with the dns-client linter, along
+               with the dns-clients already in the config collections
+            2. Write the XML for each config collection onto the MS
+            3. Load the XML into the config collection using --merge
+            4. Remove the XML files
+        Results:
+            All dns-client and nameserver items are in the model, and
+            the tree is kept to render the expected resolv.conf files.
+            The dns-clients are removed by tearDown if the test leaves
+            them in the model, see _remove_loaded_dns_clients.
+        """
+        linter = DnsClientLinter()
+        xml_strings = {}
+        for config_path in builder.get_config_paths():
+            xml_strings[config_path] = builder.render(config_path)
+            linter.add_xml(config_path, xml_strings[config_path])
+            for dns_client in self.find(self.test_ms, config_path,
+                                        "dns-client", assert_not_empty=False):
+                if not self._get_item_state(dns_client).startswith(
+                        "ForRemoval"):
+                    linter.add_model_dns_client(dns_client)
+        stderr = linter.get_stderr()
+        self.assertEqual([], stderr, "dns-client tree is invalid:\n{0}"
+                         .format("\n".join(stderr)))
+
+        xml_filepaths = []
+        try:
+            for config_path in builder.get_config_paths():
+                xml_filepath = "/tmp/{0}_story72.xml".format(
+                    config_path.strip("/").replace("/", "_"))
+                xml_filepaths.append(xml_filepath)
+                self.assertTrue(self.create_file_on_node(
+                    self.test_ms, xml_filepath,
+                    xml_strings[config_path].splitlines()))
+                # Items created by "litp load" are not registered for
+                # the TAF cleanup, so they are tracked here
+                self.loaded_dns_clients.append(
+                    builder.get_dns_client_path(config_path))
+                self.execute_cli_load_cmd(
+                    self.test_ms, config_path, xml_filepath, "--merge")
+        finally:
+            self.run_command(
+                self.test_ms,
+                self.dnsutils.get_remove_files_cmd(xml_filepaths))
+        self.dns_model = builder
+
+    def _remove_loaded_dns_clients(self):
+        """
+        Description:
+            Removes the dns-clients loaded by _load_dns_model which the
+            test left in the model, running a plan if any of them had
+            been applied
+        """
+        if not self.loaded_dns_clients:
+            return
+        self._invalidate_item_states()
+        states = self._get_item_states()
+        remaining = [path for path in self.loaded_dns_clients
+                     if path in states and
+                     not states[path].startswith("ForRemoval")]
+        for path in remaining:
+            self.execute_cli_remove_cmd(self.test_ms, path)
+        if any(states[path] != "Initial" for path in remaining):
+            self.execute_cli_createplan_cmd(self.test_ms)
+            self.execute_cli_runplan_cmd(self.test_ms)
+            self.assertTrue(self._wait_for_plan_state(
+                self.test_ms, test_constants.PLAN_COMPLETE))
+
+    def _copy_xml_files_to_ms(self, remote_dir="/tmp"):
+        """
+        Description:
+            Copies the XML files in xml_files/ to a directory on the MS
+            as a single compressed archive. Files whose copy on the MS
+            already has the same checksum are not copied.
+        Args:
+            remote_dir (str): The directory on the MS
+        Actions:
+            1. Compare the checksums of the files with those on the MS
+            2. Pack the changed files into a tar.gz archive
+            3. Copy the archive to the MS and unpack it
+            4. Check the checksums of the unpacked files
+        Results:
+            list of the files copied
+        """
+        filenames = list_fixtures()
+        std_out, _, _ = self.run_command(
+            self.test_ms, self.dnsutils.get_checksums_cmd(
+                remote_dir, filenames), su_root=True)
+        changed = get_changed_fixtures(
+            XML_FILES_DIR, filenames, parse_checksums(std_out))
+        if not changed:
+            return []
+
+        archive_name = "xml_files_{0}.tar.gz".format(uuid.uuid4().hex)
+        local_archive = os.path.join(tempfile.gettempdir(), archive_name)
+        remote_archive = "{0}/{1}".format(remote_dir, archive_name)
+        try:
+            pack_fixtures(XML_FILES_DIR, changed, local_archive)
+            self.assertTrue(self.copy_file_to(
+                self.test_ms, local_archive, remote_archive,
+                root_copy=True))
+        finally:
+            if os.path.exists(local_archive):
+                os.remove(local_archive)
+
+        std_out, std_err, rc = self.run_command(
+            self.test_ms, self.dnsutils.get_unpack_archive_cmd(
+                remote_archive, remote_dir, sorted(changed)), su_root=True)
+        self.assertEquals([], std_err)
+        self.assertEquals(0, rc)
+        self.assertEqual(changed, parse_checksums(std_out))
+        return sorted(changed)
+
+    def _is_tracked(self, path):
+        """
+        Description:
+            Checks whether an item is part of the dns-client tree loaded
+            by _load_dns_model, which changes to the item must be
+            applied to as well
+        Args:
+            path (str): The dns-client or nameserver path
+        """
+        return self.dns_model is not None and self.dns_model.defines(path)
+
+    def _assert_resolv_conf(self, rfile, config_path, dns_model=None,
+                            extra_lines=()):
+        """
+        Description:
+            Compares a resolv.conf file with the file expected for the
+            dns-client of a config collection, reporting every
+            mismatching line in a single failure
+        Args:
+            rfile (list): The lines of the resolv.conf file
+            config_path (str): The config collection of the dns-client
+            dns_model (DnsModelBuilder): The dns-client tree, by default
+                                         the one of the test
+            extra_lines (list): Lines expected after those of the
+                                dns-client, added outside LITP
+        """
+        dns_model = dns_model or self.dns_model
+        report = diff_resolv_conf(
+            dns_model.render_resolv_conf(config_path) + list(extra_lines),
+            rfile)
+        self.assertEqual('', report, "resolv.conf mismatch for {0}:\n{1}"
+                         .format(config_path, report))
+
+    def _probe_resolv_conf(self, node):
+        """
+        Description:
+            Returns the checksum and records of the resolv.conf file on a
+            node. The file is probed with a single command and the result
+            is reused until resolv.conf may have been rewritten, see
+            _invalidate_resolv_conf_probes.
+        Args:
+            node (str): The node to probe the file on
+        Results:
+            ResolvConf
+        """
+        probe = self.resolv_conf_probes.get(node)
+        if probe is None:
+            std_out, std_err, rc = self.node_limiter.run(
+                self.run_command, node,
+                self.dnsutils.get_resolv_conf_probe_cmd(
+                    test_constants.RESOLV_CFG_FILE), su_root=True)
+            self.assertEquals([], std_err)
+            self.assertEquals(0, rc)
+            probe = ResolvConf.from_probe_output(std_out)
+            self.resolv_conf_probes[node] = probe
+        return probe
+
+    def _invalidate_resolv_conf_probes(self):
+        """
+        Description:
+            Discards the cached resolv.conf probes, once a plan or a
+            puppet run may have rewritten the files
+        """
+        self.resolv_conf_probes = {}
+
+    def _get_item_state(self, path):
+        """
+        Description:
+            Returns the state of an item. The states of all the items in
+            the config collections are fetched with a single command and
+            reused until the model or the plan changes, see
+            _invalidate_item_states.
+        Args:
+            path (str): The path of the item
+        Results:
+            The state of the item, e.g. "Applied"
+        """
+        state = self._get_item_states().get(path)
+        if state is None:
+            return self.get_item_state(self.test_ms, path)
+        return state
+
+    def _get_item_states(self):
+        """
+        Description:
+            Returns the states of all the items in the config collections
+            of the MS and the nodes, fetched with a single command
+        Results:
+            dict of item path to state
+        """
+        if self.item_states is None:
+            topology = self._get_topology()
+            std_out, std_err, rc = self.run_command(
+                self.test_ms, self.dnsutils.get_show_subtrees_cmd(
+                    topology['ms_config_paths'] +
+                    topology['node_config_paths']))
+            self.assertEquals([], std_err)
+            self.assertEquals(0, rc)
+            self.item_states = parse_item_states(std_out)
+        return self.item_states
+
+    def _invalidate_item_states(self):
+        """
+        Description:
+            Discards the cached item states, once a CLI command or a plan
+            may have changed them
+        """
+        self.item_states = None
+
+    def _invalidating_item_states(self, method):
+        """
+        Description:
+            Returns a version of a CLI method which discards the cached
+            item states
+        Args:
+            method (callable): The CLI method, e.g. execute_cli_create_cmd
+        """
+        def invalidating(*args, **kwargs):
+            """
+            Runs the CLI method and discards the cached item states.
+            """
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._invalidate_item_states()
+        return invalidating
+
+    def _find_lines_in_resolv_conf(self, node, search_vals, positive=True):
+        """
+        Description:
+            Function to find several values in the resolv.conf file,
+            with at most one exchange with the node.
+        Args:
+            node (str) : The node to find the file on.
+            search_vals (list): values to search for
+            positive (bool): If set to true,
+                             expects to find every value in file,
+                             else does not expect to find any value in file
+        Actions:
+            1. Probes the file, unless already probed
+            2. Looks for each value in the lines of the file
+        Results:
+             if positive=True
+             Successfully finds every search value in resolv.conf
+        """
+        probe = self._probe_resolv_conf(node)
+        for search_val in search_vals:
+            self.assertEqual(
+                positive, probe.contains(search_val),
+                "'{0}' {1} in resolv.conf on {2}:\n{3}".format(
+                    search_val, "not found" if positive else "found", node,
+                    "\n".join(probe.lines())))
 
     def _find_line_in_resolv_conf(self, node, search_val, positive=True):
         """
@@ -218,103 +621,257 @@ class Story72(GenericTest):
                              expects to find search value in file,
                              else does not expect to find value in file
         Actions:
-            1. Greps for the value in the file
+            1. Looks for the value in the lines of the file
         Results:
              if positive=True
              Successfully finds search value in resolv.conf
         """
-        cmd = self.redhatutils.get_grep_file_cmd(
-            test_constants.RESOLV_CFG_FILE, search_val)
-        std_out, std_err, rc = self.run_command(node, cmd, su_root=True)
-        if positive is True:
-            self.assertEquals([], std_err)
-            self.assertNotEqual([], std_out)
-            self.assertEquals(0, rc)
-        else:
-            self.assertEquals([], std_err)
-            self.assertEquals([], std_out)
-            self.assertEquals(1, rc)
+        self._find_lines_in_resolv_conf(node, [search_val], positive)
 
-    def _assert_cli_error_message(self, err_list, result):
+    def _wait_for_plan_state(self, node, state, timeout_mins=10):
         """
         Description:
-            Check whether 'ensure_not_found' property is enabled
-
+            Waits for the plan to reach the given state. "litp show_plan"
+            is polled from a single session on the node, with a short
+            backoff, so the wait returns shortly after the state changes.
+            States with no "Plan Status" in PLAN_STATUSES are left to
+            wait_for_plan_state.
         Args:
-            err_list (list): list of error messages and paths
-            result (dict):  dictionary of error data
+            node (str): The node the plan runs on
+            state (int): The expected plan state, e.g.
+                         test_constants.PLAN_COMPLETE
+            timeout_mins (int): How long to wait for the state
+        Results:
+            True if the plan reached the expected state, otherwise False
+        """
+        self._invalidate_resolv_conf_probes()
+        self._invalidate_item_states()
+        plan_status = self.PLAN_STATUSES.get(state)
+        if plan_status is None:
+            return self.wait_for_plan_state(node, state)
+
+        cmd = self.dnsutils.get_wait_for_plan_state_cmd(
+            plan_status, timeout_mins * 60)
+        std_out, std_err, rc = self.run_command(node, cmd)
+        if rc == 0:
+            return True
+        if rc == 1:
+            self.log("info", "Plan finished in state {0}, expected {1}"
+                     .format(" ".join(std_out), plan_status))
+            return False
+        if rc == WATCH_TIMEOUT_RC:
+            self.log("info", "Plan did not reach state {0} in {1} minutes"
+                     .format(plan_status, timeout_mins))
+            return False
+        self.fail("The plan state wait failed with return code {0}:\n{1}"
+                  .format(rc, "\n".join(std_out + std_err)))
+
+    def _wait_for_puppet_to_remove(self, node, filepath, pattern,
+                                   timeout_mins=10):
         """
+        Description:
+            Triggers a puppet run on a node and waits for puppet to
+            rewrite a file so that no line matches the pattern. The
+            file is watched from a single session on the node so the
+            wait does not depend on the puppet run interval. Falls back
+            to wait_for_puppet_action only if the watch cannot be
+            started.
+        Args:
+            node (str): The node puppet manages the file on
+            filepath (str): The file puppet rewrites
+            pattern (str): The pattern puppet must remove from the file
+            timeout_mins (int): How long to wait for the rewrite
+        Results:
+            True if the pattern was removed, otherwise False
+        """
+        self._invalidate_resolv_conf_probes()
+        hostname = self._get_topology()['hostnames'][node]
+        _, std_err, rc = self.run_command(
+            self.test_ms,
+            self.dnsutils.get_trigger_puppet_run_cmd(hostname),
+            su_root=True)
+        if rc != 0:
+            # A puppet run already in progress rewrites the file too
+            self.log("info", "Could not trigger a puppet run on {0}: {1}"
+                     .format(hostname, " ".join(std_err)))
+
+        cmd = self.dnsutils.get_wait_for_line_removed_cmd(
+            filepath, pattern, timeout_mins * 60)
+        _, _, rc = self.run_command(node, cmd, su_root=True)
+        if rc == 0:
+            return True
+        if rc == WATCH_TIMEOUT_RC:
+            self.log("info", "{0} still matches {1} after {2} minutes"
+                     .format(filepath, pattern, timeout_mins))
+            return False
+        return self.wait_for_puppet_action(
+            self.test_ms, node,
+            self.redhatutils.get_grep_file_cmd(filepath, pattern), 1)
+
+    def _map_nodes(self, func, items):
+        """
+        Description:
+            Calls a function for every item in parallel, using a bounded
+            pool of worker threads. The function must only collect
+            output: assertions raised in a worker lose the step context,
+            so they are made on the main thread on the results. Node
+            commands go through self.node_limiter, which runs one command
+            at a time on each node.
+        Args:
+            func (callable): The function, called with one item
+            items (list): The items, usually nodes
+        Results:
+            list of the results, in the order of the items
+        """
+        pool = ThreadPool(max(1, min(len(items), self.MAX_PARALLEL_NODES)))
+        try:
+            return pool.map(func, items)
+        finally:
+            pool.close()
+            pool.join()
 
-        if result.get('ensure_not_found') == True:
-            self._assert_cli_error_message_not_found(err_list, result)
-        else:
-            self._assert_cli_error_message_found(err_list, result)
+    def _fetch_resolv_conf(self, node):
+        """
+        Description:
+            Runs the commands which read the resolv.conf file on a node
+            and its checksum, without checking their results. Called from
+            the worker threads of _map_nodes.
+        Args:
+            node (str): The node to read the file from
+        Results:
+            list with the stdout, stderr and return code of the read and
+            of the checksum command
+        """
+        return self.node_limiter.run_batch(
+            self.run_command, node,
+            ["/bin/cat {0}".format(test_constants.RESOLV_CFG_FILE),
+             self.dnsutils.get_checksum_cmd(
+                 test_constants.RESOLV_CFG_FILE)],
+            su_root=True)
 
-    def _assert_cli_error_message_found(self, err_list, result):
+    def _cache_resolv_conf(self, node, results):
         """
         Description:
-            Check that give path and message pair is found in error messages
+            Checks the results of _fetch_resolv_conf and caches the
+            resolv.conf file of a node together with its checksum
         Args:
-            err_list (list): list of error messages and paths
-            result (dict):  dictionary of error data
+            node (str): The node the file was read from
+            results (list): The results of _fetch_resolv_conf
+        Results:
+            The lines of the resolv.conf file
         """
+        (std_out, std_err, rc), checksum = results
+        self.assertEquals([], std_err)
+        self.assertEquals(0, rc)
+        self.resolv_conf_cache[node] = (std_out, self._parse_checksum(
+            checksum))
+        return std_out
 
-        self.assertTrue('msg' in result,
-            'Required expected error message missing in "result"')
+    def _parse_checksum(self, result):
+        """
+        Description:
+            Returns the checksum from the result of a checksum command
+        Args:
+            result (tuple): stdout, stderr and return code
+        """
+        std_out, std_err, rc = result
+        self.assertEquals([], std_err)
+        self.assertEquals(0, rc)
+        return std_out[0].split()[0]
 
-        found = False
-        if result.get('path') != None:
-            path_assert_msg = '\n{0}'.format(result['path'])
-            for i in xrange(len(err_list) - 1):
-                if err_list[i] == result.get('path') and \
-                    err_list[i + 1] == result['msg']:
-                    found = True
-                    break
-        else:
-            path_assert_msg = ''
-            for line in err_list:
-                if line == result['msg']:
-                    found = True
-                    break
+    def _fetch_resolv_conf_checksum(self, node):
+        """
+        Description:
+            Runs the command which prints the checksum of the resolv.conf
+            file on a node, without checking its result. Called from the
+            worker threads of _map_nodes.
+        Args:
+            node (str): The node
+        Results:
+            stdout, stderr and return code, see _parse_checksum
+        """
+        return self.node_limiter.run(
+            self.run_command, node, self.dnsutils.get_checksum_cmd(
+                test_constants.RESOLV_CFG_FILE), su_root=True)
 
-        assert_msg = (
-        '\nExpected error message:{0}\n{1}\nNOT found in:\n{2}'
-        .format(path_assert_msg, result['msg'], '\n'.join(err_list)))
-        self.assertTrue(found, assert_msg)
+    def _get_resolv_conf_contents(self, nodes):
+        """
+        Description:
+            Reads the resolv.conf file on all the given nodes in
+            parallel, using a bounded pool of worker threads
+        Args:
+            nodes (list): The nodes to read the file from
+        Actions:
+            1. Read resolv.conf on every node concurrently
+        Results:
+            dict mapping each node to the lines of its resolv.conf
+        """
+        nodes = list(set(nodes))
+        results = self._map_nodes(self._fetch_resolv_conf, nodes)
+        return dict((node, self._cache_resolv_conf(node, result))
+                    for node, result in zip(nodes, results))
 
-    def _assert_cli_error_message_not_found(self, err_list, result):
+    def _get_resolv_conf_contents_after_plan(self, nodes):
+        """
+        Description:
+            Reads the resolv.conf file after a plan, only on the given
+            nodes which had a DNS client task in the plan. On the other
+            nodes the file is only checked against the checksum of the
+            content read last.
+        Args:
+            nodes (list): The nodes to get the file of
+        Actions:
+            1. Find the nodes with a DNS client task in show_plan
+            2. Read resolv.conf on those nodes concurrently
+            3. Check the checksum of resolv.conf on the other nodes
+        Results:
+            dict mapping each node to the lines of its resolv.conf
+        """
+        # 1. Find the nodes with a DNS client task in show_plan
+        std_out, _, _ = self.execute_cli_showplan_cmd(self.test_ms)
+        task_hostnames = get_dns_task_hostnames(std_out)
+        hostnames = self._get_topology()['hostnames']
+        nodes = list(set(nodes))
+        unchanged = [node for node in nodes
+                     if hostnames.get(node) not in task_hostnames and
+                     node in self.resolv_conf_cache]
+
+        # 2. Read resolv.conf on those nodes concurrently
+        contents = self._get_resolv_conf_contents(
+            [node for node in nodes if node not in unchanged])
+
+        # 3. Check the checksum of resolv.conf on the other nodes
+        results = self._map_nodes(self._fetch_resolv_conf_checksum,
+                                  unchanged)
+        for node, result in zip(unchanged, results):
+            lines, cached_checksum = self.resolv_conf_cache[node]
+            self.assertEqual(
+                cached_checksum, self._parse_checksum(result),
+                "resolv.conf changed on {0} without a DNS client task"
+                .format(node))
+            contents[node] = lines
+        return contents
 
+    def _assert_cli_error_messages(self, err_list, results):
         """
         Description:
-            Check that give path and message pair is not found in
-            error messages
+            Check that the expected path and message pairs are found in
+            the error messages, or not found when 'ensure_not_found' is
+            enabled. All mismatches are reported in a single failure.
         Args:
             err_list (list): list of error messages and paths
-            result (dict):  dictionary of error data
+            results (list):  list of dictionaries of error data
         """
+        for result in results:
+            self.assertTrue(
+                'msg' in result,
+                'Required expected error message missing in "result"')
 
-        self.assertTrue('msg' in result,
-            'Required expected error message missing in "result"')
-
-        if result.get('path') != None:
-            path_assert_msg = '\n{0}'.format(result['path'])
-            for i in xrange(len(err_list) - 1):
-                if err_list[i] == result.get('path') and \
-                    err_list[i + 1] == result['msg']:
-                    found = True
-                    break
-
-        else:
-            path_assert_msg = ''
-            for line in err_list:
-                if line == result['msg']:
-                    found = True
-                    break
-
-        assert_msg = (
-        '\nExtra error message:{0}\n{1}\nfound in:\n{2}'
-        .format(path_assert_msg, result['msg'], '\n'.join(err_list)))
-        self.assertFalse(found, assert_msg)
+        missing, unexpected = CliErrorIndex(err_list).get_mismatches(results)
+        assert_msg = format_mismatches(missing, unexpected)
+        self.assertEqual(
+            '', assert_msg,
+            '{0}\nin:\n{1}'.format(assert_msg, '\n'.join(err_list)))
 
     def _execute_createplan_cmd_and_verify_msg(self, rule_sets):
         """
@@ -333,8 +890,91 @@ class Story72(GenericTest):
             _, stderr, _ = self.execute_cli_createplan_cmd(
                     self.test_ms, expect_positive=False)
 
-            for result in rule['results']:
-                self._assert_cli_error_message(stderr, result)
+            self._assert_cli_error_messages(stderr, rule['results'])
+
+    def _validate_rule_sets_on_ms(self, rule_sets):
+        """
+        Description:
+            Function that validates the invalid items of every rule set
+            with the dnsclient plugin on the MS, against a copy of the
+            dns-client items of the model, without a "litp create_plan",
+            and verifies the error messages. Every rule set is validated
+            on its own copy of the model.
+        Args:
+            rule_sets: (list) Rule sets, each with the 'items' to create
+                       (dictionaries with 'path', 'type' and 'props') and
+                       the expected 'results'
+        Actions:
+            1. Export every dns-client of the MS and the nodes into a
+               directory on the MS
+            2. Copy model_validator.py and the rule sets to the directory
+            3. Run model_validator.py on the MS
+            4. Remove the directory
+        """
+        topology = self._get_topology()
+        remote_dir = "/tmp/dns_client_validator_{0}".format(
+            uuid.uuid4().hex)
+        local_request = os.path.join(
+            tempfile.gettempdir(), os.path.basename(remote_dir) + ".json")
+        request = {
+            'node_paths': list(topology['node_urls']),
+            'exports': [],
+            'rule_sets': [[{'path': item['path'], 'type': item['type'],
+                            'props': parse_props(item['props'])}
+                           for item in rule['items']]
+                          for rule in rule_sets]}
+        try:
+            # 1. Export every dns-client into a directory on the MS
+            _, std_err, rc = self.run_command(
+                self.test_ms, self.dnsutils.get_make_dir_cmd(remote_dir))
+            self.assertEquals([], std_err)
+            self.assertEquals(0, rc)
+            for config_path in topology['ms_config_paths'] + \
+                    topology['node_config_paths']:
+                for dns_client in self.find(self.test_ms, config_path,
+                                            "dns-client",
+                                            assert_not_empty=False):
+                    xml_filepath = "{0}/dns_client_{1}.xml".format(
+                        remote_dir, len(request['exports']))
+                    self.execute_cli_export_cmd(
+                        self.test_ms, dns_client, xml_filepath)
+                    request['exports'].append([config_path, xml_filepath])
+
+            # 2. Copy model_validator.py and the rule sets to the MS
+            with open(local_request, "w") as request_file:
+                json.dump(request, request_file)
+            for local_filepath, filename in (
+                    (MODEL_VALIDATOR_SCRIPT, "model_validator.py"),
+                    (local_request, "request.json")):
+                self.assertTrue(self.copy_file_to(
+                    self.test_ms, local_filepath,
+                    "{0}/{1}".format(remote_dir, filename), root_copy=True))
+
+            # 3. Run model_validator.py on the MS
+            std_out, std_err, rc = self.run_command(
+                self.test_ms, self.dnsutils.get_model_validator_cmd(
+                    remote_dir + "/model_validator.py",
+                    remote_dir + "/request.json"), su_root=True)
+            self.assertEquals([], std_err)
+            self.assertEquals(0, rc)
+            stderrs = json.loads("\n".join(std_out))
+        finally:
+            # 4. Remove the directory
+            if os.path.exists(local_request):
+                os.remove(local_request)
+            self.run_command(self.test_ms,
+                             self.dnsutils.get_remove_dir_cmd(remote_dir),
+                             su_root=True)
+
+        self.assertEqual(len(rule_sets), len(stderrs))
+        failures = []
+        for rule, stderr in zip(rule_sets, stderrs):
+            report = format_mismatches(
+                *CliErrorIndex(stderr).get_mismatches(rule['results']))
+            if report:
+                failures.append("\n*** {0}{1}\nin:\n{2}".format(
+                    rule['description'], report, '\n'.join(stderr)))
+        self.assertEqual([], failures, ''.join(failures))
 
     def _execute_create_cmd_and_verify_msg(self, rule_sets, url_link,
                                            alias_name):
@@ -358,8 +998,7 @@ class Story72(GenericTest):
                            self.test_ms, url_link, alias_name,
                            rule['param'], expect_positive=False)
 
-            for result in rule['results']:
-                self._assert_cli_error_message(stderr, result)
+            self._assert_cli_error_messages(stderr, rule['results'])
 
     def _execute_update_cmd_and_verify_msg(self, rule_sets, alias):
         """
@@ -380,8 +1019,7 @@ class Story72(GenericTest):
                     self.test_ms, alias, rule['param'],
                     expect_positive=False)
 
-            for result in rule['results']:
-                self._assert_cli_error_message(stderr, result)
+            self._assert_cli_error_messages(stderr, rule['results'])
 
     def _execute_remove_cmd_and_verify_msg(self, rule_sets, item_path):
         """
@@ -400,8 +1038,7 @@ class Story72(GenericTest):
             _, stderr, _ = self.execute_cli_remove_cmd(
                     self.test_ms, item_path, expect_positive=False)
 
-            for result in rule['results']:
-                self._assert_cli_error_message(stderr, result)
+            self._assert_cli_error_messages(stderr, rule['results'])
 
     @attr('all', 'non-revert', 'story72', 'story72_tc01', 'story370237',
           'story370237_tc14', 'story370237_tc15', 'story370237_tc17')
@@ -548,14 +1185,11 @@ class Story72(GenericTest):
         self._get_managed_nodes()
 
         # Find the desired collection on the MS
-        collection_type = "collection-of-node-config"
-        config_path = self.find(
-            self.test_ms, "/ms", collection_type)
+        config_path = self._get_topology()['ms_config_paths']
         ms_config_path = config_path[0]
 
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", collection_type)
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
         n2_config_path = config_path[1]
 
@@ -574,7 +1208,6 @@ class Story72(GenericTest):
         ms_n1_ip2 = "10.10.10.110"
 
         n1_search1 = "d1.com,d2.com,d3.com,d4.com,d5.com,d6.com"
-        n1_search_1 = "d1.com d2.com d3.com d4.com d5.com d6.com"
         n1_search2 = "d6.com,d5.com,d4.com,d3.com,d2.com,d1.com"
         n1_search_2 = "d6.com d5.com d4.com d3.com d2.com d1.com"
         n1_n1_ip1 = "10.10.10.101"
@@ -593,65 +1226,69 @@ class Story72(GenericTest):
         # ip as a nameserver, see TORF-462156
         gateway_ip = "192.168.0.1"
 
+        builder = DnsModelBuilder()
+
         # 1. Create dns-client on MS with search property if not found
-        ms_config_path = self.find(
-            self.test_ms, "/ms", collection_type)[0]
-        ms_dns_client = self._create_dns_client(
+        ms_config_path = self._get_topology()['ms_config_paths'][0]
+        ms_dns_client = builder.add_dns_client(
             ms_config_path, "mstest01a", search="{0}".format(ms_search1))
 
         # 2. Create nameserver on the MS with the ip property set to the
         #    gateway address and the position property set to 2
         props = "ipaddress={0} position=2".format(gateway_ip)
-        self._create_nameserver(
+        builder.add_nameserver(
                       ms_dns_client, "gw_name_server", props)
 
         # 3. Create nameserver2 on the MS with the ip property set to an
         #    IPv4 address and the position property set to 3
         props = "ipaddress={0} position=3".format(ms_n1_ip1)
-        ms_namesrv2 = self._create_nameserver(
+        ms_namesrv2 = builder.add_nameserver(
                       ms_dns_client, "nameserver_01a", props)
 
         # 4. Create dns-client on nodeX with the search property
         #    defined with 6 domains
-        n1_dns_client = self._create_dns_client(
+        n1_dns_client = builder.add_dns_client(
             n1_config_path, "n1test01a",
             search="{0}".format(n1_search1))
 
         # 5. Create nameserver1 on nodeX with the ip property set to the
         #    gateway address and the position property set to 1
         props = "ipaddress={0} position=1".format(gateway_ip)
-        n1_namesrv1 = self._create_nameserver(
+        n1_namesrv1 = builder.add_nameserver(
                             n1_dns_client, "gw_name_server", props)
 
         # 6. Create nameserver2 on nodeX with the ip property set to an
         # IPv6 address with prefix and the position property set to 3
         props = "ipaddress={0}/{1} position=3".format(n1_n2_ip1,
                                                       n1_n2_ip1_prefix)
-        self._create_nameserver(
+        builder.add_nameserver(
             n1_dns_client, "nameserver_01b", props)
 
         # 7. Create nameserver3 on nodeX with the ip property set to an
         # IPv4 address and the position property set to 2
         props = "ipaddress={0} position=2".format(n1_n1_ip1)
-        n1_namesrv3 = self._create_nameserver(
+        n1_namesrv3 = builder.add_nameserver(
             n1_dns_client, "nameserver_01a", props)
 
         # 8. Create dns-client on nodeY without the search property defined
-        n2_dns_client = self._create_dns_client(
+        n2_dns_client = builder.add_dns_client(
             n2_config_path, "n2test01a")
 
         # 9. Create nameserver1 on nodeY with the ip property set to an
         #    IPv6 address and the position property set to 3
         props = "ipaddress={0} position=3".format(n2_n1_ip1)
-        n2_namesrv1 = self._create_nameserver(
+        n2_namesrv1 = builder.add_nameserver(
             n2_dns_client, "nameserver_01a", props)
 
         # 10. Create nameserver2 on nodeY with the ip property set to
         #     gateway address and the position property set to 1
         props = "ipaddress={0} position=1".format(gateway_ip)
-        n2_namesrv2 = self._create_nameserver(
+        n2_namesrv2 = builder.add_nameserver(
                       n2_dns_client, "gw_name_server", props)
 
+        # Load the dns-client model in one pass
+        self._load_dns_model(builder)
+
         # 11.Create plan
         self.execute_cli_createplan_cmd(self.test_ms)
 
@@ -659,19 +1296,16 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
+        rfiles = self._get_resolv_conf_contents_after_plan(
+            [self.test_ms, self.test_node1, self.test_node2])
+
         # 13.Check the resolv.conf on the MS:
         # Check that the domain was added to the resolv.conf on the MS
         # Check that the nameserver was added to the resolv.conf on the MS
-        rfile = self.get_file_contents(
-                    self.test_ms,
-                    test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile), 3)
-        self.assertEqual("search {0}".format(ms_search1), rfile[0])
-        self.assertEqual("nameserver {0}".format(gateway_ip), rfile[1])
-        self.assertEqual("nameserver {0}".format(ms_n1_ip1), rfile[2])
+        self._assert_resolv_conf(rfiles[self.test_ms], ms_config_path)
 
         # 14.Check the resolv.conf on nodeX:
         #  Check that the domains added to the resolv.conf on NodeX
@@ -679,29 +1313,13 @@ class Story72(GenericTest):
         #  Check that the nameservers are added to the resolv.conf on NodeX
         # in the order they were specified via the position property
         # Check Ipv6 address is present without CIDR prefix
-        rfile_n1 = self.get_file_contents(
-                self.test_node1,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 4)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(gateway_ip), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n1_ip1), rfile_n1[2])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[3])
-        self.assertNotEqual("nameserver {0}/{1}".format(n1_n2_ip1,
-                                            n1_n2_ip1_prefix), rfile_n1[3],
-            "resolv.conf contain IPv6 address with CIDR prefix, not expected")
+        self._assert_resolv_conf(rfiles[self.test_node1], n1_config_path)
 
         # 15.Check the resolv.conf on nodeY:
         # Check that search is not specified in the resolv.conf on NodeY
         # Check that the nameservers are added to the resolv.conf on NodeY
         # in the order they were specified via the position property
-        rfile_n2 = self.get_file_contents(
-                self.test_node2,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n2), 2)
-        self.assertEqual("nameserver {0}".format(gateway_ip), rfile_n2[0])
-        self.assertEqual("nameserver {0}".format(n2_n1_ip1), rfile_n2[1])
+        self._assert_resolv_conf(rfiles[self.test_node2], n2_config_path)
 
         # 16.Add nameserver3 on nodeY with the ip property set to an
         # IPv6 address and the position property set to 3
@@ -740,51 +1358,30 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
+        rfiles = self._get_resolv_conf_contents_after_plan(
+            [self.test_ms, self.test_node1, self.test_node2])
+
         # 25.Check the resolv.conf on the MS:
         # Check that the search line is replaced with "search bar.com"
-        rfile = self.get_file_contents(
-            self.test_ms,
-            test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile), 3)
-        self.assertEqual("search {0}".format(ms_search2), rfile[0])
-        self.assertEqual("nameserver {0}".format(gateway_ip), rfile[1])
-        self.assertEqual("nameserver {0}".format(ms_n1_ip2), rfile[2])
+        self._assert_resolv_conf(rfiles[self.test_ms], ms_config_path)
 
         # 26.Check the resolv.conf on nodeX:
         # Check that the domains added to the resolv.conf on NodeX are in
         # the order they were specified
         # Check IPv6 address is present without CIDR prefix
-        rfile_n1 = self.get_file_contents(
-                self.test_node1,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 4)
-        self.assertEqual(
-            "search {0}".format(n1_search_2), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(gateway_ip), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip2), rfile_n1[2])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[3])
-        self.assertNotEqual("nameserver {0}/{1}".format(n1_n3_ip2,
-                                        n1_n3_ip2_prefix), rfile_n1[3],
-             "resolv.conf contain IPv6 address with CIDR prefix, not expected")
+        self._assert_resolv_conf(rfiles[self.test_node1], n1_config_path)
 
         # 27.Check the resolv.conf on nodeY:
         # Check that the nameservers are added to the resolv.conf on NodeY
         # in the order they were specified via the position property
         # Check that the search line, "search amm.com" is added
-        rfile_n2 = self.get_file_contents(
-                self.test_node2,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n2), 4)
-        self.assertEqual("search {0}".format(n2_search1), rfile_n2[0])
-        self.assertEqual("nameserver {0}".format(gateway_ip), rfile_n2[1])
-        self.assertEqual("nameserver {0}".format(n2_n1_ip1), rfile_n2[2])
-        self.assertEqual("nameserver {0}".format(n2_n3_ip1), rfile_n2[3])
+        self._assert_resolv_conf(rfiles[self.test_node2], n2_config_path)
 
         # 28.Remove nameserver1 from nodeX
-        self.execute_cli_remove_cmd(self.test_ms, n1_namesrv1)
+        self._remove_nameserver(n1_namesrv1)
 
         # 29.Remove the search property from the dns-client on nodeX
         self._update_dns_client_remove_search_prop(n1_dns_client)
@@ -796,7 +1393,7 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 32.Check nameserver1 has been removed from the
@@ -804,9 +1401,7 @@ class Story72(GenericTest):
         rfile_n1 = self.get_file_contents(
                 self.test_node1,
                 test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 2)
-        self.assertEqual("nameserver {0}".format(n1_n3_ip2), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[1])
+        self._assert_resolv_conf(rfile_n1, n1_config_path)
 
         # 33.Check the search line has been removed from resolv.conf
         self._find_line_in_resolv_conf(
@@ -833,35 +1428,21 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 40.Check resolv.conf on MS
-        self._find_line_in_resolv_conf(
-            self.test_ms, ms_search2, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_ms, ms_n1_ip2, positive=False)
+        self._find_lines_in_resolv_conf(
+            self.test_ms, [ms_search2, ms_n1_ip2], positive=False)
 
         # 41.Check resolv.conf on NodeX
-        self._find_line_in_resolv_conf(
-            self.test_node1, n1_n2_ip1, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_node1, n1_n3_ip1, positive=False)
+        self._find_lines_in_resolv_conf(
+            self.test_node1, [n1_n2_ip1, n1_n3_ip1], positive=False)
 
         # 42.Check resolv.conf on NodeY
-        self._find_line_in_resolv_conf(
-            self.test_node2, n2_search1, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_node2, n2_n1_ip1, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_node2, n2_n2_ip1, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_node2, n2_n3_ip1, positive=False)
+        self._find_lines_in_resolv_conf(
+            self.test_node2, [n2_search1, n2_n1_ip1, n2_n2_ip1, n2_n3_ip1],
+            positive=False)
 
     @attr('all', 'non-revert', 'story72', 'story72_tc02')
     def test_02_n_nameserver_validation_negative(self):
@@ -954,8 +1535,7 @@ class Story72(GenericTest):
         self._get_managed_nodes()
 
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", "collection-of-node-config")
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
 
         # Backup resolv.conf file
@@ -1393,8 +1973,7 @@ class Story72(GenericTest):
         self._get_managed_nodes()
 
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", "collection-of-node-config")
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
         n2_config_path = config_path[1]
 
@@ -1446,7 +2025,7 @@ class Story72(GenericTest):
 
             # 9. Check the dns-client is in state initial
             self.assertEqual(
-                self.get_item_state(self.test_ms, n2_dns_client), "Initial")
+                self._get_item_state(n2_dns_client), "Initial")
 
             # 10. load the nameserver item-type into the model using --merge
             self.execute_cli_load_cmd(
@@ -1455,7 +2034,7 @@ class Story72(GenericTest):
 
             # 11. Check the nameserver is in state initial
             self.assertEqual(
-                self.get_item_state(self.test_ms, n2_namesrv1), "Initial")
+                self._get_item_state(n2_namesrv1), "Initial")
 
             # 12. load the nameserver item-type into the model using --replace
             self.execute_cli_load_cmd(
@@ -1464,7 +2043,7 @@ class Story72(GenericTest):
 
             # 13. Check the nameserver is in state initial
             self.assertEqual(
-                self.get_item_state(self.test_ms, n2_namesrv1), "Initial")
+                self._get_item_state(n2_namesrv1), "Initial")
 
             # 14. Copy xml files onto the MS
             #   XML files contain
@@ -1473,17 +2052,7 @@ class Story72(GenericTest):
             #   ==> an updated nameserver ip and position property
             #   ==> removed nameserver
             #   ==> Created nameserver
-            xml_filenames = \
-                    ['xml_dns_client_1_story72.xml',
-                     'xml_dns_client_2_story72.xml']
-            local_filepath = os.path.dirname(__file__)
-            for xml_filename in xml_filenames:
-                local_xml_filepath = local_filepath + "/xml_files/" + \
-                    xml_filename
-                xml_filepath = "/tmp/" + xml_filename
-                self.assertTrue(self.copy_file_to(
-                    self.test_ms, local_xml_filepath, xml_filepath,
-                    root_copy=True))
+            self._copy_xml_files_to_ms("/tmp")
 
             # 15. Load xml file using the --merge
             self.execute_cli_load_cmd(
@@ -1492,7 +2061,7 @@ class Story72(GenericTest):
 
             # 16. Check the created dns-client is in state "initial"
             self.assertEqual(
-                self.get_item_state(self.test_ms, n1_dns_client), "Initial")
+                self._get_item_state(n1_dns_client), "Initial")
 
             # 17. Load xml file using the --replace
             self.execute_cli_load_cmd(
@@ -1506,7 +2075,7 @@ class Story72(GenericTest):
             self.execute_cli_runplan_cmd(self.test_ms)
 
             # Wait for plan to complete
-            self.assertTrue(self.wait_for_plan_state(
+            self.assertTrue(self._wait_for_plan_state(
                 self.test_ms, test_constants.PLAN_COMPLETE))
 
             self.execute_cli_removeplan_cmd(self.test_ms)
@@ -1514,29 +2083,38 @@ class Story72(GenericTest):
             # 20. Check state of items in tree
             self.assertTrue(self.is_all_applied(self.test_ms))
 
+            rfiles = self._get_resolv_conf_contents(
+                [self.test_node1, self.test_node2])
+
+            # The dns-clients are those of the XML files, with the
+            # nameserver of nodeY kept by --merge
+            expected = DnsModelBuilder()
+            expected.add_dns_client(n1_config_path, "n1dns_client03a")
+            expected.add_nameserver(
+                n1_dns_client, "n1_nameserver_03a",
+                'ipaddress="10.10.10.101" position="3"')
+            expected.add_nameserver(
+                n1_dns_client, "_n1_nameserver_03b",
+                'ipaddress="0:0:0:0:0:ffff:a0a:a66" position="2"')
+            expected.add_dns_client(
+                n2_config_path, "n2dns_client03a", search="bar.com")
+            expected.add_nameserver(
+                n2_dns_client, "new_nameserver3a",
+                'ipaddress="10.10.10.10" position="1"')
+            expected.add_nameserver(
+                n2_dns_client, "new_nameserver3b",
+                'ipaddress="0:0:0:0:0:ffff:a0a:a67" position="2"')
+            expected.add_nameserver(
+                n2_dns_client, "nameserver_03a",
+                'ipaddress="10.10.10.201" position="3"')
+
             # 21. Check resolv.conf on node1
-            rfile_n1 = self.get_file_contents(
-                self.test_node1,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-            self.assertEqual(len(rfile_n1), 2)
-            self.assertEqual(
-                "nameserver 0:0:0:0:0:ffff:a0a:a66", rfile_n1[0])
-            self.assertEqual(
-                "nameserver 10.10.10.101", rfile_n1[1])
+            self._assert_resolv_conf(
+                rfiles[self.test_node1], n1_config_path, expected)
 
             # 22. Check resolv.conf on node2
-            rfile_n2 = self.get_file_contents(
-                self.test_node2,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-            self.assertEqual(len(rfile_n2), 4)
-            self.assertEqual(
-                "search bar.com", rfile_n2[0])
-            self.assertEqual(
-                "nameserver 10.10.10.10", rfile_n2[1])
-            self.assertEqual(
-                "nameserver 0:0:0:0:0:ffff:a0a:a67", rfile_n2[2])
-            self.assertEqual(
-            "nameserver 10.10.10.201", rfile_n2[3])
+            self._assert_resolv_conf(
+                rfiles[self.test_node2], n2_config_path, expected)
 
         finally:
             # 23. Remove all items that were loaded
@@ -1567,7 +2145,7 @@ class Story72(GenericTest):
             @result:    resolv.conf file updated outside LITP.
             @step:      Check nameserver has been added
             @result:    Nameserver added to resolv.conf file by user.
-            @step:      Wait for a puppet run and check that manual update has
+            @step:      Trigger a puppet run and check that manual update has
                         been removed.
             @result:    Manual updated removed after puppet run replaces
                         resolv.conf file.
@@ -1580,8 +2158,7 @@ class Story72(GenericTest):
         self._get_managed_nodes()
 
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", "collection-of-node-config")
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
 
         # Backup resolv.conf file
@@ -1592,6 +2169,9 @@ class Story72(GenericTest):
         self.backup_file(
             self.test_node2, test_constants.RESOLV_CFG_FILE)
 
+        # Track the dns-client tree to render the expected resolv.conf
+        self.dns_model = DnsModelBuilder()
+
         # 1. Create a dns-config on nodeX
         n1_dns_client = self._create_dns_client(
             n1_config_path, "n1test04a",
@@ -1609,16 +2189,14 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 5. Check nameserver has been added
         rfile_n1 = self.get_file_contents(
                 self.test_node1,
                 test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 2)
-        self.assertEqual("search d1.com", rfile_n1[0])
-        self.assertEqual("nameserver 10.10.10.101", rfile_n1[1])
+        self._assert_resolv_conf(rfile_n1, n1_config_path)
 
         # 6. Manually update /etc/resolv.conf
         std_out, std_err, rc = self.run_command(
@@ -1634,20 +2212,15 @@ class Story72(GenericTest):
         rfile_n1 = self.get_file_contents(
                 self.test_node1,
                 test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 3)
-        self.assertEqual("search d1.com", rfile_n1[0])
-        self.assertEqual("nameserver 10.10.10.101", rfile_n1[1])
-        self.assertEqual("nameserver 172.11.10.12", rfile_n1[2])
+        self._assert_resolv_conf(rfile_n1, n1_config_path,
+                                 extra_lines=["nameserver 172.11.10.12"])
 
-        # 8. Wait for a puppet run and check that manual
+        # 8. Trigger a puppet run and check that manual
         # update has been removed
-        cmd_to_run = \
-            self.redhatutils.get_grep_file_cmd(
-            test_constants.RESOLV_CFG_FILE, "172.11.10.12")
-
         self.assertTrue(
-            self.wait_for_puppet_action(
-            self.test_ms, self.test_node1, cmd_to_run, 1))
+            self._wait_for_puppet_to_remove(
+                self.test_node1, test_constants.RESOLV_CFG_FILE,
+                "172.11.10.12"))
 
     @attr('all', 'non-revert', 'story72', 'story72_tc06',
                'cdb-only', 'cdb_priority1')
@@ -1733,14 +2306,11 @@ class Story72(GenericTest):
         self._get_managed_nodes()
 
         # Find the desired collection on the MS
-        collection_type = "collection-of-node-config"
-        config_path = self.find(
-            self.test_ms, "/ms", collection_type)
+        config_path = self._get_topology()['ms_config_paths']
         ms_config_path = config_path[0]
 
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", collection_type)
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
 
         # Backup resolv.conf file
@@ -1770,40 +2340,45 @@ class Story72(GenericTest):
                                         path,
                                         'online_timeout=45')
 
+        builder = DnsModelBuilder()
+
         # 1. Create dns-client on MS with search property
-        ms_dns_client = self._create_dns_client(
+        ms_dns_client = builder.add_dns_client(
             ms_config_path, "mstest01a", search="{0}".format(ms_search1))
 
         # 2. Create nameserver1 on the MS with the ip property set to an
         #    IPv4 address and the position property set to 3
         props = "ipaddress={0} position=3".format(ms_n1_ip1)
-        self._create_nameserver(
+        builder.add_nameserver(
             ms_dns_client, "nameserver_01a", props)
 
         # 3. Create dns-client on nodeX with the search property
         #    defined with 6 domains
-        n1_dns_client = self._create_dns_client(
+        n1_dns_client = builder.add_dns_client(
             n1_config_path, "n1test01a",
             search="{0}".format(n1_search1))
 
         # 4. Create nameserver1 on nodeX with the ip property set to an
         #    IPv4 address and the position property set to 1
         props = "ipaddress={0} position=1".format(n1_n1_ip1)
-        n1_namesrv1 = self._create_nameserver(
+        n1_namesrv1 = builder.add_nameserver(
             n1_dns_client, "nameserver_01a", props)
 
         # 5. Create nameserver2 on nodeX with the ip property set to an
         # IPv6 address and the position property set to 3
         props = "ipaddress={0} position=3".format(n1_n2_ip1)
-        self._create_nameserver(
+        builder.add_nameserver(
             n1_dns_client, "nameserver_01b", props)
 
         # 6. Create nameserver3 on nodeX with the ip property set to an
         # IPv4 address and the position property set to 2
         props = "ipaddress={0} position=2".format(n1_n3_ip1)
-        self._create_nameserver(
+        builder.add_nameserver(
             n1_dns_client, "nameserver_01c", props)
 
+        # Load the dns-client model in one pass
+        self._load_dns_model(builder)
+
         # 7.Create plan
         self.execute_cli_createplan_cmd(self.test_ms)
 
@@ -1811,36 +2386,26 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
+        rfiles = self._get_resolv_conf_contents_after_plan(
+            [self.test_ms, self.test_node1])
+
         # 9.Check the resolv.conf on the MS:
         # Check that the domain was added to the resolv.conf on the MS
         # Check that the nameserver was added to the resolv.conf on the MS
-        rfile = self.get_file_contents(
-                    self.test_ms,
-                    test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile), 2)
-        self.assertEqual("search {0}".format(ms_search1), rfile[0])
-        self.assertEqual("nameserver {0}".format(ms_n1_ip1), rfile[1])
+        self._assert_resolv_conf(rfiles[self.test_ms], ms_config_path)
 
         # 10.Check the resolv.conf on nodeX:
         #  Check that the domains added to the resolv.conf on NodeX
         #  in the order they were specified
         #  Check that the nameservers are added to the resolv.conf on NodeX
         # in the order they were specified via the position property
-        rfile_n1 = self.get_file_contents(
-                self.test_node1,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 4)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n1_ip1), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip1), rfile_n1[2])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[3])
+        self._assert_resolv_conf(rfiles[self.test_node1], n1_config_path)
 
         # 11.Remove nameserver1 from nodeX
-        self.execute_cli_remove_cmd(self.test_ms, n1_namesrv1)
+        self._remove_nameserver(n1_namesrv1)
 
         # 12.Remove the search property from the dns-client on the MS
         self._update_dns_client_remove_search_prop(ms_dns_client)
@@ -1852,7 +2417,7 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 15.Check nameserver1 has been removed from the
@@ -1860,11 +2425,7 @@ class Story72(GenericTest):
         rfile_n1 = self.get_file_contents(
                 self.test_node1,
                 test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 3)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip1), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[2])
+        self._assert_resolv_conf(rfile_n1, n1_config_path)
 
         # 16.Check the search line has been removed from resolv.conf
         self._find_line_in_resolv_conf(
@@ -1883,25 +2444,19 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 21.Check resolv.conf on MS
-        self._find_line_in_resolv_conf(
-            self.test_ms, ms_search1, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_ms, ms_n1_ip1, positive=False)
+        self._find_lines_in_resolv_conf(
+            self.test_ms, [ms_search1, ms_n1_ip1], positive=False)
 
         # 22.Check resolv.conf on NodeX
         self._find_line_in_resolv_conf(
                     self.test_ms, n1_search_1, positive=False)
 
-        self._find_line_in_resolv_conf(
-            self.test_node1, n1_n2_ip1, positive=False)
-
-        self._find_line_in_resolv_conf(
-            self.test_node1, n1_n3_ip1, positive=False)
+        self._find_lines_in_resolv_conf(
+            self.test_node1, [n1_n2_ip1, n1_n3_ip1], positive=False)
 
     @attr('all', 'non-revert', 'story72', 'story72_tc05')
     def test_06_p_create_remove_nameserver_ForRemoval(self):
@@ -1958,10 +2513,8 @@ class Story72(GenericTest):
         # Get Managed Nodes
         self._get_managed_nodes()
 
-        collection_type = "collection-of-node-config"
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", collection_type)
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
 
         # Backup resolv.conf file
@@ -1972,36 +2525,40 @@ class Story72(GenericTest):
 
         # Test Attributes
         n1_search1 = "d1.com,d2.com,d3.com,d4.com,d5.com,d6.com"
-        n1_search_1 = "d1.com d2.com d3.com d4.com d5.com d6.com"
         n1_n1_ip1 = "10.10.10.101"
         n1_n2_ip1 = "0:0:0:0:0:ffff:a0a:a6"
         n1_n3_ip1 = "10.10.10.103"
         n1_n4_ip1 = "10.10.10.104"
 
+        builder = DnsModelBuilder()
+
         # 1. Create dns-client on nodeX with the search property
         #    defined with 6 domains
-        n1_dns_client = self._create_dns_client(
+        n1_dns_client = builder.add_dns_client(
             n1_config_path, "n1test01a",
             search="{0}".format(n1_search1))
 
         # 2. Create nameserver1 on nodeX with the ip property set to an
         #    IPv4 address and the position property set to 1
         props = "ipaddress={0} position=1".format(n1_n1_ip1)
-        n1_namesrv1 = self._create_nameserver(
+        n1_namesrv1 = builder.add_nameserver(
             n1_dns_client, "nameserver_01a", props)
 
         # 3. Create nameserver2 on nodeX with the ip property set to an
         # IPv6 address and the position property set to 3
         props = "ipaddress={0} position=3".format(n1_n2_ip1)
-        self._create_nameserver(
+        builder.add_nameserver(
             n1_dns_client, "nameserver_01b", props)
 
         # 4. Create nameserver3 on nodeX with the ip property set to an
         # IPv4 address and the position property set to 2
         props = "ipaddress={0} position=2".format(n1_n3_ip1)
-        self._create_nameserver(
+        builder.add_nameserver(
             n1_dns_client, "nameserver_01c", props)
 
+        # Load the dns-client model in one pass
+        self._load_dns_model(builder)
+
         # 5. Create plan
         self.execute_cli_createplan_cmd(self.test_ms)
 
@@ -2009,7 +2566,7 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 7. Check the resolv.conf on nodeX:
@@ -2020,15 +2577,10 @@ class Story72(GenericTest):
         rfile_n1 = self.get_file_contents(
                 self.test_node1,
                 test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 4)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n1_ip1), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip1), rfile_n1[2])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[3])
+        self._assert_resolv_conf(rfile_n1, n1_config_path)
 
         # 8. Remove nameserver1 from nodeX
-        self.execute_cli_remove_cmd(self.test_ms, n1_namesrv1)
+        self._remove_nameserver(n1_namesrv1)
 
         # 9. Create nameserver1 on nodeX with the ip property set to an
         #    IPv4 address and the position property set to 1
@@ -2043,7 +2595,7 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 12. Check nameserver1 has been removed from the
@@ -2052,12 +2604,122 @@ class Story72(GenericTest):
         rfile_n1 = self.get_file_contents(
                 self.test_node1,
                 test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 4)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n4_ip1), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip1), rfile_n1[2])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[3])
+        self._assert_resolv_conf(rfile_n1, n1_config_path)
+
+    @attr('all', 'non-revert', 'story72', 'story72_tc08')
+    def test_08_n_nameserver_validation_in_memory(self):
+        """
+        Description:
+            Verifies the validation errors of the dnsclient plugin against
+            an in-memory copy of the model, without creating a LITP plan.
+            The validation runs on the MS, where the plugin is installed.
+        Actions:
+            1. Build the rule sets
+            2. Validate two dns-clients on nodeX
+            3. Validate two nameservers on nodeX with position 1
+            4. Validate two nameservers on the MS with position 2
+        Results:
+            The plugin reports the same errors as "litp create_plan"
+        """
+        # Find the managed node
+        self._get_managed_nodes()
+
+        # Find the desired collections on the MS and the nodes
+        ms_config_path = self._get_topology()['ms_config_paths'][0]
+        n1_config_path = self._get_topology()['node_config_paths'][0]
+
+        n1_dns_client1 = n1_config_path + "/n1test08a"
+        n1_dns_client2 = n1_config_path + "/n1test08b"
+        ms_dns_client = ms_config_path + "/mstest08a"
+
+        def nameserver(dns_client, name, ipaddress, position):
+            """
+            Returns a nameserver item of a rule set.
+            """
+            return {'path': dns_client + "/nameservers/" + name,
+                    'type': 'nameserver',
+                    'props': 'ipaddress="{0}" position="{1}"'.format(
+                        ipaddress, position)}
+
+        # 1. Build the rule sets
+        rule_sets = []
+        rule_set = {
+        'description': '1. Two dns-clients on nodeX',
+        'items': [{'path': n1_dns_client1, 'type': 'dns-client',
+                   'props': 'search="d1.com"'},
+                  nameserver(n1_dns_client1, "nameserver_08a",
+                             "10.10.10.101", 1),
+                  {'path': n1_dns_client2, 'type': 'dns-client',
+                   'props': 'search="d2.com"'},
+                  nameserver(n1_dns_client2, "nameserver_08b",
+                             "10.10.10.102", 1)],
+        'results':
+        [
+         {
+          'path': n1_dns_client1,
+          'msg': 'ValidationError    Create plan failed: Only one '
+                 '"dns-client" may be configured per node'
+          },
+         {
+          'path': n1_dns_client2,
+          'msg': 'ValidationError    Create plan failed: Only one '
+                 '"dns-client" may be configured per node'
+          }
+         ]
+        }
+        rule_sets.append(rule_set.copy())
+
+        rule_set = {
+        'description': '2. Two nameservers on nodeX with position 1',
+        'items': [{'path': n1_dns_client1, 'type': 'dns-client',
+                   'props': 'search="d1.com"'},
+                  nameserver(n1_dns_client1, "nameserver_08a",
+                             "10.10.10.101", 1),
+                  nameserver(n1_dns_client1, "nameserver_08b",
+                             "0:0:0:0:0:ffff:a0a:a77", 1)],
+        'results':
+        [
+         {
+          'path': n1_dns_client1 + "/nameservers/nameserver_08a",
+          'msg': 'ValidationError    Create plan failed: Duplicate nameserver '
+                 'position "1"'
+          },
+         {
+          'path': n1_dns_client1 + "/nameservers/nameserver_08b",
+          'msg': 'ValidationError    Create plan failed: Duplicate nameserver '
+                 'position "1"'
+          }
+         ]
+        }
+        rule_sets.append(rule_set.copy())
+
+        rule_set = {
+        'description': '3. Two nameservers on the MS with position 2',
+        'items': [{'path': ms_dns_client, 'type': 'dns-client',
+                   'props': 'search="foo.com"'},
+                  nameserver(ms_dns_client, "nameserver_08a",
+                             "10.10.10.101", 2),
+                  nameserver(ms_dns_client, "nameserver_08b",
+                             "10.10.10.102", 2)],
+        'results':
+        [
+         {
+          'path': ms_dns_client + "/nameservers/nameserver_08a",
+          'msg': 'ValidationError    Create plan failed: Duplicate nameserver '
+                 'position "2"'
+          },
+         {
+          'path': ms_dns_client + "/nameservers/nameserver_08b",
+          'msg': 'ValidationError    Create plan failed: Duplicate nameserver '
+                 'position "2"'
+          }
+         ]
+        }
+        rule_sets.append(rule_set.copy())
+
+        # 2-4. Validate every rule set against its own copy of the model
+        # on the MS and check for the expected validation errors
+        self._validate_rule_sets_on_ms(rule_sets)
 
     # @attr('all', 'non-revert', 'story72', 'story72_t07')
     def obsolete_07_p_create_update_remove_nameserver_stop_plan(self):
@@ -2120,10 +2782,8 @@ class Story72(GenericTest):
         # Get Managed Nodes
         self._get_managed_nodes()
 
-        collection_type = "collection-of-node-config"
         # Find the desired collection on the nodes
-        config_path = self.find(
-            self.test_ms, "/deployments", collection_type)
+        config_path = self._get_topology()['node_config_paths']
         n1_config_path = config_path[0]
         n2_config_path = config_path[1]
 
@@ -2139,7 +2799,6 @@ class Story72(GenericTest):
         ms_n1_ip1 = "10.10.10.105"
         ms_n1_ip2 = "10.10.10.106"
         n1_search1 = "d1.com,d2.com,d3.com,d4.com,d5.com,d6.com"
-        n1_search_1 = "d1.com d2.com d3.com d4.com d5.com d6.com"
         n1_n1_ip1 = "10.10.10.101"
         n1_n2_ip1 = "0:0:0:0:0:ffff:a0a:a6"
         n1_n3_ip1 = "10.10.10.103"
@@ -2147,8 +2806,11 @@ class Story72(GenericTest):
         n2_n1_ip1 = "10.10.10.110"
         n2_n2_ip1 = "10.10.10.111"
 
+        # Track the dns-client tree to render the expected resolv.conf
+        self.dns_model = DnsModelBuilder()
+
         # 1. Create dns-client on the ms
-        ms_config_path = self.find(self.test_ms, "/ms", collection_type)[0]
+        ms_config_path = self._get_topology()['ms_config_paths'][0]
         ms_dns_client = self._create_dns_client(
             ms_config_path, "mstest01a")
 
@@ -2201,32 +2863,32 @@ class Story72(GenericTest):
         self.execute_cli_stopplan_cmd(self.test_ms)
 
         # Wait for plan to stop
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_STOPPED))
 
         # 11.Check the state of items under dns-client on ms
         #    get set to "Applied"
         #    when the ms task is completed and check other items are still
         #    in state, "Initial"
-        state = self.get_item_state(self.test_ms, ms_dns_client)
+        state = self._get_item_state(ms_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, ms_namesrv1)
+        state = self._get_item_state(ms_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "Initial")
 
         # 12.Create plan
@@ -2244,31 +2906,31 @@ class Story72(GenericTest):
         self.execute_cli_stopplan_cmd(self.test_ms)
 
         # Wait for plan to stop
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_STOPPED))
 
         # 15.Check the state of items under node2 dns-client
         #    are set to "Applied"
         #    when the node2 task has completed
-        state = self.get_item_state(self.test_ms, ms_dns_client)
+        state = self._get_item_state(ms_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, ms_namesrv1)
+        state = self._get_item_state(ms_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "Applied")
 
         # 16.Create plan
@@ -2278,57 +2940,43 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 18.Check the state of items under dns-client get set to "Applied"
         #    when the task is completed
-        state = self.get_item_state(self.test_ms, ms_dns_client)
+        state = self._get_item_state(ms_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, ms_namesrv1)
+        state = self._get_item_state(ms_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "Applied")
 
+        rfiles = self._get_resolv_conf_contents(
+            [self.test_ms, self.test_node1, self.test_node2])
+
         # 19.Check the resolv.conf on the nodes:
         #    Check that the domains added to the resolv.conf on NodeX
         #    in the order they were specified
         #    Check that the nameservers are added to the resolv.conf on NodeX
         #    in the order they were specified via the position property
-        rfile_ms = self.get_file_contents(
-                self.test_ms,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_ms), 1)
-        self.assertEqual("nameserver {0}".format(ms_n1_ip1), rfile_ms[0])
-
-        rfile_n1 = self.get_file_contents(
-                self.test_node1,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 3)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n1_ip1), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip1), rfile_n1[2])
-
-        rfile_n2 = self.get_file_contents(
-                self.test_node2,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n2), 1)
-        self.assertEqual("nameserver {0}".format(n2_n1_ip1), rfile_n2[0])
+        self._assert_resolv_conf(rfiles[self.test_ms], ms_config_path)
+        self._assert_resolv_conf(rfiles[self.test_node1], n1_config_path)
+        self._assert_resolv_conf(rfiles[self.test_node2], n2_config_path)
 
         # 20.Update the ip address of the nameserver on the ms
         self._update_nameserver_props(
@@ -2364,37 +3012,37 @@ class Story72(GenericTest):
         self.execute_cli_stopplan_cmd(self.test_ms)
 
         # Wait for plan to stop
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_STOPPED))
 
         # 27.Check the state of items under node2 dns-client
         #    are set to "Applied"
         #    when the node2 task has completed
-        state = self.get_item_state(self.test_ms, ms_dns_client)
+        state = self._get_item_state(ms_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, ms_namesrv1)
+        state = self._get_item_state(ms_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv2)
+        state = self._get_item_state(n1_namesrv2)
         self.assertEqual(state, "Initial")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "Updated")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv2)
+        state = self._get_item_state(n2_namesrv2)
         self.assertEqual(state, "Applied")
 
         # 28.Create plan
@@ -2404,59 +3052,43 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         # 30.Check the state of items under dns-client get set to "Applied"
         #    when the task is completed
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv2)
+        state = self._get_item_state(n1_namesrv2)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv2)
+        state = self._get_item_state(n2_namesrv2)
         self.assertEqual(state, "Applied")
 
+        rfiles = self._get_resolv_conf_contents(
+            [self.test_ms, self.test_node1, self.test_node2])
+
         # 31.Check the resolv.conf on nodeX:
         #    Check that the domains added to the resolv.conf on NodeX
         #    in the order they were specified
         #    Check that the nameservers are added to the resolv.conf on NodeX
         #    in the order they were specified via the position property
-        rfile_ms = self.get_file_contents(
-                self.test_ms,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_ms), 1)
-        self.assertEqual("nameserver {0}".format(ms_n1_ip2), rfile_ms[0])
-
-        rfile_n1 = self.get_file_contents(
-                self.test_node1,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n1), 4)
-        self.assertEqual(
-            "search {0}".format(n1_search_1), rfile_n1[0])
-        self.assertEqual("nameserver {0}".format(n1_n1_ip1), rfile_n1[1])
-        self.assertEqual("nameserver {0}".format(n1_n2_ip1), rfile_n1[2])
-        self.assertEqual("nameserver {0}".format(n1_n3_ip2), rfile_n1[3])
-
-        rfile_n2 = self.get_file_contents(
-                self.test_node2,
-                test_constants.RESOLV_CFG_FILE, su_root=True)
-        self.assertEqual(len(rfile_n2), 2)
-        self.assertEqual("nameserver {0}".format(n2_n1_ip1), rfile_n2[0])
-        self.assertEqual("nameserver {0}".format(n2_n2_ip1), rfile_n2[1])
+        self._assert_resolv_conf(rfiles[self.test_ms], ms_config_path)
+        self._assert_resolv_conf(rfiles[self.test_node1], n1_config_path)
+        self._assert_resolv_conf(rfiles[self.test_node2], n2_config_path)
 
         # 32.Remove dns-client from nodeX
         self.execute_cli_remove_cmd(self.test_ms, n1_dns_client)
@@ -2481,31 +3113,31 @@ class Story72(GenericTest):
         self.execute_cli_stopplan_cmd(self.test_ms)
 
         # Wait for plan to stop
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_STOPPED))
 
         # 37.Check the state of items under dns-client have been removed"
         #    when the task is completed
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "ForRemoval")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "ForRemoval")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv2)
+        state = self._get_item_state(n1_namesrv2)
         self.assertEqual(state, "ForRemoval")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "ForRemoval")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "ForRemoval (deployment of properties "
                                 "indeterminable)")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv2)
+        state = self._get_item_state(n2_namesrv2)
         self.assertEqual(state, "Applied")
 
         # 38.Create plan
@@ -2522,32 +3154,32 @@ class Story72(GenericTest):
         self.execute_cli_stopplan_cmd(self.test_ms)
 
         # Wait for plan to stop
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_STOPPED))
 
-        state = self.get_item_state(self.test_ms, n1_dns_client)
+        state = self._get_item_state(n1_dns_client)
         self.assertEqual(state, "ForRemoval (deployment of properties "
                                 "indeterminable)")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv1)
+        state = self._get_item_state(n1_namesrv1)
         self.assertEqual(state, "ForRemoval (deployment of properties "
                                 "indeterminable)")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv2)
+        state = self._get_item_state(n1_namesrv2)
         self.assertEqual(state, "ForRemoval (deployment of properties "
                                 "indeterminable)")
 
-        state = self.get_item_state(self.test_ms, n1_namesrv3)
+        state = self._get_item_state(n1_namesrv3)
         self.assertEqual(state, "ForRemoval (deployment of properties "
                                 "indeterminable)")
 
-        state = self.get_item_state(self.test_ms, n2_dns_client)
+        state = self._get_item_state(n2_dns_client)
         self.assertEqual(state, "Applied")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv1)
+        state = self._get_item_state(n2_namesrv1)
         self.assertEqual(state, "ForRemoval")
 
-        state = self.get_item_state(self.test_ms, n2_namesrv2)
+        state = self._get_item_state(n2_namesrv2)
         self.assertEqual(state, "Applied")
 
         # 41.Create plan
@@ -2557,7 +3189,7 @@ class Story72(GenericTest):
         self.execute_cli_runplan_cmd(self.test_ms)
 
         # Wait for plan to complete
-        self.assertTrue(self.wait_for_plan_state(
+        self.assertTrue(self._wait_for_plan_state(
             self.test_ms, test_constants.PLAN_COMPLETE))
 
         self.execute_cli_show_cmd(
@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Generates dns-client XML for "litp load" throughput tests.
+            The XML is written element by element, so memory use stays
+            flat however many dns-clients are generated. Item ids start
+            with "dnsgen_" so they do not collide with deployed items.
+
+            The "configs" layout writes a single config collection with
+            all the dns-clients, to be merged into an existing node:
+                litp load -p /deployments/d1/clusters/c1/nodes/n1 \\
+                    -f dns_clients.xml --merge
+            Only one dns-client per node passes create_plan, so more
+            than one is for "litp load" throughput only and must be
+            removed before a plan is created.
+            The "dns-client" layout writes one dns-client document per
+            file, like xml_dns_client_1_story72.xml, to be loaded into
+            the config collection of a node each.
+
+Usage:
+    python xml_fixture_generator.py --dns-clients 5000 \\
+        --mix ipv4=2,ipv6=1,cidr=1 --search-domains 6 \\
+        --output dns_clients.xml
+'''
+
+import argparse
+import collections
+import os
+import random
+import sys
+from xml.sax.saxutils import XMLGenerator
+
+from dns_client_linter import MAX_NAMESERVERS, MAX_SEARCH_DOMAINS, \
+    MAX_SEARCH_LENGTH
+
+LITP_NS_URI = "http://www.ericsson.com/litp"
+XSI_NS_URI = "http://www.w3.org/2001/XMLSchema-instance"
+ADDRESS_TYPES = ("ipv4", "ipv6", "cidr")
+ID_PREFIX = "dnsgen_"
+
+
+def parse_mix(mix):
+    """
+    Description:
+        Parses a nameserver mix such as "ipv4=2,ipv6=1,cidr=1"
+    Args:
+        mix (str): The weight of each address type
+    Results:
+        list of (address type, weight)
+    """
+    weights = []
+    for part in mix.split(","):
+        address_type, _, weight = part.partition("=")
+        address_type = address_type.strip()
+        if address_type not in ADDRESS_TYPES:
+            raise ValueError("Unknown address type {0}, expected one of "
+                             "{1}".format(address_type, ADDRESS_TYPES))
+        weights.append((address_type, int(weight or 1)))
+    if not any(weight > 0 for _, weight in weights):
+        raise ValueError("No address type in mix {0}".format(mix))
+    return weights
+
+
+def get_dns_id(index):
+    """
+    Description:
+        Returns the id of a generated dns-client
+    Args:
+        index (int): The index of the dns-client
+    """
+    return "{0}{1}".format(ID_PREFIX, index)
+
+
+def get_ipaddress(address_type, index, position):
+    """
+    Description:
+        Returns a valid nameserver address, unique per dns-client and
+        position
+    Args:
+        address_type (str): "ipv4", "ipv6" or "cidr"
+        index (int): The index of the dns-client
+        position (int): The position of the nameserver
+    """
+    if address_type == "ipv4":
+        return "10.{0}.{1}.{2}".format(
+            (index // 256) % 256, index % 256, position)
+    address = "fd00::{0:x}:{1}".format(index, position)
+    if address_type == "cidr":
+        return address + "/64"
+    return address
+
+
+class DnsClientXmlWriter(object):
+    """
+    Incremental writer of dns-client XML, in the format of "litp export".
+    Every element is written as soon as it is complete.
+    """
+
+    def __init__(self, out):
+        """
+        Args:
+            out (file): The file to write to, opened in binary mode
+        """
+        self._xml = XMLGenerator(out, "utf-8")
+        self._depth = 0
+
+    def _indent(self):
+        """
+        Description:
+            Writes the line break and indentation of the next element
+        """
+        self._xml.ignorableWhitespace("\n" + "  " * self._depth)
+
+    def _start(self, tag, item_id, root=False):
+        """
+        Description:
+            Writes the start tag of a LITP item element
+        """
+        if root:
+            # The attributes of the root as written by "litp export"
+            attrs = collections.OrderedDict([
+                ("xmlns:xsi", XSI_NS_URI),
+                ("xmlns:litp", LITP_NS_URI),
+                ("xsi:schemaLocation", "{0} litp-xml-schema/litp.xsd"
+                 .format(LITP_NS_URI)),
+                ("id", item_id)])
+        else:
+            self._indent()
+            attrs = {"id": item_id}
+        self._xml.startElement("litp:" + tag, attrs)
+        self._depth += 1
+
+    def _end(self, tag):
+        """
+        Description:
+            Writes the end tag of a LITP item element
+        """
+        self._depth -= 1
+        self._indent()
+        self._xml.endElement("litp:" + tag)
+
+    def _property(self, name, value):
+        """
+        Description:
+            Writes a property element
+        """
+        self._indent()
+        self._xml.startElement(name, {})
+        self._xml.characters(value)
+        self._xml.endElement(name)
+
+    def start_document(self, tag, item_id):
+        """
+        Description:
+            Writes the XML declaration and the start tag of the root
+            element
+        Args:
+            tag (str): The item type of the root, without namespace
+            item_id (str): The id of the root item
+        """
+        self._xml.startDocument()
+        self._start(tag, item_id, root=True)
+
+    def end_document(self, tag):
+        """
+        Description:
+            Writes the end tag of the root element
+        Args:
+            tag (str): The item type of the root, without namespace
+        """
+        self._end(tag)
+        self._xml.ignorableWhitespace("\n")
+        self._xml.endDocument()
+
+    def write_dns_client_body(self, search, nameservers):
+        """
+        Description:
+            Writes the properties and nameservers of a dns-client whose
+            start tag has been written
+        Args:
+            search (str): The search property, or None
+            nameservers (list): (id, ipaddress, position) per nameserver
+        """
+        if search:
+            self._property("search", search)
+        self._start("dns-client-nameservers-collection", "nameservers")
+        for nameserver_id, ipaddress, position in nameservers:
+            self._start("nameserver", nameserver_id)
+            self._property("ipaddress", ipaddress)
+            self._property("position", str(position))
+            self._end("nameserver")
+        self._end("dns-client-nameservers-collection")
+
+    def write_dns_client(self, dns_id, search, nameservers):
+        """
+        Description:
+            Writes a dns-client element below the current element
+        Args:
+            dns_id (str): The id of the dns-client
+            search (str): The search property, or None
+            nameservers (list): (id, ipaddress, position) per nameserver
+        """
+        self._start("dns-client", dns_id)
+        self.write_dns_client_body(search, nameservers)
+        self._end("dns-client")
+
+
+class DnsClientFixtures(object):
+    """
+    The generated dns-clients. The address types of the
+    nameservers are drawn from the mix with a seeded random generator,
+    so the same options always give the same XML.
+    """
+
+    def __init__(self, nameservers=MAX_NAMESERVERS, mix="ipv4=1",
+                 search_domains=2, domain="example.com", seed=72):
+        """
+        Args:
+            nameservers (int): The number of nameservers per dns-client
+            mix (str): The weight of each address type, see parse_mix
+            search_domains (int): The number of search domains per
+                                  dns-client
+            domain (str): The parent domain of the search domains
+            seed (int): The seed of the random generator
+        """
+        if not 1 <= nameservers <= MAX_NAMESERVERS:
+            raise ValueError("nameservers must be 1 to {0}".format(
+                MAX_NAMESERVERS))
+        if not 0 <= search_domains <= MAX_SEARCH_DOMAINS:
+            raise ValueError("search domains must be 0 to {0}".format(
+                MAX_SEARCH_DOMAINS))
+        self.nameservers = nameservers
+        self.search_domains = search_domains
+        self.domain = domain
+        self._types = []
+        for address_type, weight in parse_mix(mix):
+            self._types.extend([address_type] * weight)
+        self._random = random.Random(seed)
+
+    def get_search(self, index):
+        """
+        Description:
+            Returns the search property of a dns-client, or None
+        Raises:
+            ValueError if the search is longer than LITP allows
+        """
+        if not self.search_domains:
+            return None
+        search = ",".join("s{0}.c{1}.{2}".format(domain, index,
+                                                 self.domain)
+                          for domain in range(1, self.search_domains + 1))
+        if len(search) > MAX_SEARCH_LENGTH:
+            raise ValueError("The search of dns-client {0} is {1} "
+                             "characters, more than {2}".format(
+                                 index, len(search), MAX_SEARCH_LENGTH))
+        return search
+
+    def check_search(self, count):
+        """
+        Description:
+            Checks the search of the last of count dns-clients, the
+            longest, before anything is written
+        Raises:
+            ValueError if the search is longer than LITP allows
+        """
+        self.get_search(count)
+
+    def get_nameservers(self, index):
+        """
+        Description:
+            Returns the nameservers of a dns-client
+        Results:
+            list of (id, ipaddress, position)
+        """
+        return [("nameserver{0}".format(position),
+                 get_ipaddress(self._random.choice(self._types),
+                               index, position),
+                 position)
+                for position in range(1, self.nameservers + 1)]
+
+
+def write_configs_xml(out, fixtures, count):
+    """
+    Description:
+        Writes a config collection with count dns-clients
+    Args:
+        out (file): The file to write to, opened in binary mode
+        fixtures (DnsClientFixtures): The dns-clients
+        count (int): The number of dns-clients
+    """
+    fixtures.check_search(count)
+    writer = DnsClientXmlWriter(out)
+    writer.start_document("node-configs-collection", "configs")
+    for index in range(1, count + 1):
+        writer.write_dns_client(get_dns_id(index), fixtures.get_search(index),
+                                fixtures.get_nameservers(index))
+    writer.end_document("node-configs-collection")
+
+
+def write_dns_client_xml(out, fixtures, index):
+    """
+    Description:
+        Writes a dns-client document
+    Args:
+        out (file): The file to write to, opened in binary mode
+        fixtures (DnsClientFixtures): The dns-clients
+        index (int): The index of the dns-client
+    """
+    writer = DnsClientXmlWriter(out)
+    writer.start_document("dns-client", get_dns_id(index))
+    writer.write_dns_client_body(fixtures.get_search(index),
+                                 fixtures.get_nameservers(index))
+    writer.end_document("dns-client")
+
+
+def main(argv=None):
+    """
+    Description:
+        Writes the XML for the requested number of dns-clients
+    """
+    parser = argparse.ArgumentParser(
+        description="Generates dns-client XML for litp load tests")
+    parser.add_argument("--dns-clients", type=int, default=1000,
+                        help="The number of dns-clients")
+    parser.add_argument("--nameservers", type=int, default=MAX_NAMESERVERS,
+                        help="The number of nameservers per dns-client")
+    parser.add_argument("--mix", default="ipv4=1",
+                        help="The weight of each nameserver address type, "
+                             "e.g. ipv4=2,ipv6=1,cidr=1")
+    parser.add_argument("--search-domains", type=int, default=2,
+                        help="The number of search domains per "
+                             "dns-client")
+    parser.add_argument("--domain", default="example.com",
+                        help="The parent domain of the search domains")
+    parser.add_argument("--seed", type=int, default=72,
+                        help="The seed of the address type choice")
+    parser.add_argument("--layout", choices=("configs", "dns-client"),
+                        default="configs",
+                        help="A single config collection, or one "
+                             "dns-client document per file")
+    parser.add_argument("--output", default="dns_clients.xml",
+                        help="The XML file, or the directory of the "
+                             "dns-client documents")
+    args = parser.parse_args(argv)
+
+    fixtures = DnsClientFixtures(args.nameservers, args.mix,
+                                 args.search_domains, args.domain,
+                                 args.seed)
+    if args.layout == "configs":
+        with open(args.output, "wb") as out:
+            write_configs_xml(out, fixtures, args.dns_clients)
+        print("Wrote {0} dns-clients to {1} ({2} bytes)".format(
+            args.dns_clients, args.output, os.path.getsize(args.output)))
+        return 0
+
+    fixtures.check_search(args.dns_clients)
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+    for index in range(1, args.dns_clients + 1):
+        filepath = os.path.join(
+            args.output, "xml_{0}.xml".format(get_dns_id(index)))
+        with open(filepath, "wb") as out:
+            write_dns_client_xml(out, fixtures, index)
+    print("Wrote {0} dns-client documents to {1}".format(
+        args.dns_clients, args.output))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
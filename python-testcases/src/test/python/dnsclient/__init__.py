@@ -0,0 +1,14 @@
+"""
+Unit tests of the dnsclient testset helpers, run locally without an MS:
+
+    python -m unittest discover -s python-testcases/src/test/python
+
+The helpers are imported the way the testsets import them, from the
+dnsclient resources directory.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "..", "main", "resources", "dnsclient"))
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Unit tests of DnsClientLinter, with the negative cases of
+            test_02 of testset_story72_370237.py
+'''
+
+import os
+import unittest
+
+from dns_client_linter import DnsClientLinter
+from fixture_transfer import XML_FILES_DIR, list_fixtures
+
+N1_CONFIGS = "/deployments/d1/clusters/c1/nodes/n1/configs"
+DNS_CLIENT = N1_CONFIGS + "/n1test02a"
+NAMESERVERS = DNS_CLIENT + "/nameservers"
+
+MIN_CARDINALITY = ('CardinalityError    Create plan failed: This collection '
+                   'requires a minimum of 1 items not marked for removal')
+MAX_CARDINALITY = ('CardinalityError    Create plan failed: This collection '
+                   'requires a maximum of 3 items not marked for removal')
+ONE_PER_NODE = ('ValidationError    Create plan failed: Only one '
+                '"dns-client" may be configured per node')
+DUPLICATE_POSITION = ('ValidationError    Create plan failed: Duplicate '
+                      'nameserver position "{0}"')
+
+
+class DnsClientLinterTest(unittest.TestCase):
+    """
+    The errors of DnsClientLinter against those test_02 expects from
+    "litp create" and "litp create_plan".
+    """
+
+    def setUp(self):
+        self.linter = DnsClientLinter()
+        self.linter.add_dns_client(DNS_CLIENT, 'search="d1.com"')
+
+    def _add_nameservers(self, *positions):
+        """
+        Description:
+            Adds a valid nameserver at each position
+        Results:
+            The nameserver paths
+        """
+        paths = []
+        for index, position in enumerate(positions, 1):
+            path = "{0}/ns{1}".format(NAMESERVERS, index)
+            self.linter.add_nameserver(
+                path, 'ipaddress="10.10.10.10{0}" position="{1}"'.format(
+                    index, position))
+            paths.append(path)
+        return paths
+
+    def _assert_nameserver_errors(self, props, expected):
+        """
+        Description:
+            Asserts the errors of "litp create" for a nameserver
+        Args:
+            props (str): The nameserver properties, in CLI format
+            expected (list): The error messages
+        """
+        linter = DnsClientLinter()
+        linter.add_dns_client(DNS_CLIENT, None)
+        linter.add_nameserver(NAMESERVERS + "/nameserver_02a", props)
+        errors = [error for error in linter.lint()
+                  if error[0] == NAMESERVERS + "/nameserver_02a"]
+        self.assertEqual(sorted(expected),
+                         sorted(message for _, message in errors))
+
+    def test_empty_nameservers(self):
+        """
+        Description:
+            Rule 1: a dns-client needs a nameserver
+        """
+        self.assertEqual([(NAMESERVERS, MIN_CARDINALITY)],
+                         self.linter.lint())
+
+    def test_invalid_nameserver_properties(self):
+        """
+        Description:
+            Rules 2, 3, 4, 7 and 8: missing and invalid nameserver
+            properties
+        """
+        self._assert_nameserver_errors(
+            'ipaddress="10.10.10.101"',
+            ['MissingRequiredPropertyError in property: "position"    '
+             'ItemType "nameserver" is required to have a property with '
+             'name "position"'])
+        self._assert_nameserver_errors(
+            'ipaddress="10.10.10.101" position="a"',
+            ['ValidationError in property: "position"    '
+             'Invalid value \'a\'.'])
+        self._assert_nameserver_errors(
+            'ipaddress="10.10.10.101" position="10"',
+            ['ValidationError in property: "position"    '
+             'Invalid value \'10\'.'])
+        self._assert_nameserver_errors(
+            'position="2"',
+            ['MissingRequiredPropertyError in property: "ipaddress"    '
+             'ItemType "nameserver" is required to have a property with '
+             'name "ipaddress"'])
+        self._assert_nameserver_errors(
+            'ipaddress="10:10:10:101" position="10"',
+            ['ValidationError in property: "position"    '
+             'Invalid value \'10\'.',
+             'ValidationError in property: "ipaddress"    '
+             'Invalid IP address value \'10:10:10:101\''])
+
+    def test_valid_nameservers(self):
+        """
+        Description:
+            IPv4, IPv6 and IPv6 with a prefix are accepted
+        """
+        for index, ipaddress in enumerate(
+                ("10.10.10.101", "0:0:0:0:0:ffff:a0a:a77",
+                 "fe80::baca:3ff:fe7c:8dd3/64"), 1):
+            self.linter.add_nameserver(
+                "{0}/ns{1}".format(NAMESERVERS, index),
+                'ipaddress="{0}" position="{1}"'.format(ipaddress, index))
+        self.assertEqual([], self.linter.lint())
+
+    def test_two_dns_clients(self):
+        """
+        Description:
+            Rule 5: only one dns-client per node
+        """
+        self._add_nameservers(1)
+        dns2 = N1_CONFIGS + "/dns2"
+        self.linter.add_dns_client(dns2, 'search="d2.com"')
+        self.assertEqual(sorted([(DNS_CLIENT, ONE_PER_NODE),
+                                 (dns2, ONE_PER_NODE),
+                                 (dns2 + "/nameservers", MIN_CARDINALITY)]),
+                         sorted(self.linter.lint()))
+
+    def test_dns_client_in_model(self):
+        """
+        Description:
+            Rule 6: a dns-client already in the model counts towards the
+            one dns-client per node rule
+        """
+        self._add_nameservers(1)
+        dns2 = N1_CONFIGS + "/dns2"
+        self.linter.add_model_dns_client(dns2)
+        self.assertEqual(sorted([(DNS_CLIENT, ONE_PER_NODE),
+                                 (dns2, ONE_PER_NODE)]),
+                         sorted(self.linter.lint()))
+
+    def test_dns_client_in_model_merged(self):
+        """
+        Description:
+            A dns-client merged into itself is not counted twice
+        """
+        self._add_nameservers(1)
+        self.linter.add_model_dns_client(DNS_CLIENT)
+        self.linter.add_model_dns_client(
+            "/deployments/d1/clusters/c1/nodes/n2/configs/dns2")
+        self.assertEqual([], self.linter.lint())
+
+    def test_duplicate_position(self):
+        """
+        Description:
+            Rule 9: nameserver positions are unique
+        """
+        ns1, ns2 = self._add_nameservers(1, 1)
+        self.assertEqual(sorted([(ns1, DUPLICATE_POSITION.format(1)),
+                                 (ns2, DUPLICATE_POSITION.format(1))]),
+                         sorted(self.linter.lint()))
+
+    def test_four_nameservers(self):
+        """
+        Description:
+            Rule 10: at most 3 nameservers
+        """
+        _, _, ns3, ns4 = self._add_nameservers(1, 2, 3, 3)
+        self.assertEqual(sorted([(NAMESERVERS, MAX_CARDINALITY),
+                                 (ns3, DUPLICATE_POSITION.format(3)),
+                                 (ns4, DUPLICATE_POSITION.format(3))]),
+                         sorted(self.linter.lint()))
+
+    def test_search(self):
+        """
+        Description:
+            Rules 11 and 12: at most 6 search domains and 256 characters
+        """
+        linter = DnsClientLinter()
+        linter.add_dns_client(
+            DNS_CLIENT,
+            'search="d1.com,d2.com,d3.com,d4.com,d5.com,d6.com,d7.com"')
+        linter.add_dns_client(N1_CONFIGS + "/long",
+                              'search="{0}.com"'.format("a" * 253))
+        errors = [message for _, message in linter.lint()
+                  if message.startswith("ValidationError in property")]
+        self.assertEqual(
+            ['ValidationError in property: "search"    A maximum of 6 '
+             'domains per search may be specified',
+             'ValidationError in property: "search"    Length of property '
+             'cannot be more than 256 characters'], errors)
+
+    def test_nameserver_without_dns_client(self):
+        """
+        Description:
+            A nameserver below a dns-client not added is reported
+        """
+        path = N1_CONFIGS + "/missing/nameservers/ns1"
+        self.linter.add_nameserver(
+            path, 'ipaddress="10.10.10.101" position="1"')
+        self.assertIn((N1_CONFIGS + "/missing",
+                       'InvalidLocationError    Not found'),
+                      self.linter.lint())
+
+    def test_get_stderr(self):
+        """
+        Description:
+            The errors are formatted as path and message lines
+        """
+        self.assertEqual([NAMESERVERS, MIN_CARDINALITY],
+                         self.linter.get_stderr())
+
+    def test_xml_fixtures(self):
+        """
+        Description:
+            The XML fixtures of test_03 are valid
+        """
+        for index, filename in enumerate(list_fixtures(), 1):
+            linter = DnsClientLinter()
+            linter.add_xml_file(
+                "/deployments/d1/clusters/c1/nodes/n{0}/configs".format(
+                    index), os.path.join(XML_FILES_DIR, filename))
+            self.assertEqual([], linter.lint(), filename)
+
+    def test_xml_not_dns_client(self):
+        """
+        Description:
+            Only dns-client documents are accepted
+        """
+        self.assertRaises(
+            ValueError, self.linter.add_xml, N1_CONFIGS,
+            '<litp:nameserver xmlns:litp="http://www.ericsson.com/litp" '
+            'id="ns1"/>')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Unit tests of item_state_utils.py, with the output of
+            "litp show -r" for a dns-client part way through removal
+'''
+
+import unittest
+
+from item_state_utils import parse_item_states
+
+DNS_CLIENT = "/deployments/d1/clusters/c1/nodes/n1/configs/n1test07a"
+NAMESERVERS = DNS_CLIENT + "/nameservers"
+NAMESERVER = NAMESERVERS + "/nameserver_07a"
+INDETERMINABLE = "ForRemoval (deployment of properties indeterminable)"
+
+SHOW_LINES = [
+    DNS_CLIENT,
+    "    type: dns-client",
+    "    state: Applied",
+    "    properties:",
+    "        search: d1.com",
+    NAMESERVERS,
+    "    type: collection-of-nameserver",
+    "    state: ForRemoval",
+    NAMESERVER,
+    "    type: nameserver",
+    "    state: {0}".format(INDETERMINABLE),
+    "    properties:",
+    "        ipaddress: 10.10.10.101",
+    "        position: 1",
+]
+
+
+class ParseItemStatesTest(unittest.TestCase):
+    """
+    The item states read by parse_item_states.
+    """
+
+    def test_states(self):
+        """
+        Description:
+            Every item gets its state, with the explanation in brackets
+            of a bracketed state kept
+        """
+        self.assertEqual({DNS_CLIENT: "Applied",
+                          NAMESERVERS: "ForRemoval",
+                          NAMESERVER: INDETERMINABLE},
+                         parse_item_states(SHOW_LINES))
+
+    def test_several_commands(self):
+        """
+        Description:
+            The output of several "litp show -r" commands is read as one
+        """
+        self.assertEqual(
+            {DNS_CLIENT: "Applied", NAMESERVERS: "ForRemoval",
+             NAMESERVER: INDETERMINABLE},
+            parse_item_states(SHOW_LINES[:8] + [""] + SHOW_LINES[8:]))
+
+    def test_no_items(self):
+        """
+        Description:
+            A state line before any item path is ignored
+        """
+        self.assertEqual({}, parse_item_states(["    state: Applied"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Unit tests of load_throughput.py
+'''
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from load_throughput import CSV_FIELDS, ThroughputRecorder, count_items, \
+    parse_timed_output
+from xml_fixture_generator import DnsClientFixtures, write_configs_xml
+
+
+class LoadThroughputTest(unittest.TestCase):
+    """
+    The local side of the litp load benchmark.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_parse_timed_output(self):
+        """
+        Description:
+            The output, elapsed time and exit code of a timed command
+        """
+        self.assertEqual(
+            (["out"], 1.5, 0),
+            parse_timed_output(["out", "elapsed_ns:1500000000", "rc:0"]))
+        self.assertEqual(
+            ([], 0.25, 1),
+            parse_timed_output(["elapsed_ns:250000000", "rc:1"]))
+        self.assertRaises(ValueError, parse_timed_output, ["out"])
+
+    def test_count_items(self):
+        """
+        Description:
+            The items below the root of a generated config collection: a
+            dns-client, its nameserver collection and its nameservers
+        """
+        filepath = os.path.join(self.directory, "configs.xml")
+        with open(filepath, "wb") as out:
+            write_configs_xml(out, DnsClientFixtures(nameservers=2), 10)
+        self.assertEqual(40, count_items(filepath))
+
+    def test_write(self):
+        """
+        Description:
+            The records are appended to the CSV, with a single header
+        """
+        for _ in range(2):
+            recorder = ThroughputRecorder("test_01")
+            recorder.config_items = 12
+            record = recorder.record("load", "/n1", 0.5, 2048, 100,
+                                     "--merge")
+            self.assertEqual("200.0", record['items_per_sec'])
+            filepath = recorder.write(self.directory)
+        with open(filepath) as csv_file:
+            rows = list(csv.reader(csv_file))
+        self.assertEqual([list(CSV_FIELDS)], rows[:1])
+        self.assertEqual(3, len(rows))
+        self.assertEqual(None, ThroughputRecorder("test_02").write(
+            self.directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
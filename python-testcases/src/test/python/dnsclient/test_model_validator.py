@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Unit tests of model_validator.py, with the LITP classes
+            replaced by stubs that apply the one dns-client per node rule
+'''
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from model_validator import ModelValidator, main
+
+N1_PATH = "/deployments/d1/clusters/c1/nodes/n1"
+N1_CONFIGS = N1_PATH + "/configs"
+N2_CONFIGS = "/deployments/d1/clusters/c1/nodes/n2/configs"
+ONE_PER_NODE = ('ValidationError    Create plan failed: Only one '
+                '"dns-client" may be configured per node')
+SEARCH_TOO_LONG = ('ValidationError in property: "search"    Search is '
+                   'too long')
+EXPORTED_XML = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<litp:dns-client xmlns:litp="http://www.ericsson.com/litp" '
+    'id="dns_a">\n'
+    '  <search>a.com</search>\n'
+    '  <litp:dns-client-nameservers-collection id="nameservers">\n'
+    '    <litp:nameserver id="ns1">\n'
+    '      <ipaddress>10.10.10.1</ipaddress>\n'
+    '      <position>1</position>\n'
+    '    </litp:nameserver>\n'
+    '  </litp:dns-client-nameservers-collection>\n'
+    '</litp:dns-client>\n')
+
+
+class StubError(object):
+    """
+    A LITP ValidationError.
+    """
+
+    def __init__(self, item_path, error_message, property_name=None):
+        self.item_path = item_path
+        self.error_type = "ValidationError"
+        self.error_message = error_message
+        self.property_name = property_name
+
+
+class StubModelManager(object):
+    """
+    A LITP model manager that refuses a search over 256 characters.
+    """
+
+    def __init__(self):
+        self.items = {}
+
+    def get_item(self, path):
+        return self.items.get(path)
+
+    def create_item(self, item_type, path, **properties):
+        if len(properties.get("search", "")) > 256:
+            return [StubError(path, "Search is too long", "search")]
+        self.items[path] = (item_type, properties)
+        return self.items[path]
+
+
+class StubPluginManager(object):
+    """
+    A LITP plugin manager that ignores the types added.
+    """
+
+    def __init__(self, model_manager):
+        self.model_manager = model_manager
+
+    def add_property_types(self, property_types):
+        pass
+
+    def add_item_types(self, item_types):
+        pass
+
+    def add_default_model(self):
+        pass
+
+
+class StubExtension(object):
+    """
+    A LITP model extension with no types.
+    """
+
+    def define_property_types(self):
+        return []
+
+    def define_item_types(self):
+        return []
+
+
+class StubPluginApiContext(object):
+    """
+    A LITP plugin API context over a stub model manager.
+    """
+
+    def __init__(self, model_manager):
+        self.model_manager = model_manager
+
+
+class StubDnsclientPlugin(object):
+    """
+    A dnsclient plugin that only applies the one dns-client per node rule.
+    """
+
+    def validate_model(self, plugin_api_context):
+        items = plugin_api_context.model_manager.items
+        errors = []
+        for node_path in [path for path in items if items[path][0] == "node"]:
+            dns_clients = sorted(
+                path for path in items if items[path][0] == "dns-client" and
+                path.startswith(node_path + "/"))
+            if len(dns_clients) > 1:
+                errors.extend(StubError(path, 'Only one "dns-client" may '
+                                        'be configured per node')
+                              for path in dns_clients)
+        return errors
+
+
+STUB_LITP = {
+    'ModelManager': StubModelManager,
+    'PluginManager': StubPluginManager,
+    'PluginApiContext': StubPluginApiContext,
+    'CoreExtension': StubExtension,
+    'DnsclientExtension': StubExtension,
+    'DnsclientPlugin': StubDnsclientPlugin,
+}
+
+
+class StdoutCapture(object):
+    """
+    Collects what is written to sys.stdout.
+    """
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, text):
+        self.written.append(text)
+
+
+class ModelValidatorTest(unittest.TestCase):
+    """
+    ModelValidator and its script mode against the stub LITP classes.
+    """
+
+    def setUp(self):
+        self.validator = ModelValidator(
+            [N1_PATH, N2_CONFIGS.rsplit("/", 1)[0]], STUB_LITP)
+        self.validator.load(N1_CONFIGS, EXPORTED_XML)
+
+    def test_load(self):
+        """
+        Description:
+            The items of an export are loaded with their properties, the
+            collections left out
+        """
+        self.assertEqual(
+            [(N1_CONFIGS + "/dns_a", "dns-client", {'search': "a.com"}),
+             (N1_CONFIGS + "/dns_a/nameservers/ns1", "nameserver",
+              {'ipaddress': "10.10.10.1", 'position': "1"})],
+            self.validator.items)
+
+    def test_validate_model_errors(self):
+        """
+        Description:
+            The errors of validate_model are returned in the stderr
+            format of create_plan, and the copy is left unchanged
+        """
+        self.assertEqual([], self.validator.validate([]))
+        self.assertEqual(
+            [N1_CONFIGS + "/dns_a", ONE_PER_NODE,
+             N1_CONFIGS + "/dns_b", ONE_PER_NODE],
+            self.validator.validate([
+                {'path': N1_CONFIGS + "/dns_b", 'type': "dns-client",
+                 'props': {'search': "b.com"}}]))
+        self.assertEqual(
+            [], self.validator.validate([
+                {'path': N2_CONFIGS + "/dns_b", 'type': "dns-client",
+                 'props': {'search': "b.com"}}]))
+
+    def test_create_errors(self):
+        """
+        Description:
+            The errors of creating an item are returned in the stderr
+            format of "litp create"
+        """
+        path = N2_CONFIGS + "/dns_b"
+        self.assertEqual(
+            [path, SEARCH_TOO_LONG],
+            self.validator.validate([
+                {'path': path, 'type': "dns-client",
+                 'props': {'search': "b" * 257}}]))
+
+    def test_main(self):
+        """
+        Description:
+            The script mode validates every rule set of a request and
+            prints the errors as JSON
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            xml_filepath = os.path.join(directory, "dns_a.xml")
+            with open(xml_filepath, "w") as xml_file:
+                xml_file.write(EXPORTED_XML)
+            request_filepath = os.path.join(directory, "request.json")
+            with open(request_filepath, "w") as request_file:
+                json.dump({
+                    'node_paths': [N1_PATH],
+                    'exports': [[N1_CONFIGS, xml_filepath]],
+                    'rule_sets': [
+                        [],
+                        [{'path': N1_CONFIGS + "/dns_b",
+                          'type': "dns-client", 'props': {}}]]},
+                    request_file)
+            stdout = StdoutCapture()
+            sys.stdout, saved_stdout = stdout, sys.stdout
+            try:
+                self.assertEqual(0, main([request_filepath], STUB_LITP))
+            finally:
+                sys.stdout = saved_stdout
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(
+            [[], [N1_CONFIGS + "/dns_a", ONE_PER_NODE,
+                  N1_CONFIGS + "/dns_b", ONE_PER_NODE]],
+            json.loads("".join(stdout.written)))
+
+
+if __name__ == '__main__':
+    unittest.main()
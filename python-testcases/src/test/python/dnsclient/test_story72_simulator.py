@@ -0,0 +1,429 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   The scenarios of test_01 to test_06 of
+            testset_story72_370237.py run against LitpSimulator, as a
+            pre-gate which needs no MS or nodes, and the plan stop
+            behaviour of the simulator
+'''
+
+import unittest
+
+from litp_simulator import LitpSimulator
+from plan_task_utils import get_dns_tasks
+
+MS_CONFIGS = "/ms/configs"
+N1_CONFIGS = "/deployments/d1/clusters/c1/nodes/n1/configs"
+N2_CONFIGS = "/deployments/d1/clusters/c1/nodes/n2/configs"
+SIX_DOMAINS = "a.com,b.com,c.com,d.com,e.com,f.com"
+
+
+class Story72SimulatorTest(unittest.TestCase):
+    """
+    The Story72 scenarios against the simulated LITP model.
+    """
+
+    def setUp(self):
+        self.sim = LitpSimulator(("node1", "node2"), "ms1")
+
+    def _assert_cli_ok(self, result):
+        """
+        Description:
+            Asserts that a simulated CLI call succeeded
+        """
+        _, stderr, rc = result
+        self.assertEqual(([], 0), (stderr, rc))
+
+    def _create(self, path, item_type, props=None):
+        """
+        Description:
+            Creates an item and asserts that the create succeeded
+        """
+        self._assert_cli_ok(self.sim.create(path, item_type, props))
+        return path
+
+    def _create_dns_client(self, config_path, props=None, nameservers=()):
+        """
+        Description:
+            Creates a dns-client with nameservers
+        Args:
+            config_path (str): The config collection of the node
+            props (str): The dns-client properties, in CLI format
+            nameservers (list): (id, ipaddress, position) per nameserver
+        Results:
+            The dns-client path
+        """
+        dns_path = self._create(config_path + "/dns_client", "dns-client",
+                                props)
+        for nameserver_id, ipaddress, position in nameservers:
+            self._create("{0}/nameservers/{1}".format(dns_path,
+                                                      nameserver_id),
+                         "nameserver", 'ipaddress="{0}" position="{1}"'
+                         .format(ipaddress, position))
+        return dns_path
+
+    def _run_plan(self):
+        """
+        Description:
+            Creates and runs a plan and asserts that it succeeded
+        """
+        self._assert_cli_ok(self.sim.create_plan())
+        self._assert_cli_ok(self.sim.run_plan())
+        self.assertEqual("Plan Status: Successful",
+                         self.sim.show_plan()[0][-1])
+
+    def _assert_states(self, paths, state):
+        """
+        Description:
+            Asserts the state of every item of a list
+        """
+        for path in paths:
+            self.assertEqual(state, self.sim.get_item_state(path), path)
+
+    def _assert_create_plan_errors(self, expected):
+        """
+        Description:
+            Asserts that create_plan fails with the given errors
+        Args:
+            expected (list): (path, message) per error
+        """
+        _, stderr, rc = self.sim.create_plan()
+        self.assertEqual(1, rc)
+        self.assertEqual(sorted(expected),
+                         sorted(zip(stderr[::2], stderr[1::2])))
+
+    def test_01_p_create_update_remove_nameserver(self):
+        """
+        Description:
+            Nameservers are written to resolv.conf by position, with IPv6
+            prefixes stripped, and updates and removals are applied
+        """
+        ms_dns = self._create_dns_client(
+            MS_CONFIGS, 'search="foo.com"',
+            [("nameserver1", "10.10.10.1", 3)])
+        n1_dns = self._create_dns_client(
+            N1_CONFIGS, 'search="{0}"'.format(SIX_DOMAINS),
+            [("nameserver1", "10.10.10.1", 1),
+             ("nameserver2", "fe80::baca:3ff:fe7c:8dd3", 3),
+             ("nameserver3", "10.10.10.102", 2)])
+        n2_dns = self._create_dns_client(
+            N2_CONFIGS, None,
+            [("nameserver1", "fe80::baca:3ff:fe7c:8dd3/64", 3),
+             ("nameserver2", "10.10.10.103", 2)])
+        self._run_plan()
+
+        self.assertEqual(["search foo.com", "nameserver 10.10.10.1"],
+                         self.sim.get_file_contents("ms1"))
+        self.assertEqual(["search a.com b.com c.com d.com e.com f.com",
+                          "nameserver 10.10.10.1",
+                          "nameserver 10.10.10.102",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node1"))
+        self.assertEqual(["nameserver 10.10.10.103",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node2"))
+
+        self._create(n2_dns + "/nameservers/nameserver3", "nameserver",
+                     'ipaddress="fe80::baca:3ff:fe7c:8dd4" position="2"')
+        self._assert_cli_ok(self.sim.update(
+            n2_dns + "/nameservers/nameserver2", 'position="1"'))
+        self._assert_cli_ok(self.sim.update(ms_dns, 'search="bar.com"'))
+        self._assert_cli_ok(self.sim.update(
+            ms_dns + "/nameservers/nameserver1", 'ipaddress="10.10.10.2"'))
+        self._assert_cli_ok(self.sim.update(
+            n1_dns + "/nameservers/nameserver1",
+            'ipaddress="fe80::baca:3ff:fe7c:8dd5/64"'))
+        self._assert_cli_ok(self.sim.update(n2_dns, 'search="amm.com"'))
+        self._assert_cli_ok(self.sim.update(
+            n1_dns, 'search="f.com,e.com,d.com,c.com,b.com,a.com"'))
+        self.assertEqual("Updated", self.sim.get_item_state(ms_dns))
+        self._run_plan()
+
+        self.assertEqual(["search bar.com", "nameserver 10.10.10.2"],
+                         self.sim.get_file_contents("ms1"))
+        self.assertEqual(["search f.com e.com d.com c.com b.com a.com",
+                          "nameserver fe80::baca:3ff:fe7c:8dd5",
+                          "nameserver 10.10.10.102",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node1"))
+        self.assertEqual(["search amm.com",
+                          "nameserver 10.10.10.103",
+                          "nameserver fe80::baca:3ff:fe7c:8dd4",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node2"))
+
+        self._assert_cli_ok(self.sim.remove(
+            n1_dns + "/nameservers/nameserver1"))
+        self._assert_cli_ok(self.sim.update(n1_dns, "search",
+                                            action_del=True))
+        self._run_plan()
+        self.assertEqual(["nameserver 10.10.10.102",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node1"))
+
+        for dns_path in (ms_dns, n1_dns, n2_dns):
+            self._assert_cli_ok(self.sim.remove(dns_path))
+            self.assertEqual("ForRemoval",
+                             self.sim.get_item_state(dns_path))
+        self._run_plan()
+        for hostname in ("ms1", "node1", "node2"):
+            self.assertEqual([], self.sim.get_file_contents(hostname))
+        self.assertEqual(None, self.sim.get_item_state(n1_dns))
+
+    def test_02_n_nameserver_validation_negative(self):
+        """
+        Description:
+            Invalid dns-clients and nameservers are rejected with the
+            errors test_02 expects
+        """
+        dns_path = self._create_dns_client(N1_CONFIGS, 'search="d1.com"')
+        self._assert_create_plan_errors([
+            (dns_path + "/nameservers",
+             'CardinalityError    Create plan failed: This collection '
+             'requires a minimum of 1 items not marked for removal')])
+
+        nameserver = dns_path + "/nameservers/nameserver_02a"
+        for props, messages in (
+                ('ipaddress="10.10.10.101"',
+                 ['MissingRequiredPropertyError in property: "position"    '
+                  'ItemType "nameserver" is required to have a property '
+                  'with name "position"']),
+                ('ipaddress="10.10.10.101" position="a"',
+                 ['ValidationError in property: "position"    '
+                  'Invalid value \'a\'.']),
+                ('ipaddress="10:10:10:101" position="10"',
+                 ['ValidationError in property: "ipaddress"    '
+                  'Invalid IP address value \'10:10:10:101\'',
+                  'ValidationError in property: "position"    '
+                  'Invalid value \'10\'.'])):
+            _, stderr, rc = self.sim.create(nameserver, "nameserver", props)
+            self.assertEqual(1, rc)
+            self.assertEqual(sorted(messages), sorted(stderr[1::2]))
+        self.assertEqual(None, self.sim.get_item_state(nameserver))
+
+        ns1 = self._create(dns_path + "/nameservers/ns1", "nameserver",
+                           'ipaddress="10.10.10.101" position="1"')
+        dns2_path = self._create(N1_CONFIGS + "/dns2", "dns-client",
+                                 'search="d2.com"')
+        one_per_node = ('ValidationError    Create plan failed: Only one '
+                        '"dns-client" may be configured per node')
+        self._assert_create_plan_errors([
+            (dns2_path + "/nameservers",
+             'CardinalityError    Create plan failed: This collection '
+             'requires a minimum of 1 items not marked for removal'),
+            (dns2_path, one_per_node),
+            (dns_path, one_per_node)])
+        self._assert_cli_ok(self.sim.remove(dns2_path))
+
+        ns2 = self._create(dns_path + "/nameservers/ns2", "nameserver",
+                           'ipaddress="10.10.10.102" position="1"')
+        duplicate = ('ValidationError    Create plan failed: Duplicate '
+                     'nameserver position "{0}"')
+        self._assert_create_plan_errors([(ns1, duplicate.format(1)),
+                                         (ns2, duplicate.format(1))])
+        self._assert_cli_ok(self.sim.update(ns2, 'position="2"'))
+
+        ns3 = self._create(dns_path + "/nameservers/ns3", "nameserver",
+                           'ipaddress="0:0:0:0:0:ffff:a0a:a77" '
+                           'position="3"')
+        ns4 = self._create(dns_path + "/nameservers/ns4", "nameserver",
+                           'ipaddress="10.10.10.104" position="3"')
+        self._assert_create_plan_errors([
+            (dns_path + "/nameservers",
+             'CardinalityError    Create plan failed: This collection '
+             'requires a maximum of 3 items not marked for removal'),
+            (ns3, duplicate.format(3)),
+            (ns4, duplicate.format(3))])
+
+        _, stderr, _ = self.sim.update(
+            dns_path, 'search="{0},g.com"'.format(SIX_DOMAINS))
+        self.assertEqual(['ValidationError in property: "search"    A '
+                          'maximum of 6 domains per search may be '
+                          'specified'], stderr[1::2])
+        _, stderr, _ = self.sim.update(
+            dns_path, 'search="{0}.com"'.format("a" * 253))
+        self.assertEqual(['ValidationError in property: "search"    Length '
+                          'of property cannot be more than 256 '
+                          'characters'], stderr[1::2])
+
+        self._assert_cli_ok(self.sim.remove(dns_path))
+        _, stderr, rc = self.sim.create_plan()
+        self.assertEqual((['DoNothingPlanError    Create plan failed: no '
+                           'tasks were generated'], 1), (stderr, rc))
+
+    def test_03_p_dns_client_export_load_xml(self):
+        """
+        Description:
+            An exported dns-client loads back into an empty config
+            collection and gives the same resolv.conf
+        """
+        dns_path = self._create_dns_client(
+            N1_CONFIGS, 'search="{0}"'.format(SIX_DOMAINS),
+            [("nameserver1", "10.10.10.1", 1),
+             ("nameserver2", "fe80::baca:3ff:fe7c:8dd3/64", 3)])
+        self._run_plan()
+        xml_string = self.sim.export(dns_path)
+        expected = self.sim.get_file_contents("node1")
+
+        self._assert_cli_ok(self.sim.remove(dns_path))
+        self._run_plan()
+        self.assertEqual([], self.sim.get_file_contents("node1"))
+
+        self._assert_cli_ok(self.sim.load(N2_CONFIGS, xml_string))
+        self._assert_cli_ok(self.sim.load(N1_CONFIGS, xml_string))
+        self._run_plan()
+        self.assertEqual(expected, self.sim.get_file_contents("node1"))
+        self.assertEqual(expected, self.sim.get_file_contents("node2"))
+        self.assertEqual(xml_string, self.sim.export(dns_path))
+
+        _, stderr, rc = self.sim.load(N1_CONFIGS + "/missing", xml_string)
+        self.assertEqual((N1_CONFIGS + "/missing", 1), (stderr[0], rc))
+
+    def test_04_p_nameserver_manually_update_resolv_conf(self):
+        """
+        Description:
+            A manual change to resolv.conf is overwritten by the next
+            puppet run
+        """
+        self._create_dns_client(N1_CONFIGS, None,
+                                [("nameserver1", "10.10.10.1", 1)])
+        self._run_plan()
+        expected = self.sim.get_file_contents("node1")
+        self.sim.resolv_conf["node1"].append("nameserver 10.10.10.254")
+
+        self.sim.run_puppet()
+        self.assertEqual(expected, self.sim.get_file_contents("node1"))
+
+    def test_05_p_create_remove_nameserver(self):
+        """
+        Description:
+            A nameserver and the search property can be removed from an
+            applied dns-client
+        """
+        ms_dns = self._create_dns_client(
+            MS_CONFIGS, 'search="foo.com"',
+            [("nameserver1", "10.10.10.1", 3)])
+        n1_dns = self._create_dns_client(
+            N1_CONFIGS, 'search="{0}"'.format(SIX_DOMAINS),
+            [("nameserver1", "10.10.10.1", 1),
+             ("nameserver2", "fe80::baca:3ff:fe7c:8dd3", 3),
+             ("nameserver3", "10.10.10.102", 2)])
+        self._run_plan()
+
+        self._assert_cli_ok(self.sim.remove(
+            n1_dns + "/nameservers/nameserver1"))
+        self._assert_cli_ok(self.sim.update(ms_dns, "search",
+                                            action_del=True))
+        self.assertEqual("Updated", self.sim.get_item_state(ms_dns))
+        self._run_plan()
+        self.assertEqual(["nameserver 10.10.10.1"],
+                         self.sim.get_file_contents("ms1"))
+        self.assertEqual(["search a.com b.com c.com d.com e.com f.com",
+                          "nameserver 10.10.10.102",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node1"))
+
+        self._assert_cli_ok(self.sim.remove(ms_dns))
+        self._assert_cli_ok(self.sim.remove(n1_dns))
+        self._run_plan()
+        self.assertEqual([], self.sim.get_file_contents("ms1"))
+        self.assertEqual([], self.sim.get_file_contents("node1"))
+
+    def test_06_p_create_remove_nameserver_ForRemoval(self):
+        """
+        Description:
+            A nameserver can be replaced in the same plan when the
+            maximum number of nameservers is configured
+        """
+        dns_path = self._create_dns_client(
+            N1_CONFIGS, 'search="{0}"'.format(SIX_DOMAINS),
+            [("nameserver1", "10.10.10.1", 1),
+             ("nameserver2", "fe80::baca:3ff:fe7c:8dd3", 3),
+             ("nameserver3", "10.10.10.102", 2)])
+        self._run_plan()
+
+        self._assert_cli_ok(self.sim.remove(
+            dns_path + "/nameservers/nameserver1"))
+        self.assertEqual("ForRemoval", self.sim.get_item_state(
+            dns_path + "/nameservers/nameserver1"))
+        self._create(dns_path + "/nameservers/nameserver4", "nameserver",
+                     'ipaddress="10.10.10.104" position="1"')
+        self._run_plan()
+        self.assertEqual(["search a.com b.com c.com d.com e.com f.com",
+                          "nameserver 10.10.10.104",
+                          "nameserver 10.10.10.102",
+                          "nameserver fe80::baca:3ff:fe7c:8dd3"],
+                         self.sim.get_file_contents("node1"))
+
+    def test_stop_plan_at_pause_points(self):
+        """
+        Description:
+            The items of a dns-client are Applied once their task has
+            run, and a plan stopped after a task leaves the remaining
+            tasks to the next plan
+        """
+        task = 'Create DNS client configuration on node "{0}"'
+        items = {}
+        for hostname, config_path, props, ipaddresses in (
+                ("ms1", MS_CONFIGS, 'search="ms.com"', ("10.10.10.1",)),
+                ("node1", N1_CONFIGS, 'search="{0}"'.format(SIX_DOMAINS),
+                 ("10.10.10.101", "10.10.10.103")),
+                ("node2", N2_CONFIGS, None, ("10.10.10.201",))):
+            dns_path = self._create_dns_client(
+                config_path, props,
+                [("nameserver{0}".format(position), ipaddress, position)
+                 for position, ipaddress in enumerate(ipaddresses, 1)])
+            items[hostname] = self.sim.find(dns_path, "dns-client") + \
+                self.sim.find(dns_path, "nameserver")
+
+        self._assert_cli_ok(self.sim.create_plan())
+        self.sim.pause_after(task.format("node1"))
+        self._assert_cli_ok(self.sim.run_plan())
+        self.assertEqual("Stopped", self.sim.plan['state'])
+        self._assert_states(items["node1"], "Applied")
+        self._assert_states(items["node2"] + items["ms1"], "Initial")
+
+        self._assert_cli_ok(self.sim.create_plan())
+        self.assertEqual([("Create", "node2"), ("Create", "ms1")],
+                         get_dns_tasks(self.sim.show_plan()[0]))
+        self.sim.pause_after(task.format("node2"))
+        self._assert_cli_ok(self.sim.run_plan())
+        self.assertEqual("Stopped", self.sim.plan['state'])
+        self._assert_states(items["node1"] + items["node2"], "Applied")
+        self._assert_states(items["ms1"], "Initial")
+
+        self._run_plan()
+        self._assert_states(items["node1"] + items["node2"] + items["ms1"],
+                            "Applied")
+        self.assertEqual(["search ms.com", "nameserver 10.10.10.1"],
+                         self.sim.get_file_contents("ms1"))
+        self.assertEqual(["search a.com b.com c.com d.com e.com f.com",
+                          "nameserver 10.10.10.101",
+                          "nameserver 10.10.10.103"],
+                         self.sim.get_file_contents("node1"))
+        self.assertEqual(["nameserver 10.10.10.201"],
+                         self.sim.get_file_contents("node2"))
+
+    def test_stop_plan(self):
+        """
+        Description:
+            stop_plan is only accepted while a plan is running
+        """
+        _, stderr, rc = self.sim.stop_plan()
+        self.assertEqual((['InvalidRequestError    Plan not currently '
+                           'running'], 1), (stderr, rc))
+        self._create_dns_client(N1_CONFIGS, None,
+                                [("nameserver1", "10.10.10.1", 1)])
+        self._run_plan()
+        self.assertEqual(1, self.sim.stop_plan()[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
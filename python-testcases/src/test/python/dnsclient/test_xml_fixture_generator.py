@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+'''
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@summary:   Unit tests of xml_fixture_generator.py, with the generated
+            XML linted by DnsClientLinter
+'''
+
+import io
+import unittest
+
+from dns_client_linter import DnsClientLinter
+from xml_fixture_generator import DnsClientFixtures, write_configs_xml, \
+    write_dns_client_xml
+
+N1_PATH = "/deployments/d1/clusters/c1/nodes/n1"
+ONE_PER_NODE = ('ValidationError    Create plan failed: Only one '
+                '"dns-client" may be configured per node')
+
+
+class XmlFixtureGeneratorTest(unittest.TestCase):
+    """
+    The generated dns-client XML against DnsClientLinter.
+    """
+
+    @staticmethod
+    def _generate(write, fixtures, count):
+        """
+        Description:
+            Returns the XML written by a generator function
+        """
+        out = io.BytesIO()
+        write(out, fixtures, count)
+        return out.getvalue().decode("utf-8")
+
+    def test_dns_client_layout(self):
+        """
+        Description:
+            Every dns-client document passes the linter, for each address
+            type and the maximum number of search domains
+        """
+        fixtures = DnsClientFixtures(mix="ipv4=1,ipv6=1,cidr=1",
+                                     search_domains=6)
+        for index in range(1, 21):
+            linter = DnsClientLinter()
+            linter.add_xml(
+                "/deployments/d1/clusters/c1/nodes/n{0}/configs".format(
+                    index),
+                self._generate(write_dns_client_xml, fixtures, index))
+            self.assertEqual([], linter.lint())
+
+    def test_configs_layout(self):
+        """
+        Description:
+            The dns-clients of a config collection only break the one
+            dns-client per node rule, and have non-colliding ids
+        """
+        linter = DnsClientLinter()
+        linter.add_xml(N1_PATH, self._generate(
+            write_configs_xml, DnsClientFixtures(mix="cidr=1"), 3))
+        self.assertEqual(
+            [("{0}/configs/dnsgen_{1}".format(N1_PATH, index), ONE_PER_NODE)
+             for index in range(1, 4)],
+            linter.lint())
+
+        linter = DnsClientLinter()
+        linter.add_xml(N1_PATH, self._generate(
+            write_configs_xml, DnsClientFixtures(), 1))
+        self.assertEqual([], linter.lint())
+
+    def test_same_seed_same_xml(self):
+        """
+        Description:
+            The same options give the same XML
+        """
+        self.assertEqual(
+            self._generate(write_configs_xml,
+                           DnsClientFixtures(mix="ipv4=2,ipv6=1"), 10),
+            self._generate(write_configs_xml,
+                           DnsClientFixtures(mix="ipv4=2,ipv6=1"), 10))
+
+    def test_search_too_long(self):
+        """
+        Description:
+            A search longer than 256 characters is refused before
+            anything is written
+        """
+        fixtures = DnsClientFixtures(search_domains=6,
+                                     domain="{0}.com".format("a" * 31))
+        self.assertEqual(251, len(fixtures.get_search(9)))
+        out = io.BytesIO()
+        self.assertRaises(ValueError, write_configs_xml, out, fixtures, 10)
+        self.assertEqual(b"", out.getvalue())
+
+    def test_invalid_options(self):
+        """
+        Description:
+            The nameserver count, search domain count and mix are checked
+        """
+        self.assertRaises(ValueError, DnsClientFixtures, nameservers=4)
+        self.assertRaises(ValueError, DnsClientFixtures, search_domains=7)
+        self.assertRaises(ValueError, DnsClientFixtures, mix="ipv5=1")
+        self.assertRaises(ValueError, DnsClientFixtures, mix="ipv4=0")
+
+
+if __name__ == '__main__':
+    unittest.main()